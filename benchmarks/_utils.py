@@ -0,0 +1,21 @@
+"""
+Minimal timing helpers shared by the benchmark scripts in this directory.
+
+The scripts are meant to be run directly, e.g. ``python benchmarks/bench_bounds.py``,
+and print the mean time per call of each measured statement.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+
+
+def measure(fn: Callable[[], object], number: int = 100_000, repeat: int = 5) -> float:
+    """Return the best mean time per call in nanoseconds."""
+    timer = timeit.Timer(fn)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def report(label: str, nanoseconds: float) -> None:
+    print(f"{label:<60} {nanoseconds:>10.1f} ns")
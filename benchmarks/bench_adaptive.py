@@ -0,0 +1,54 @@
+"""
+Cost of rejecting values with an adaptive evaluation order.
+
+A regular expression declared first runs before a cheap length check that rejects
+90% of inputs. This compares evaluating the conjunction in declaration order against
+an adaptive predicate that learns to run the length check first.
+"""
+
+from __future__ import annotations
+
+import re
+
+from _utils import measure
+from _utils import report
+
+from phantom.predicates import boolean
+from phantom.predicates import collection
+from phantom.predicates import numeric
+from phantom.predicates import re as re_predicates
+from phantom.predicates.adaptive import adaptive
+
+pattern = re.compile(r"(?:[A-Z]{2}\d{2}-)*[A-Z]{4}")
+rule = boolean.both(
+    re_predicates.is_full_match(pattern), collection.count(numeric.le(32))
+)
+values = tuple(
+    "SE12-" * 100 + "ABCD" if index % 10 else "SE12-ABCD" for index in range(1000)
+)
+
+
+def run(check: object) -> None:
+    for value in values:
+        check(value)  # type: ignore[operator]
+
+
+def main() -> None:
+    adaptive_rule = adaptive(rule)
+    run(adaptive_rule)
+    report(
+        "declaration order, 1000 values", measure(lambda: run(rule), number=5, repeat=3)
+    )
+    report(
+        f"adaptive order, {adaptive_rule.order[0].__name__} first",
+        measure(lambda: run(adaptive_rule), number=5, repeat=3),
+    )
+    adaptive_rule.freeze()
+    report(
+        "adaptive order, frozen",
+        measure(lambda: run(adaptive_rule), number=5, repeat=3),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Cost per value of validating a column of values.
+
+Compares checking each value with isinstance(), which dispatches through PhantomMeta,
+against the bulk is_valid_many(), parse_many() and iter_parse() class methods. The
+reported time is the mean time per value of a column of 10,000 values.
+"""
+
+from __future__ import annotations
+
+from _utils import measure
+from _utils import report
+
+from phantom.interval import Natural
+from phantom.iso3166 import ParsedAlpha2
+from phantom.re import FullMatch
+
+size = 10_000
+
+
+class Digits(FullMatch, pattern=r"\d+"): ...
+
+
+def bench(type_: type, column: list[object]) -> None:
+    name = type_.__name__
+    report(
+        f"{name}: isinstance() per value",
+        measure(lambda: [isinstance(v, type_) for v in column], number=20) / size,
+    )
+    report(
+        f"{name}: is_valid_many()",
+        measure(lambda: type_.is_valid_many(column), number=20) / size,
+    )
+    report(
+        f"{name}: parse() per value",
+        measure(lambda: [type_.parse(v) for v in column], number=20) / size,
+    )
+    report(
+        f"{name}: parse_many()",
+        measure(lambda: type_.parse_many(column), number=20) / size,
+    )
+    report(
+        f"{name}: iter_parse()",
+        measure(lambda: list(type_.iter_parse(column)), number=20) / size,
+    )
+
+
+def main() -> None:
+    bench(Natural, list(range(size)))
+    bench(ParsedAlpha2, ["SE", "DK", "NO", "FI"] * (size // 4))
+    bench(Digits, [str(i) for i in range(size)])
+
+
+if __name__ == "__main__":
+    main()
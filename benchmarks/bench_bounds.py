@@ -0,0 +1,56 @@
+"""
+Per-check overhead of bound parsing.
+
+Compares building a bound parser on every check, which is what instance checks used to
+do, against the parser that is now built once when a phantom type is created, and
+compares checking plain-class bounds with typeguard against a bare isinstance check.
+"""
+
+from __future__ import annotations
+
+from _utils import measure
+from _utils import report
+
+from phantom import Phantom
+from phantom.bounds import _build_bound_parser
+from phantom.predicates.generic import of_complex_type
+from phantom.predicates.numeric import positive
+from phantom.sized import NonEmptyStr
+
+
+class Positive(int, Phantom, predicate=positive): ...
+
+
+def main() -> None:
+    value = 1
+
+    def rebuild_per_check() -> bool:
+        try:
+            _build_bound_parser(Positive.__bound__)(value)
+        except TypeError:
+            return False
+        return positive(value)
+
+    report("bound parser built per check (before)", measure(rebuild_per_check))
+    report(
+        "precompiled bound parser (after)", measure(lambda: isinstance(value, Positive))
+    )
+
+    text = "hello"
+    typeguard_str = of_complex_type(str)
+
+    def non_empty_str_typeguard() -> bool:
+        return typeguard_str(text) and NonEmptyStr.__predicate__(text)
+
+    report(
+        "NonEmptyStr, str bound checked by typeguard (before)",
+        measure(non_empty_str_typeguard),
+    )
+    report(
+        "NonEmptyStr, str bound checked by isinstance (after)",
+        measure(lambda: isinstance(text, NonEmptyStr)),
+    )
+
+
+if __name__ == "__main__":
+    main()
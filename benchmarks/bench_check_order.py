@@ -0,0 +1,43 @@
+"""
+Cost of rejecting an oversized tuple for a sized type with a parametrized bound.
+
+Compares checking every item against the bound before the size, which is what
+instance checks used to do, against checking the size first.
+"""
+
+from __future__ import annotations
+
+from _utils import measure
+from _utils import report
+
+from phantom.bounds import get_bound_parser
+from phantom.errors import BoundError
+from phantom.sized import PhantomBound
+
+
+class SmallInts(PhantomBound[int], bound=tuple[int, ...], max=100): ...
+
+
+def main() -> None:
+    value = tuple(range(200_000))
+    parse_bound = get_bound_parser(SmallInts.__bound__)
+
+    def bound_first() -> bool:
+        try:
+            parse_bound(value)
+        except BoundError:
+            return False
+        return SmallInts.__predicate__(value)
+
+    report(
+        "reject 200k items, items checked first (before)",
+        measure(bound_first, number=3, repeat=3),
+    )
+    report(
+        "reject 200k items, size checked first (after)",
+        measure(lambda: isinstance(value, SmallInts), number=10_000),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Cost of instance checks with compiled predicates.
+
+Phantom types compile their bound check and predicate into a single function when
+they are created. This compares the number of Python function calls and the time
+per check of the compiled function against evaluating the same predicate tree
+without compiling it.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+
+from _utils import measure
+from _utils import report
+
+from phantom import Phantom
+from phantom.bounds import get_bound_predicate
+from phantom.interval import Natural
+from phantom.predicates import boolean
+from phantom.predicates import interval
+from phantom.predicates import numeric
+from phantom.sized import PhantomBound
+
+
+class SmallTuple(PhantomBound[int], min=1, max=5): ...
+
+
+class Stacked(
+    int,
+    Phantom,
+    predicate=boolean.all_of(
+        [
+            numeric.positive,
+            boolean.negate(numeric.greater(1000)),
+            boolean.either(numeric.even, interval.inclusive(1, 10)),
+        ]
+    ),
+): ...
+
+
+def count_calls(check: Callable[[object], bool], value: object) -> int:
+    # Evaluate once first, so that calls populating caches aren't counted.
+    check(value)
+    calls = 0
+
+    def profile(frame: object, event: str, arg: object) -> None:
+        nonlocal calls
+        if event == "call":
+            calls += 1
+
+    sys.setprofile(profile)
+    try:
+        check(value)
+    finally:
+        sys.setprofile(None)
+    return calls
+
+
+def bench(type_: type[Phantom], value: object) -> None:
+    name = type_.__name__
+    uncompiled = boolean.both(
+        get_bound_predicate(type_.__bound__, type_.__collection_check__),
+        type_.__predicate__,
+    )
+    compiled = type_.__instance_predicate__
+    for label, check in (("uncompiled", uncompiled), ("compiled", compiled)):
+        calls = count_calls(check, value)
+        report(
+            f"{name}: {label} ({calls} Python calls)",
+            measure(lambda: check(value)),  # noqa: B023
+        )
+
+
+def main() -> None:
+    bench(Natural, 10)
+    bench(SmallTuple, (1, 2, 3))
+    bench(Stacked, 14)
+
+
+if __name__ == "__main__":
+    main()
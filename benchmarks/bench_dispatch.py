@@ -0,0 +1,56 @@
+"""
+Cost of dispatching isinstance() through PhantomMeta.
+
+Uses types whose own instance check always succeeds, so that the measured time is
+dominated by the metaclass. A metaclass that resolves the InstanceCheckable protocol on
+every check, which is what PhantomMeta used to do, is compared against PhantomMeta
+reading the flag resolved when the class is created.
+"""
+
+from __future__ import annotations
+
+import abc
+
+from _utils import measure
+from _utils import report
+
+from phantom import PhantomMeta
+from phantom._base import InstanceCheckable
+
+
+class ProtocolPerCheckMeta(abc.ABCMeta):
+    def __instancecheck__(self, instance: object) -> bool:
+        if not issubclass(self, InstanceCheckable):
+            return False
+        return self.__instancecheck__(instance)
+
+
+class AlwaysTrueBefore(metaclass=ProtocolPerCheckMeta):
+    @classmethod
+    def __instancecheck__(cls, instance: object) -> bool:
+        return True
+
+
+class AlwaysTrue(metaclass=PhantomMeta):
+    @classmethod
+    def __instancecheck__(cls, instance: object) -> bool:
+        return True
+
+
+def main() -> None:
+    value = 1
+    check = AlwaysTrue.__instancecheck__
+
+    report("direct call of __instancecheck__ (baseline)", measure(lambda: check(value)))
+    report(
+        "protocol resolved per dispatch (before)",
+        measure(lambda: isinstance(value, AlwaysTrueBefore)),
+    )
+    report(
+        "isinstance() through PhantomMeta (after)",
+        measure(lambda: isinstance(value, AlwaysTrue)),
+    )
+
+
+if __name__ == "__main__":
+    main()
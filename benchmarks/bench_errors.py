@@ -0,0 +1,51 @@
+"""
+Cost of rejecting values as the size of the rejected value grows.
+
+Errors are caught and discarded, as is common when filtering values. Formatting the
+full repr of the value, which is what parsers used to do, is compared against the
+lazily formatted messages that parsers raise now.
+"""
+
+from __future__ import annotations
+
+from _utils import measure
+from _utils import report
+
+from phantom.bounds import get_bound_parser
+from phantom.errors import BoundError
+
+
+def eager_parser(instance: object) -> int:
+    if not isinstance(instance, int):
+        raise BoundError(f"Value is not within bound of 'int': {instance!r}")
+    return instance
+
+
+def rejects(parser: object, value: object) -> bool:
+    try:
+        parser(value)  # type: ignore[operator]
+    except BoundError:
+        return True
+    return False
+
+
+def bench(size: int) -> None:
+    parser = get_bound_parser(int)
+    value = "a" * size
+    report(
+        f"{size:>9} chars: eager repr (before)",
+        measure(lambda: rejects(eager_parser, value), number=100),
+    )
+    report(
+        f"{size:>9} chars: lazy message (after)",
+        measure(lambda: rejects(parser, value), number=100),
+    )
+
+
+def main() -> None:
+    for size in (10, 10_000, 1_000_000):
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Cost of defining many phantom types with structurally equal predicates.
+
+Phantom types intern their check, and structurally equal checks share one compiled
+function. This measures defining a catalogue of types that each build the same
+predicates, against types whose predicates all differ and so can't be shared, and
+the memory retained by each catalogue.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+import tracemalloc
+
+from phantom import Phantom
+from phantom.predicates import boolean
+from phantom.predicates import collection
+from phantom.predicates import interval
+from phantom.predicates import numeric
+from phantom.predicates import re as re_predicates
+
+count = 500
+
+
+def define(shared: bool) -> tuple[float, float]:
+    types = []
+    tracemalloc.start()
+    start = time.perf_counter()
+    for index in range(count):
+        high = 100 if shared else 100 + index
+        predicate = boolean.all_of(
+            [
+                re_predicates.is_full_match(re.compile(r"[A-Z]{2}\d+")),
+                collection.count(interval.inclusive(0, high)),
+            ]
+        )
+        types.append(type(f"T{index}", (str, Phantom), {}, predicate=predicate))
+        types.append(
+            type(
+                f"N{index}",
+                (int, Phantom),
+                {},
+                predicate=numeric.ge(index * (not shared)),
+            )
+        )
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, retained
+
+
+def main() -> None:
+    for label, shared in (("distinct predicates", False), ("equal predicates", True)):
+        elapsed, retained = define(shared)
+        print(
+            f"{label:<20} define {2 * count} types {elapsed * 1e3:8.1f} ms"
+            f"   retained {retained / 1024:8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Cost of checking repeated values with a memoized predicate.
+
+Checks a stream of values that repeats a few thousand distinct values, as inbound
+traffic tends to, against an expensive regular expression with and without
+memoization, and against a cheap predicate to show the overhead of a cache hit.
+Then checks the same large tuple repeatedly against a phantom type with a
+``tuple[Decimal, ...]`` bound, with and without an identity cache.
+"""
+
+from __future__ import annotations
+
+import re
+from decimal import Decimal
+
+from _utils import measure
+from _utils import report
+
+from phantom import Phantom
+from phantom.predicates import boolean
+from phantom.predicates import numeric
+from phantom.predicates import re as re_predicates
+from phantom.predicates.memoize import memoize
+
+pattern = re.compile(r"(?:[A-Z]{2}\d{2}-)*[A-Z]{4}")
+expensive = re_predicates.is_full_match(pattern)
+distinct = tuple("SE12-" * 50 + f"{index:04}" for index in range(2000))
+values = distinct * 5
+numbers = tuple(range(2000)) * 5
+configuration = tuple(Decimal(index) for index in range(1000))
+
+
+class Prices(Phantom, bound=tuple[Decimal, ...], predicate=boolean.true): ...
+
+
+class CachedPrices(Prices, identity_cache=16): ...
+
+
+def run(check: object, column: tuple[object, ...]) -> None:
+    for value in column:
+        check(value)  # type: ignore[operator]
+
+
+def main() -> None:
+    memoized = memoize(expensive)
+    run(memoized, values)
+    report(
+        "regular expression, 10000 values",
+        measure(lambda: run(expensive, values), number=5, repeat=3),
+    )
+    report(
+        "memoized regular expression, 10000 values",
+        measure(lambda: run(memoized, values), number=5, repeat=3),
+    )
+    memoized_positive = memoize(numeric.positive)
+    run(memoized_positive, numbers)
+    report(
+        "positive, 10000 values",
+        measure(lambda: run(numeric.positive, numbers), number=5, repeat=3),
+    )
+    report(
+        "memoized positive, 10000 values",
+        measure(lambda: run(memoized_positive, numbers), number=5, repeat=3),
+    )
+    report(
+        "tuple of 1000 decimals",
+        measure(lambda: isinstance(configuration, Prices), number=1000, repeat=3),
+    )
+    report(
+        "tuple of 1000 decimals, identity cache",
+        measure(lambda: isinstance(configuration, CachedPrices), repeat=3),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+Cost of recording metrics of instance checks.
+
+Checks a small integer against a cheap phantom type before metrics are enabled,
+while they're enabled, and after they're disabled again.
+"""
+
+from __future__ import annotations
+
+from _utils import measure
+from _utils import report
+
+from phantom import metrics
+from phantom.interval import Natural
+
+
+def main() -> None:
+    report("metrics never enabled", measure(lambda: isinstance(1, Natural)))
+    metrics.enable()
+    report("metrics enabled", measure(lambda: isinstance(1, Natural)))
+    metrics.disable()
+    report("metrics disabled", measure(lambda: isinstance(1, Natural)))
+
+
+if __name__ == "__main__":
+    main()
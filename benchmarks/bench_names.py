@@ -0,0 +1,65 @@
+"""
+Import time and retained memory of predicate names.
+
+Predicates are named after the factory and arguments they're created with. Names
+used to contain the full repr of every argument, so that a predicate checking
+membership in a large allowlist held a string as large as the repr of the allowlist.
+Names now contain truncated reprs. This measures importing phantom.iso3166 and
+creating a predicate for an allowlist of 100k strings, in a fresh interpreter each,
+with full reprs (before) and with truncated reprs (after).
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+child = """
+import sys
+import time
+import tracemalloc
+
+start = time.perf_counter()
+import phantom.predicates._utils
+if sys.argv[1] == "full":
+    phantom.predicates._utils.truncated_repr = repr
+from phantom.predicates.collection import contained
+import phantom.iso3166
+imported = time.perf_counter() - start
+allowlist = frozenset(f"user-{index:06}" for index in range(100_000))
+tracemalloc.start()
+before, _ = tracemalloc.get_traced_memory()
+start = time.perf_counter()
+predicate = contained(allowlist)
+created = time.perf_counter() - start
+after, _ = tracemalloc.get_traced_memory()
+print(imported * 1e3, created * 1e3, (after - before) / 1024, len(predicate.__name__))
+"""
+
+
+def run(mode: str, repeat: int = 5) -> None:
+    results = []
+    for _ in range(repeat):
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", child, mode],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results.append(tuple(map(float, output.split())))
+    imported, created, retained, length = min(results)
+    print(
+        f"{mode:<10} import {imported:8.1f} ms"
+        f"   create {created:8.2f} ms"
+        f"   retained {retained:8.1f} KiB"
+        f"   name {int(length):>8} chars"
+    )
+
+
+def main() -> None:
+    run("full")
+    run("truncated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Scaling of parallel bulk validation with the number of worker processes.
+
+Validates a column of values with iter_parse() in the current process, and with
+phantom.parallel.validate() in pools of 1, 2, 4, ... workers, up to the number of
+CPUs, for a type that is cheap to check and one that is expensive to check. Pools are
+started and warmed up before they're measured. The reported time is the mean time
+per value, followed by the speedup relative to iter_parse().
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+from phantom.interval import Natural
+from phantom.parallel import validate
+
+size = 200_000
+
+
+def measure_once(fn: Callable[[], object], repeat: int = 3) -> float:
+    """Return the best mean time per value in nanoseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best / size * 1e9
+
+
+def report(label: str, nanoseconds: float, baseline: float) -> None:
+    print(f"{label:<50} {nanoseconds:>10.1f} ns {baseline / nanoseconds:>6.2f}x")
+
+
+def worker_counts() -> Iterable[int]:
+    count = 1
+    cpus = os.cpu_count() or 1
+    while count < cpus:
+        yield count
+        count *= 2
+    yield cpus
+
+
+def bench_pool(
+    type_: type, column: list[object], workers: int, baseline: float
+) -> None:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(validate(type_, column[:1000], executor=executor, workers=workers))
+        report(
+            f"{type_.__name__}: validate(), {workers} workers",
+            measure_once(
+                lambda: list(
+                    validate(type_, column, executor=executor, workers=workers)
+                )
+            ),
+            baseline,
+        )
+
+
+def bench(type_: type, column: list[object]) -> None:
+    baseline = measure_once(lambda: list(type_.iter_parse(column)))
+    report(f"{type_.__name__}: iter_parse()", baseline, baseline)
+    for workers in worker_counts():
+        bench_pool(type_, column, workers, baseline)
+
+
+def main() -> None:
+    print(f"{os.cpu_count()} CPUs")
+    bench(Natural, list(range(size)))
+    try:
+        from phantom.ext.phonenumbers import PhoneNumber
+    except ImportError:
+        return
+    bench(PhoneNumber, [f"+4670{index:07}" for index in range(size)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Cost of calling predicates created by predicate factories.
+
+Predicates carry a node describing how they were created, while staying plain
+functions. They are compared against an equivalent closure without a node, which is
+what factories used to return, and against a callable class with __slots__, which is
+the alternative representation of nodes that was rejected because of its call cost.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from _utils import measure
+from _utils import report
+
+from phantom.predicates import boolean
+from phantom.predicates import numeric
+
+
+def closure_greater(n: int) -> Callable[[int], bool]:
+    def check(value: int) -> bool:
+        return value > n
+
+    return check
+
+
+def closure_both(
+    p: Callable[[int], bool], q: Callable[[int], bool]
+) -> Callable[[int], bool]:
+    def check(value: int) -> bool:
+        return p(value) and q(value)
+
+    return check
+
+
+class Greater:
+    __slots__ = ("n",)
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+
+    def __call__(self, value: int) -> bool:
+        return value > self.n
+
+
+class Both:
+    __slots__ = ("p", "q")
+
+    def __init__(self, p: Callable[[int], bool], q: Callable[[int], bool]) -> None:
+        self.p = p
+        self.q = q
+
+    def __call__(self, value: int) -> bool:
+        return self.p(value) and self.q(value)
+
+
+def bench(
+    label: str, greater: Callable[[int], bool], both: Callable[[int], bool]
+) -> None:
+    value = 5
+    report(f"greater(0): {label}", measure(lambda: greater(value)))
+    report(f"both(...): {label}", measure(lambda: both(value)))
+
+
+def main() -> None:
+    bench(
+        "closure without node (before)",
+        closure_greater(0),
+        closure_both(closure_greater(0), closure_greater(1)),
+    )
+    bench(
+        "function with node (after)",
+        numeric.greater(0),
+        boolean.both(numeric.greater(0), numeric.greater(1)),
+    )
+    bench(
+        "callable class with __slots__",
+        Greater(0),
+        Both(Greater(0), Greater(1)),
+    )
+
+
+if __name__ == "__main__":
+    main()
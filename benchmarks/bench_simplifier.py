@@ -0,0 +1,53 @@
+"""
+Cost of instance checks with simplified predicate trees.
+
+Types generated by stacking combinators end up with deep trees of nested
+conjunctions, duplicate operands and separate lower and upper bounds. Phantom types
+simplify their predicate tree before compiling it. This compares checks against the
+tree as written, simplified, and simplified and compiled.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from _utils import measure
+from _utils import report
+
+from phantom.predicates import Predicate
+from phantom.predicates import boolean
+from phantom.predicates import compile_predicate
+from phantom.predicates import generic
+from phantom.predicates import numeric
+from phantom.predicates import simplify_predicate
+
+
+def stacked() -> Predicate[object]:
+    predicate: Predicate[object] = generic.of_type(int)
+    for layer in (
+        numeric.ge(0),
+        boolean.true,
+        numeric.le(100),
+        boolean.negate(boolean.negate(numeric.even)),
+        numeric.ge(0),
+        boolean.either(boolean.false, numeric.less(1000)),
+    ):
+        predicate = boolean.both(predicate, layer)
+    return predicate
+
+
+def bench(label: str, check: Callable[[object], bool], value: object) -> None:
+    report(f"{label}: {check.__name__}", measure(lambda: check(value)))
+
+
+def main() -> None:
+    predicate = stacked()
+    simplified = simplify_predicate(predicate)
+    bench("as written", predicate, 42)
+    bench("simplified", simplified, 42)
+    bench("as written, compiled", compile_predicate(predicate), 42)
+    bench("simplified, compiled", compile_predicate(simplified), 42)
+
+
+if __name__ == "__main__":
+    main()
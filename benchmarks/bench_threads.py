@@ -0,0 +1,78 @@
+"""
+Scaling of instance checks with the number of threads.
+
+Each of 1, 2, 4, ... threads, up to the number of CPUs, checks its own column of
+values against a phantom type with isinstance(), starting at the same time. The work
+per thread is fixed, so on a free-threaded build, where checks scale linearly, the
+wall time stays constant as threads are added. The reported time is the mean wall
+time per check of one thread, followed by the aggregate throughput relative to a
+single thread. Types are checked both through a plain isinstance() bound check and
+through a bound check that's cached by type.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterable
+
+from phantom.interval import Inclusive
+from phantom.interval import Natural
+
+size = 200_000
+
+
+class Score(Inclusive, low=0, high=100): ...
+
+
+def worker_counts() -> Iterable[int]:
+    count = 1
+    cpus = os.cpu_count() or 1
+    while count < cpus:
+        yield count
+        count *= 2
+    yield cpus
+
+
+def run(type_: type, threads: int) -> float:
+    columns = [list(range(size)) for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def check(column: list[int]) -> None:
+        barrier.wait()
+        for value in column:
+            isinstance(value, type_)
+
+    workers = [threading.Thread(target=check, args=(column,)) for column in columns]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def bench(type_: type) -> None:
+    baseline: float | None = None
+    for threads in worker_counts():
+        elapsed = min(run(type_, threads) for _ in range(3))
+        baseline = elapsed if baseline is None else baseline
+        print(
+            f"{type_.__name__}: {threads} threads".ljust(50),
+            f"{elapsed / size * 1e9:>10.1f} ns",
+            f"{threads * baseline / elapsed:>6.2f}x",
+        )
+
+
+def main() -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{os.cpu_count()} CPUs, GIL {'enabled' if gil else 'disabled'}")
+    bench(Natural)
+    bench(Score)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Cost of the structural part of checking NonEmpty over tuples.
+
+Compares checking the SizedIterable bound and mutability of a value on every call
+against consulting the verdicts cached per runtime type.
+"""
+
+from __future__ import annotations
+
+from _utils import measure
+from _utils import report
+
+from phantom._utils.misc import is_not_known_mutable_instance
+from phantom.bounds import get_bound_predicate
+from phantom.predicates.generic import of_complex_type
+from phantom.sized import NonEmpty
+from phantom.sized import SizedIterable
+
+
+def main() -> None:
+    value = (1, 2, 3)
+    within_bound = of_complex_type(SizedIterable)
+    within_cached_bound = get_bound_predicate(NonEmpty.__bound__)
+    is_not_known_mutable = is_not_known_mutable_instance.__wrapped__  # type: ignore[attr-defined]
+
+    report(
+        "bound and mutability checked per call (before)",
+        measure(
+            lambda: within_bound(value) and is_not_known_mutable(value),
+            number=1_000,
+        ),
+    )
+    report(
+        "bound and mutability cached by type (after)",
+        measure(
+            lambda: within_cached_bound(value) and is_not_known_mutable_instance(value)
+        ),
+    )
+    report(
+        "isinstance(value, NonEmpty) (after)",
+        measure(lambda: isinstance(value, NonEmpty)),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Cost of instance checks in each validation mode.
+
+Checks a small integer against a cheap phantom type, and a tuple of 100 decimals
+against a type with a ``tuple[Decimal, ...]`` bound, in strict mode before any other
+mode is configured, and then in each mode once modes are engaged.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from _utils import measure
+from _utils import report
+
+from phantom import Phantom
+from phantom.interval import Natural
+from phantom.predicates import boolean
+from phantom.validation import validation
+
+
+class Prices(Phantom, bound=tuple[Decimal, ...], predicate=boolean.true): ...
+
+
+prices = tuple(Decimal(index) for index in range(100))
+
+
+def bench(label: str) -> None:
+    report(f"Natural, {label}", measure(lambda: isinstance(1, Natural)))
+    report(
+        f"Prices, {label}",
+        measure(lambda: isinstance(prices, Prices), number=10_000),
+    )
+
+
+def main() -> None:
+    bench("strict, modes not engaged")
+    for mode in ("strict", "sampled", "trusted"):
+        with validation(mode):  # type: ignore[arg-type]
+            bench(f"{mode}, modes engaged")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,27 +4,48 @@ import abc
 from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import Iterator
+from collections.abc import MutableSequence
+from itertools import islice
 from typing import Any
 from typing import ClassVar
+from typing import Final
 from typing import Generic
+from typing import Literal
 from typing import Protocol
+from typing import TypeAlias
 from typing import TypeVar
+from typing import cast
 from typing import runtime_checkable
 
 from typing_extensions import Self
 
 from . import _hypothesis
+from . import metrics as _metrics
+from . import validation as _validation
+from ._utils import registry
 from ._utils.misc import BoundType
 from ._utils.misc import UnresolvedClassAttribute
 from ._utils.misc import fully_qualified_name
 from ._utils.misc import is_not_known_mutable_type
 from ._utils.misc import is_subtype
 from ._utils.misc import resolve_class_attr
-from .bounds import Parser
-from .bounds import get_bound_parser
+from .bounds import get_bound_predicate
+from .bounds import get_default_collection_check
+from .bounds import runtime_bound
 from .errors import BoundError
+from .errors import LazyMessage
+from .errors import ParseFailure
 from .predicates import Predicate
+from .predicates import compile_predicate
+from .predicates import intern_predicate
+from .predicates import simplify_predicate
+from .predicates.boolean import both
+from .predicates.generic import CollectionCheck
+from .predicates.memoize import MemoizedPredicate
+from .predicates.memoize import memoize
+from .predicates.memoize import memoize_by_identity
 from .schema import SchemaField
+from .validation import Mode
 
 
 @runtime_checkable
@@ -49,10 +70,33 @@ class PhantomMeta(abc.ABCMeta):
     instance creation.
     """
 
+    # Whether the class implements InstanceCheckable. This is resolved once when the
+    # class is created, as checking a runtime protocol is too costly to do on every
+    # instance check.
+    __instance_checkable__: bool
+    # The class' own instance check, bound once when the class is created, as binding
+    # a classmethod allocates a method object on every access. None if the class
+    # doesn't implement InstanceCheckable.
+    __instance_check__: Callable[[object], bool] | None
+
+    def __init__(
+        cls,
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(name, bases, namespace, **kwargs)
+        cls.__instance_checkable__ = issubclass(cls, InstanceCheckable)
+        cls.__instance_check__ = (
+            cls.__instancecheck__ if cls.__instance_checkable__ else None
+        )
+
     def __instancecheck__(self, instance: object) -> bool:
-        if not issubclass(self, InstanceCheckable):
+        check = self.__instance_check__
+        if check is None:
             return False
-        return self.__instancecheck__(instance)
+        return check(instance)
 
     def __call__(cls: type[V], instance: object) -> V:
         return cls.parse(instance)
@@ -63,6 +107,7 @@ U = TypeVar("U")
 
 
 Derived = TypeVar("Derived", bound="PhantomBase")
+OnError: TypeAlias = Literal["raise", "skip", "collect"]
 
 
 class PhantomBase(SchemaField, metaclass=PhantomMeta):
@@ -75,10 +120,103 @@ class PhantomBase(SchemaField, metaclass=PhantomMeta):
         """
         if not isinstance(instance, cls):
             raise TypeError(
-                f"Could not parse {fully_qualified_name(cls)} from {instance!r}"
+                LazyMessage(
+                    f"Could not parse {fully_qualified_name(cls)} from {{}}", instance
+                )
             )
         return instance
 
+    @classmethod
+    def assume(cls: type[Derived], instance: object) -> Derived:
+        """
+        Type a value as a phantom type without checking it, for values that the
+        calling code guarantees to be instances, e.g. the sum of two
+        :py:class:`~phantom.interval.Natural` values. Whether assumed values are
+        verified, eagerly or in the background, is configured with
+        :py:func:`phantom.validation.set_assumption_verification`, and by default
+        they aren't.
+
+        :raises phantom.errors.AssumptionError: for invalid values, when assumptions
+            are verified eagerly.
+        """
+        verify = _validation._verify_assumption
+        if verify is not None:
+            verify(cls, instance)
+        return cast(Derived, instance)
+
+    @classmethod
+    def try_parse(
+        cls: type[Derived],
+        instance: object,
+        default: U | None = None,
+    ) -> Derived | U | None:
+        """
+        Parse an arbitrary value into a phantom type, returning ``default`` instead of
+        raising an error if the value can't be parsed. Types that parse values by
+        checking that they are instances do so without constructing any exception.
+        """
+        if _parses_by_instance_check(cls):
+            return instance if isinstance(instance, cls) else default
+        try:
+            return cls.parse(instance)
+        except AbstractInstanceCheck:
+            raise
+        except (TypeError, ValueError):
+            return default
+
+    @classmethod
+    def parse_many(cls: type[Derived], instances: Iterable[object]) -> list[Derived]:
+        """
+        Parse every value of an iterable into a phantom type.
+
+        :raises TypeError:
+        """
+        parse = cls.parse
+        return [parse(instance) for instance in instances]
+
+    @classmethod
+    def is_valid_many(cls, instances: Iterable[object]) -> bytearray:
+        """
+        Check every value of an iterable against a phantom type. The result holds a 1
+        for each value that is an instance of the type, and a 0 for each value that
+        isn't.
+        """
+        return bytearray(map(bool, map(cls.__instancecheck__, instances)))
+
+    @classmethod
+    def iter_parse(
+        cls: type[Derived],
+        instances: Iterable[object],
+        on_error: OnError = "raise",
+        errors: MutableSequence[ParseFailure] | None = None,
+        chunksize: int = 1024,
+    ) -> Iterator[Derived]:
+        """
+        Lazily parse the values of an iterable into a phantom type. Values are
+        consumed and checked in chunks of ``chunksize``, so at most one chunk of the
+        iterable is held in memory at a time.
+
+        ``on_error`` determines what happens to values that can't be parsed:
+
+        * ``"raise"`` - raise the error of the first such value, after all values
+          before it have been yielded.
+        * ``"skip"`` - leave out the value.
+        * ``"collect"`` - leave out the value, and append a
+          :py:class:`phantom.errors.ParseFailure` with its index and the reason it
+          was rejected to ``errors``. Use e.g. a :py:class:`collections.deque` with
+          ``maxlen`` set to bound the number of kept failures.
+
+        :raises TypeError:
+        :raises ValueError: for an invalid combination of arguments.
+        """
+        if on_error not in ("raise", "skip", "collect"):
+            raise ValueError(f"Invalid error policy: {on_error!r}")
+        if on_error == "collect" and errors is None:
+            raise ValueError("An errors sink is required to collect errors")
+        if chunksize < 1:
+            raise ValueError("Chunk size must be at least 1")
+        return _iter_parse(cls, iter(instances), on_error, errors, chunksize)
+
     @classmethod
     @abc.abstractmethod
     def __instancecheck__(cls, instance: object) -> bool: ...
@@ -89,12 +227,92 @@ class PhantomBase(SchemaField, metaclass=PhantomMeta):
         yield cls.parse
 
 
+def _parses_by_instance_check(cls: type[PhantomBase]) -> bool:
+    return cls.parse.__func__ is PhantomBase.parse.__func__  # type: ignore[attr-defined]
+
+
+_skipped: Final = object()
+
+
+def _iter_parse(
+    cls: type[Derived],
+    iterator: Iterator[object],
+    on_error: OnError,
+    errors: MutableSequence[ParseFailure] | None,
+    chunksize: int,
+) -> Iterator[Derived]:
+    # Types that parse values by checking that they are instances can check whole
+    # chunks in bulk, and only have to parse the values that fail, to find the
+    # reason they fail. Other types attempt to parse whole chunks in bulk, and
+    # fall back to parsing one value at a time for chunks with failing values.
+    check_in_bulk = _parses_by_instance_check(cls)
+    offset = 0
+    while chunk := list(islice(iterator, chunksize)):
+        if check_in_bulk:
+            valid = cls.is_valid_many(chunk)
+            if 0 not in valid:
+                yield from cast("list[Derived]", chunk)
+            else:
+                yield from _parse_each(cls, chunk, offset, valid, on_error, errors)
+        else:
+            try:
+                parsed = cls.parse_many(chunk)
+            except (TypeError, ValueError):
+                yield from _parse_each(cls, chunk, offset, None, on_error, errors)
+            else:
+                yield from parsed
+        offset += len(chunk)
+
+
+def _parse_each(
+    cls: type[Derived],
+    chunk: list[object],
+    offset: int,
+    valid: bytearray | None,
+    on_error: OnError,
+    errors: MutableSequence[ParseFailure] | None,
+) -> Iterator[Derived]:
+    for index, instance in enumerate(chunk):
+        if valid is not None and valid[index]:
+            yield cast("Derived", instance)
+            continue
+        if on_error == "skip":
+            if valid is None:
+                parsed = cls.try_parse(instance, _skipped)
+                if parsed is not _skipped:
+                    yield cast("Derived", parsed)
+            continue
+        try:
+            parsed = cls.parse(instance)
+        except (TypeError, ValueError) as error:
+            if on_error == "raise":
+                raise
+            if errors is not None:
+                errors.append(ParseFailure(offset + index, str(error) or repr(error)))
+            continue
+        yield parsed
+
+
 class AbstractInstanceCheck(TypeError): ...
 
 
 class MutableType(TypeError): ...
 
 
+def _check_concrete(cls: type[Phantom]) -> None:
+    if cls.__abstract__:
+        raise AbstractInstanceCheck(
+            "Abstract phantom types cannot be used in instance checks"
+        )
+
+
+def _has_plain_check(cls: type[Phantom]) -> bool:
+    # Batch methods that phantom types specialize by inlining their predicate are
+    # only equivalent to checks while checks evaluate __instance_predicate__ as is,
+    # i.e. while no validation mode applies and no metrics are recorded.
+    return cls.__validation_predicate__ is cls.__instance_predicate__
+
+
 class Phantom(PhantomBase, Generic[T]):
     """
     Base class for predicate-based phantom types.
@@ -112,6 +330,43 @@ class Phantom(PhantomBase, Generic[T]):
       abstract.
     * ``abstract: bool`` - Set to ``True`` to create an abstract phantom type. This
       allows deferring definitions of ``predicate`` and ``bound`` to concrete subtypes.
+    * ``predicate_first: bool`` - Set to ``True`` to evaluate the predicate before
+      fully checking values against the bound. Values are then only checked against
+      the runtime type of the bound, e.g. ``tuple`` for ``tuple[int, ...]``, before
+      being passed to the predicate, so this should only be used for cheap predicates
+      that can handle such values. This allows rejecting values that fail e.g. a size
+      constraint without first checking every item against the bound. Inherited from
+      super phantom types if not provided.
+    * ``collection_check: CollectionCheck | None`` - Determines which items of
+      collections are checked against parametrized bounds, e.g. ``tuple[int, ...]``.
+      One of :py:attr:`typeguard.CollectionCheckStrategy.ALL_ITEMS`,
+      :py:attr:`typeguard.CollectionCheckStrategy.FIRST_ITEM` or
+      :py:class:`phantom.predicates.generic.SampleItems`. Checking fewer items can
+      drastically reduce the cost of checking large collections, but should only be
+      used for values from trusted sources. Inherited from super phantom types if not
+      provided, and otherwise defaults to
+      :py:func:`phantom.bounds.get_default_collection_check`. The resolved strategy is
+      available as ``__collection_check__``.
+    * ``cache: int | None`` - Set to remember the verdicts of the predicate for at
+      most this many recently checked hashable values, with
+      :py:func:`phantom.predicates.memoize.memoize`. This can spare recomputing
+      expensive predicates for values that are checked repeatedly, and should only be
+      used when verdicts depend on nothing but what values compare equal to. Values
+      are still checked against the bound every time. The statistics of the cache
+      are available from ``__memoized_predicate__.cache_info()``. Inherited from
+      super phantom types if not provided, and ``0`` disables caching.
+    * ``identity_cache: int | None`` - Set to remember the verdicts of instance checks
+      for at most this many recently checked objects, with
+      :py:func:`phantom.predicates.memoize.memoize_by_identity`. This makes checking
+      the same large immutable value again, e.g. against a bound such as
+      ``tuple[Decimal, ...]``, take constant time, and should only be used when
+      checked objects, including the items of collections, aren't mutated. Checked
+      before ``cache`` when both are given. Inherited from super phantom types if
+      not provided, and ``0`` disables caching.
+    * ``validation: Mode | None`` - Fix the validation mode of the type to one of
+      ``"strict"``, ``"sampled"`` or ``"trusted"``, regardless of the mode in
+      effect, see :py:mod:`phantom.validation`. Inherited from super phantom types if
+      not provided.
     """
 
     __predicate__: Predicate[T]
@@ -124,23 +379,65 @@ class Phantom(PhantomBase, Generic[T]):
     # of the super class.
     __bound__: ClassVar[type]
     __abstract__: ClassVar[bool]
+    __predicate_first__: ClassVar[bool] = False
+    __collection_check__: ClassVar[CollectionCheck]
+    # The complete instance check of a concrete type, combining its bound and
+    # predicate in the order given by __predicate_first__.
+    __instance_predicate__: ClassVar[Predicate[object]]
+    # The maximum number of verdicts of __instance_predicate__ to remember, or None
+    # or 0 to not remember verdicts.
+    __cache_size__: ClassVar[int | None] = None
+    # The memoized __predicate__ that __instance_predicate__ evaluates, if the type
+    # remembers verdicts.
+    __memoized_predicate__: ClassVar[MemoizedPredicate[Any] | None] = None
+    # The maximum number of checked objects to remember the verdicts of, or None or
+    # 0 to not remember verdicts by identity.
+    __identity_cache_size__: ClassVar[int | None] = None
+    # The validation mode that the type fixes, or None to use the mode in effect.
+    __validation__: ClassVar[Mode | None] = None
+    # The predicate that checks evaluate, which applies the validation mode to
+    # __instance_predicate__, and records metrics. This is __instance_predicate__
+    # itself until a mode other than strict is configured or metrics are enabled, so
+    # that plain strict checks cost nothing extra.
+    __validation_predicate__: ClassVar[Predicate[object]]
 
     def __init_subclass__(
         cls,
         predicate: Predicate[T] | None = None,
         bound: type[T] | None = None,
         abstract: bool = False,
+        predicate_first: bool | None = None,
+        collection_check: CollectionCheck | None = None,
+        cache: int | None = None,
+        identity_cache: int | None = None,
+        validation: Mode | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init_subclass__(**kwargs)
         resolve_class_attr(cls, "__abstract__", abstract)
         resolve_class_attr(cls, "__predicate__", predicate)
+        resolve_class_attr(cls, "__predicate_first__", predicate_first, required=False)
+        resolve_class_attr(cls, "__cache_size__", cache, required=False)
+        resolve_class_attr(
+            cls, "__identity_cache_size__", identity_cache, required=False
+        )
+        if validation is not None:
+            _validation._check_mode(validation)
+        resolve_class_attr(cls, "__validation__", validation, required=False)
+        if collection_check is not None:
+            cls.__collection_check__ = collection_check
+        elif getattr(cls, "__collection_check__", None) is None:
+            cls.__collection_check__ = get_default_collection_check()
         cls._resolve_bound(bound)
+        if not cls.__abstract__:
+            cls.__instance_predicate__ = cls._compile_instance_predicate()
+            registry.register(cls)
+            cls._build_check()
 
         if _hypothesis.register_type_strategy is not None and not cls.__abstract__:
             strategy = cls.__register_strategy__()
             if strategy is not None:
-                _hypothesis.register_type_strategy(cls, strategy)
+                _hypothesis.register(cls, strategy)
 
     @classmethod
     def _interpret_implicit_bound(cls) -> BoundType:
@@ -188,18 +485,90 @@ class Phantom(PhantomBase, Generic[T]):
 
         cls.__bound__ = bound
 
+    @classmethod
+    def _compile_instance_predicate(cls) -> Predicate[object]:
+        # The bound check guarantees that values passed to the predicate are of the
+        # type that it accepts.
+        predicate = cast(Predicate[object], cls.__predicate__)
+        # Only the predicate is memoized, as values that compare equal, such as (1,)
+        # and (1.0,), can differ in whether they're within the bound.
+        cls.__memoized_predicate__ = (
+            memoize(predicate, maxsize=cls.__cache_size__)
+            if cls.__cache_size__
+            else None
+        )
+        if cls.__memoized_predicate__ is not None:
+            predicate = cls.__memoized_predicate__
+        within_bound = get_bound_predicate(cls.__bound__, cls.__collection_check__)
+        erased = runtime_bound(cls.__bound__) if cls.__predicate_first__ else None
+        if erased is None or erased == cls.__bound__:
+            check = both(within_bound, predicate)
+        else:
+            check = both(both(get_bound_predicate(erased), predicate), within_bound)
+        compiled = compile_predicate(intern_predicate(simplify_predicate(check)))
+        if cls.__identity_cache_size__:
+            compiled = memoize_by_identity(
+                compiled, maxsize=cls.__identity_cache_size__
+            )
+        return compiled
+
+    @classmethod
+    def _build_check(cls) -> None:
+        erased = runtime_bound(cls.__bound__)
+        trusted = get_bound_predicate(cls.__bound__ if erased is None else erased)
+        check = _validation._moderate(
+            cls.__instance_predicate__, trusted, cls.__validation__
+        )
+        cls.__validation_predicate__ = _metrics._instrument(cls, check)
+
     @classmethod
     def __instancecheck__(cls, instance: object) -> bool:
-        if cls.__abstract__:
-            raise AbstractInstanceCheck(
-                "Abstract phantom types cannot be used in instance checks"
+        _check_concrete(cls)
+        return cls.__validation_predicate__(instance)
+
+    @classmethod
+    def is_valid_many(cls, instances: Iterable[object]) -> bytearray:
+        _check_concrete(cls)
+        return bytearray(map(bool, map(cls.__validation_predicate__, instances)))
+
+    @classmethod
+    def try_parse(
+        cls,
+        instance: object,
+        default: U | None = None,
+    ) -> Self | U | None:
+        if not _parses_by_instance_check(cls):
+            return super().try_parse(instance, default)
+        return cls._try_parse_checked(instance, default)
+
+    @classmethod
+    def _try_parse_checked(cls, instance: object, default: U | None) -> Self | U | None:
+        _check_concrete(cls)
+        return (
+            cast(Self, instance) if cls.__validation_predicate__(instance) else default
+        )
+
+    @classmethod
+    def parse_many(cls, instances: Iterable[object]) -> list[Self]:
+        # Types that customize parsing, e.g. by coercing values, must be parsed one
+        # value at a time unless they provide their own implementation.
+        if not _parses_by_instance_check(cls):
+            return super().parse_many(instances)
+        return cls._parse_many_checked(list(instances))
+
+    @classmethod
+    def _parse_many_checked(cls, values: list[object]) -> list[Self]:
+        # Checks all values in bulk, only formatting an error for the first value
+        # that is found not to be an instance.
+        valid = cls.is_valid_many(values)
+        if 0 in valid:
+            raise TypeError(
+                LazyMessage(
+                    f"Could not parse {fully_qualified_name(cls)} from {{}}",
+                    values[valid.index(0)],
+                )
             )
-        bound_parser: Parser[T] = get_bound_parser(cls.__bound__)
-        try:
-            instance = bound_parser(instance)
-        except BoundError:
-            return False
-        return cls.__predicate__(instance)
+        return cast("list[Self]", values)
 
     @classmethod
     def __register_strategy__(cls) -> _hypothesis.HypothesisStrategy | None:
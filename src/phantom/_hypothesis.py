@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable
 from typing import TYPE_CHECKING
+from typing import Final
 from typing import TypeAlias
 from typing import TypeVar
 
@@ -11,7 +13,12 @@ else:
     SearchStrategy = None
 
 
-__all__ = ("HypothesisStrategy", "register_type_strategy", "SearchStrategy")
+__all__ = (
+    "HypothesisStrategy",
+    "register",
+    "register_type_strategy",
+    "SearchStrategy",
+)
 
 T = TypeVar("T")
 HypothesisStrategy: TypeAlias = (
@@ -24,3 +31,16 @@ try:
     from hypothesis.strategies import register_type_strategy  # type: ignore[assignment]
 except ImportError:
     register_type_strategy = None
+
+
+# Registering a strategy updates global state of hypothesis, and temporarily replaces
+# the global filters of the warnings module, so phantom types that are created
+# concurrently by multiple threads register their strategies one at a time.
+_registration_lock: Final = threading.Lock()
+
+
+def register(cls: type, strategy: HypothesisStrategy) -> None:
+    if register_type_strategy is None:
+        return
+    with _registration_lock:
+        register_type_strategy(cls, strategy)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import weakref
+from abc import get_cache_token
+from collections.abc import Callable
+from typing import Final
+
+default_maxsize: Final = 256
+# Py_TPFLAGS_HEAPTYPE, set for types that are allocated dynamically, e.g. by class
+# statements, as opposed to the static types of builtins and extension modules.
+_heap_type_flag: Final = 1 << 9
+
+
+def cache_by_type(
+    check: Callable[[object], bool],
+    maxsize: int = default_maxsize,
+) -> Callable[[object], bool]:
+    """
+    Wrap a check whose verdict depends only on the runtime type of its argument, so
+    that it's evaluated at most once per type. At most ``maxsize`` verdicts are held,
+    evicting the oldest first. Types are referenced weakly, so that caching a verdict
+    never keeps a dynamically created class alive. Verdicts are recomputed after
+    classes are registered as virtual subclasses of an ABC, as that may change them.
+
+    The wrapped check is safe to call from multiple threads, including on free-threaded
+    builds. Lookups don't lock, and every update is a single dict operation, so
+    threads that race to cache the verdict of the same type at worst evaluate the
+    check more than once.
+    """
+    # Static types live as long as the interpreter, so their verdicts are keyed by the
+    # type itself, which makes looking them up allocation free. Verdicts of other
+    # types are keyed by the id of the type, paired with a weak reference that
+    # removes the entry when the type is garbage collected. This avoids creating a
+    # weak reference on every lookup, as a WeakKeyDictionary would.
+    # Entries also hold the ABC cache token that was current when their verdict was
+    # computed, which abc.ABCMeta.register() increments.
+    verdicts: dict[type | int, tuple[weakref.ref[type] | None, bool, object]] = {}
+
+    def forget(key: int, ref: weakref.ref[type]) -> None:
+        entry = verdicts.get(key)
+        # The entry might have been evicted and replaced by a new type with the same
+        # id, in which case it must be left in place.
+        if entry is not None and entry[0] is ref:
+            verdicts.pop(key, None)
+
+    def evict(key: type | int) -> None:
+        if len(verdicts) >= maxsize and key not in verdicts:
+            # Other threads might evict the same entry, or change the dict while its
+            # oldest key is read.
+            with contextlib.suppress(StopIteration, RuntimeError):
+                verdicts.pop(next(iter(verdicts)), None)
+
+    def cached(value: object) -> bool:
+        type_ = type(value)
+        token = get_cache_token()
+        entry = verdicts.get(type_)
+        if entry is not None and entry[2] == token:
+            return entry[1]
+        if not type_.__flags__ & _heap_type_flag:
+            verdict = check(value)
+            evict(type_)
+            verdicts[type_] = (None, verdict, token)
+            return verdict
+        key = id(type_)
+        entry = verdicts.get(key)
+        if entry is not None and entry[2] == token:
+            return entry[1]
+        verdict = check(value)
+        evict(key)
+        verdicts[key] = (
+            weakref.ref(type_, functools.partial(forget, key)),
+            verdict,
+            token,
+        )
+        return verdict
+
+    # The wrapped check's attributes aren't copied, as a node describing it would not
+    # account for the cache.
+    return functools.update_wrapper(cached, check, updated=())
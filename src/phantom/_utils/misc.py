@@ -16,6 +16,8 @@ from typing import Union
 from typing import get_args
 from typing import get_origin
 
+from .cache import cache_by_type
+
 
 class UnresolvedClassAttribute(NotImplementedError): ...
 
@@ -47,6 +49,19 @@ def _is_intersection(type_: BoundType) -> bool:
     return isinstance(type_, tuple)
 
 
+def _issubclass(a: type, b: type) -> bool:
+    """
+    Like :py:func:`issubclass`, but a parametrized generic ``a`` is compared by its
+    runtime origin, such that e.g. ``tuple[int, ...]`` is a subclass of
+    ``collections.abc.Sequence``. A parametrized generic ``b`` is only considered a
+    supertype of itself.
+    """
+    if get_origin(b) is not None:
+        return a == b
+    origin = get_origin(a)
+    return issubclass(a if origin is None else origin, b)
+
+
 def is_subtype(a: BoundType, b: BoundType) -> bool:  # noqa: C901
     """
     Return True if ``a`` is a subtype of ``b``. Supports single-level typing.Unions
@@ -64,12 +79,15 @@ def is_subtype(a: BoundType, b: BoundType) -> bool:  # noqa: C901
     7. Union, Intersection: Always fails (except when a is a single-type union see 4).
     8. Intersection, Intersection: Success if all items in b have a subclass in a.
     9. T, T: Success if a is a subclass of b.
+
+    Parametrized generics are compared by their runtime origin, see
+    :py:func:`_issubclass`.
     """
 
     if _is_union(a) and _is_union(b):
         for a_part in get_args(a):
             for b_part in get_args(b):
-                if issubclass(a_part, b_part):
+                if _issubclass(a_part, b_part):
                     break
             else:
                 return False
@@ -77,7 +95,7 @@ def is_subtype(a: BoundType, b: BoundType) -> bool:  # noqa: C901
     elif _is_intersection(a) and _is_union(b):
         assert isinstance(a, tuple)
         for a_part, b_part in product(a, get_args(b)):
-            if issubclass(a_part, b_part):
+            if _issubclass(a_part, b_part):
                 return True
         return False
     elif _is_intersection(a) and _is_intersection(b):
@@ -85,7 +103,7 @@ def is_subtype(a: BoundType, b: BoundType) -> bool:  # noqa: C901
         assert isinstance(b, tuple)
         for b_part in b:
             for a_part in a:
-                if issubclass(a_part, b_part):
+                if _issubclass(a_part, b_part):
                     break
             else:
                 return False
@@ -93,17 +111,19 @@ def is_subtype(a: BoundType, b: BoundType) -> bool:  # noqa: C901
     elif _is_union(a):
         return False
     elif _is_union(b):
-        assert isinstance(a, type)
-        return any(issubclass(a, b_part) for b_part in get_args(b))
+        assert not isinstance(a, tuple)
+        return any(_issubclass(a, b_part) for b_part in get_args(b))
     elif _is_intersection(b):
-        assert isinstance(a, type)
+        assert not isinstance(a, tuple)
         assert isinstance(b, tuple)
-        return all(issubclass(a, b_part) for b_part in b)
+        return all(_issubclass(a, b_part) for b_part in b)
     elif _is_intersection(a):
         assert isinstance(a, tuple)
-        return any(issubclass(a_part, b) for a_part in a)
-    assert isinstance(a, type)
-    return issubclass(a, b)
+        assert not isinstance(b, tuple)
+        return any(_issubclass(a_part, b) for a_part in a)
+    assert not isinstance(a, tuple)
+    assert not isinstance(b, tuple)
+    return _issubclass(a, b)
 
 
 def fully_qualified_name(cls: type) -> str:
@@ -128,6 +148,9 @@ def is_not_known_mutable_type(type_: BoundType) -> TypeGuard[NotKnownMutableType
     )
 
 
+# The verdict only depends on the type of the value, and checking against the mutable
+# ABCs is comparatively slow, so verdicts are cached by type.
+@cache_by_type
 def is_not_known_mutable_instance(value: object) -> bool:
     return not (
         isinstance(value, mutable)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Any
+from typing import Final
+
+# Concrete predicate-based phantom types, which rebuild the predicate that their
+# checks evaluate, by calling their _build_check() method, when settings that it
+# depends on change, e.g. the validation mode or whether metrics are recorded. Types
+# are held weakly, so that they can be collected.
+_types: Final[weakref.WeakSet[Any]] = weakref.WeakSet()
+_lock: Final = threading.Lock()
+
+
+def register(cls: Any) -> None:
+    with _lock:
+        _types.add(cls)
+
+
+def rebuild_checks() -> None:
+    with _lock:
+        types = list(_types)
+    for cls in types:
+        cls._build_check()
@@ -4,6 +4,12 @@ from typing import runtime_checkable
 
 from numerary.protocol import CachingProtocolMeta
 
+# Instance checks against protocols with CachingProtocolMeta are cached per type by
+# numerary, in dicts that checks read and write with single operations, so concurrent
+# checks are safe on free-threaded builds too, at worst computing a verdict twice.
+# Phantom types don't cache verdicts of these protocols themselves, as numerary
+# invalidates its caches when types are included or excluded.
+
 T_contra = TypeVar("T_contra", contravariant=True)
 U_co = TypeVar("U_co", covariant=True)
 
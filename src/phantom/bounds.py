@@ -1,29 +1,57 @@
 from __future__ import annotations
 
+import functools
+from abc import ABCMeta
 from collections.abc import Callable
-from collections.abc import Iterable
+from collections.abc import Hashable
 from collections.abc import Sequence
+from inspect import isclass
 from typing import Any
 from typing import Final
+from typing import Protocol
 from typing import TypeAlias
 from typing import TypeVar
+from typing import Union
 from typing import cast
 from typing import get_args
+from typing import get_origin
+from typing import get_type_hints
 
+from typeguard import CollectionCheckStrategy
+
+from ._utils.cache import cache_by_type
 from ._utils.misc import is_union
 from .errors import BoundError
+from .errors import LazyMessage
+from .predicates import Predicate
 from .predicates.boolean import all_of
+from .predicates.generic import CollectionCheck
 from .predicates.generic import of_complex_type
 from .predicates.generic import of_type
 
-__all__ = ("get_bound_parser", "parse_str", "Parser")
+__all__ = (
+    "get_bound_parser",
+    "get_bound_predicate",
+    "get_default_collection_check",
+    "set_default_collection_check",
+    "parse_str",
+    "Parser",
+)
 
 T = TypeVar("T", covariant=True)
 Parser: TypeAlias = Callable[[object], T]
 
 
-def display_bound(bound: Any) -> str:
-    if isinstance(bound, Iterable):
+def _is_hashable(value: object) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _format_bound(bound: Any) -> str:
+    if isinstance(bound, Sequence):
         return f"Intersection[{', '.join(display_bound(part) for part in bound)}]"
     if is_union(bound):
         return (
@@ -31,25 +59,218 @@ def display_bound(bound: Any) -> str:
             f"{', '.join(display_bound(part) for part in get_args(bound))}"
             f"]"
         )
+    # Parametrized generics proxy attribute access to their origin, so would be
+    # displayed without their parameters.
+    if get_origin(bound) is not None:
+        return str(bound)
     return str(getattr(bound, "__name__", bound))
 
 
-def get_bound_parser(bound: type[T] | Any) -> Parser[T]:
-    within_bound = (
-        # Interpret sequence as intersection
-        all_of(of_type(t) for t in bound)
-        if isinstance(bound, Sequence)
-        else of_complex_type(bound)
-    )
+_cached_format_bound = functools.lru_cache(maxsize=1024)(_format_bound)
+
+
+def display_bound(bound: Any) -> str:
+    if not _is_hashable(bound):
+        return _format_bound(bound)
+    return _cached_format_bound(bound)
+
+
+def runtime_bound(bound: Any) -> Any:
+    """
+    Return the bound that values of ``bound`` have at runtime, with type parameters
+    erased, such that e.g. ``tuple[int, ...]`` becomes ``tuple``. Checking a value
+    against the returned bound is never more costly than checking its type. Returns
+    :py:const:`None` if ``bound`` has no such runtime representation.
+    """
+    if isinstance(bound, Sequence):
+        return bound
+    if is_union(bound):
+        parts = tuple(runtime_bound(part) for part in get_args(bound))
+        if None in parts:
+            return None
+        return Union[parts]  # noqa: UP007
+    origin = get_origin(bound)
+    erased = bound if origin is None else origin
+    # Special forms such as typing.Any and typing.Annotated are classes in some
+    # versions of Python, but don't support instance checks.
+    if not isclass(erased) or erased.__module__ == "typing":
+        return None
+    return erased
+
+
+# Builtin types that typeguard, following PEP 484, widens to also accept other types.
+_widened_types: Final[dict[type, tuple[type, ...]]] = {
+    float: (float, int),
+    complex: (complex, float, int),
+    bytes: (bytes, bytearray, memoryview),
+}
+
+
+def _plain_classes(bound: object) -> tuple[type, ...] | None:
+    """
+    Return the classes to pass to :py:func:`isinstance` to check values against
+    ``bound``, or :py:const:`None` if ``bound`` is not a plain class, or a union of
+    plain classes, and so needs a full type check.
+    """
+    if is_union(bound):
+        classes: list[type] = []
+        for part in get_args(bound):
+            part_classes = _plain_classes(part)
+            if part_classes is None:
+                return None
+            classes.extend(part_classes)
+        return tuple(classes)
+    if (
+        not isclass(bound)
+        or get_origin(bound) is not None
+        # Protocols are checked structurally, typing special forms such as typing.Any
+        # and typing.IO have custom semantics, and named tuples have their fields
+        # checked.
+        or getattr(bound, "_is_protocol", False)
+        or bound.__module__ == "typing"
+        or (issubclass(bound, tuple) and bound is not tuple)
+    ):
+        return None
+    return _widened_types.get(bound, (bound,))
+
+
+def _is_method_protocol(bound: object) -> bool:
+    """
+    Return :py:const:`True` if ``bound`` is an unparametrized protocol that only
+    declares methods, such that whether a value satisfies it only depends on the type
+    of the value.
+    """
+    if not getattr(bound, "_is_protocol", False) or get_origin(bound) is not None:
+        return False
+    try:
+        return not get_type_hints(bound)
+    except (NameError, TypeError):
+        return False
+
+
+# Metaclasses whose instance checks only depend on the type of the checked value, and
+# on the virtual subclasses registered with ABCs, which cache_by_type() accounts for.
+# Other metaclasses, e.g. those of phantom types and numerary's protocols, may check
+# values or keep verdicts that they invalidate by other means.
+_type_dependent_metaclasses: Final = frozenset((type, ABCMeta, type(Protocol)))
+
+
+def _is_type_dependent(class_: object) -> bool:
+    """
+    Return :py:const:`True` if whether a value is an instance of ``class_`` only
+    depends on the type of the value, such that verdicts can be cached by type.
+    """
+    if type(class_) not in _type_dependent_metaclasses:
+        return False
+    return not getattr(class_, "_is_protocol", False) or _is_method_protocol(class_)
+
+
+def _compile_bound(
+    bound: type[T] | Any,
+    collection_check: CollectionCheck,
+) -> Predicate[object]:
+    # Interpret sequence as intersection.
+    if isinstance(bound, Sequence):
+        check = all_of(of_type(t) for t in bound)
+        return cache_by_type(check) if all(map(_is_type_dependent, bound)) else check
+    classes = _plain_classes(bound)
+    if classes is None:
+        return (
+            cache_by_type(of_complex_type(bound))
+            if _is_method_protocol(bound) and _is_type_dependent(bound)
+            else of_complex_type(bound, collection_check)
+        )
+    check = of_type(classes[0] if len(classes) == 1 else classes)
+    # A bare isinstance() against classes with a default metaclass is cheaper than a
+    # cache lookup, but e.g. ABCs are faster to check through the cache.
+    if all(type(class_) is type for class_ in classes) or not all(
+        map(_is_type_dependent, classes)
+    ):
+        return check
+    return cache_by_type(check)
+
+
+_cached_bound_predicate = functools.lru_cache(maxsize=1024)(_compile_bound)
+
+
+def get_bound_predicate(
+    bound: type[T] | Any,
+    collection_check: CollectionCheck | None = None,
+) -> Predicate[object]:
+    """
+    Return a predicate that's true for values that are within ``bound``. This is the
+    check that the parsers returned by :py:func:`get_bound_parser` are built on, and
+    is cached in the same way.
+    """
+    if collection_check is None:
+        collection_check = _default_collection_check
+    if not _is_hashable(bound):
+        return _compile_bound(bound, collection_check)
+    return _cached_bound_predicate(cast(Hashable, bound), collection_check)
+
+
+def _build_bound_parser(
+    bound: type[T] | Any,
+    collection_check: CollectionCheck,
+) -> Parser[T]:
+    within_bound = get_bound_predicate(bound, collection_check)
+    displayed = display_bound(bound)
 
     def parser(instance: object) -> T:
         if not within_bound(instance):
             raise BoundError(
-                f"Value is not within bound of {display_bound(bound)!r}: {instance!r}"
+                LazyMessage(
+                    "Value is not within bound of {}: {}",
+                    displayed,
+                    instance,
+                )
             )
         return cast(T, instance)
 
     return parser
 
 
+_cached_bound_parser = functools.lru_cache(maxsize=1024)(_build_bound_parser)
+
+
+_default_collection_check: CollectionCheck = CollectionCheckStrategy.ALL_ITEMS
+
+
+def get_default_collection_check() -> CollectionCheck:
+    """
+    Return the collection check strategy used for phantom types that don't provide
+    the ``collection_check`` class argument.
+    """
+    return _default_collection_check
+
+
+def set_default_collection_check(collection_check: CollectionCheck) -> None:
+    """
+    Set the collection check strategy used for phantom types that don't provide the
+    ``collection_check`` class argument. The default is resolved when a phantom type
+    is created, so this needs to be called before defining the affected types.
+    """
+    global _default_collection_check
+    _default_collection_check = collection_check
+
+
+def get_bound_parser(
+    bound: type[T] | Any,
+    collection_check: CollectionCheck | None = None,
+) -> Parser[T]:
+    """
+    Return a parser that raises :py:class:`BoundError` for values that are not within
+    ``bound``. ``collection_check`` determines which items of collections are checked
+    for parametrized bounds, and defaults to the value of
+    :py:func:`get_default_collection_check`. Parsers are cached by bound, so that
+    phantom types sharing a bound also share a parser. Unhashable bounds bypass the
+    cache.
+    """
+    if collection_check is None:
+        collection_check = _default_collection_check
+    if not _is_hashable(bound):
+        return _build_bound_parser(bound, collection_check)
+    return _cached_bound_parser(cast(Hashable, bound), collection_check)
+
+
 parse_str: Final[Callable[[object], str]] = get_bound_parser(str)
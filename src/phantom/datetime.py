@@ -11,6 +11,7 @@ You can install python-dateutil by using the ``[dateutil]`` or ``[all]`` extras.
 from __future__ import annotations
 
 import datetime
+from typing import TypeVar
 
 from . import Phantom
 from . import _hypothesis
@@ -43,6 +44,8 @@ except ImportError as e:
 
 __all__ = ("TZAware", "TZNaive")
 
+U = TypeVar("U")
+
 
 def parse_datetime(value: object) -> datetime.datetime:
     if isinstance(value, datetime.datetime):
@@ -50,10 +53,23 @@ def parse_datetime(value: object) -> datetime.datetime:
     str_value = parse_str(value)
     try:
         return parse_datetime_str(str_value)
-    except DateutilParseError as exc:
+    # Out of range values overflow instead of failing to parse.
+    except (DateutilParseError, OverflowError) as exc:
         raise TypeError("Could not parse datetime from given string") from exc
 
 
+def _try_parse_datetime(value: object) -> datetime.datetime | None:
+    if isinstance(value, datetime.datetime):
+        return value
+    if not isinstance(value, str):
+        return None
+    try:
+        return parse_datetime_str(value)
+    # Out of range values overflow instead of failing to parse.
+    except (DateutilParseError, OverflowError, ValueError):
+        return None
+
+
 class TZAware(datetime.datetime, Phantom, predicate=is_tz_aware):
     """
     A type for helping ensure that ``datetime`` objects are always timezone aware.
@@ -72,6 +88,17 @@ class TZAware(datetime.datetime, Phantom, predicate=is_tz_aware):
     def parse(cls, instance: object) -> TZAware:
         return super().parse(parse_datetime(instance))
 
+    @classmethod
+    def try_parse(
+        cls,
+        instance: object,
+        default: U | None = None,
+    ) -> TZAware | U | None:
+        value = _try_parse_datetime(instance)
+        if value is None:
+            return default
+        return cls._try_parse_checked(value, default)
+
     @classmethod
     def __schema__(cls) -> Schema:
         return {
@@ -99,6 +126,17 @@ class TZNaive(datetime.datetime, Phantom, predicate=is_tz_naive):
     def parse(cls, instance: object) -> TZNaive:
         return super().parse(parse_datetime(instance))
 
+    @classmethod
+    def try_parse(
+        cls,
+        instance: object,
+        default: U | None = None,
+    ) -> TZNaive | U | None:
+        value = _try_parse_datetime(instance)
+        if value is None:
+            return default
+        return cls._try_parse_checked(value, default)
+
     @classmethod
     def __schema__(cls) -> Schema:
         return {
@@ -1,4 +1,133 @@
+from __future__ import annotations
+
+import heapq
+import reprlib
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
+from itertools import islice
+
+
 class BoundError(TypeError): ...
 
 
+class AssumptionError(TypeError):
+    """
+    A value that was assumed to be of a phantom type with
+    :py:meth:`phantom.PhantomBase.assume` was found not to be an instance of it.
+    """
+
+
 class MissingDependency(Exception): ...
+
+
+@dataclass(frozen=True)
+class ParseFailure:
+    """
+    A value that was rejected by :py:meth:`phantom.PhantomBase.iter_parse`, with the
+    index of the value in the parsed iterable and the reason it was rejected.
+    """
+
+    index: int
+    reason: str
+
+
+_repr_limit = 200
+
+
+def get_repr_limit() -> int:
+    """
+    Return the maximum length of the reprs of rejected values in error messages, and
+    of the reprs of arguments in the names of predicates.
+    """
+    return _repr_limit
+
+
+def set_repr_limit(limit: int) -> None:
+    """
+    Set the maximum length of the reprs of rejected values in error messages, and of
+    the reprs of arguments in the names of predicates created afterwards. Longer reprs
+    are truncated, so that formatting errors and names for large values stays cheap.
+    """
+    if limit < 1:
+        raise ValueError("Repr limit must be at least 1")
+    global _repr_limit
+    _repr_limit = limit
+
+
+def _first_items(items: AbstractSet, n: int) -> list:
+    # Only the displayed items are sorted, rather than the whole set as reprlib does.
+    try:
+        return heapq.nsmallest(n, items)
+    except TypeError:
+        return list(islice(items, n))
+
+
+class _Repr(reprlib.Repr):
+    def _repr_set(
+        self, x: AbstractSet, level: int, left: str, right: str, n: int
+    ) -> str:
+        if level <= 0:
+            return f"{left}...{right}"
+        pieces = [self.repr1(item, level - 1) for item in _first_items(x, n)]
+        if len(x) > n:
+            pieces.append("...")
+        return f"{left}{', '.join(pieces)}{right}"
+
+    def repr_set(self, x: set, level: int) -> str:
+        if not x:
+            return "set()"
+        return self._repr_set(x, level, "{", "}", self.maxset)
+
+    def repr_frozenset(self, x: frozenset, level: int) -> str:
+        if not x:
+            return "frozenset()"
+        return self._repr_set(x, level, "frozenset({", "})", self.maxfrozenset)
+
+
+def truncated_repr(value: object) -> str:
+    """
+    Return the repr of ``value``, truncated to the limit given by
+    :py:func:`get_repr_limit`. Strings, numbers and builtin collections are truncated
+    without computing their full repr.
+    """
+    limit = _repr_limit
+    formatter = _Repr()
+    formatter.maxlevel = 2
+    formatter.maxstring = formatter.maxlong = formatter.maxother = limit
+    # Every item takes up at least a few characters, so there is no point in
+    # formatting more items of a collection than would fit within the limit.
+    items = max(1, limit // 4)
+    formatter.maxtuple = formatter.maxlist = formatter.maxarray = items
+    formatter.maxdict = formatter.maxset = formatter.maxfrozenset = items
+    formatter.maxdeque = items
+    formatted = formatter.repr(value)
+    return formatted if len(formatted) <= limit else f"{formatted[: limit - 3]}..."
+
+
+class LazyMessage:
+    """
+    Error message that is formatted when it's first converted to a string, by
+    substituting the truncated reprs of ``values`` into ``template``. Passing this as
+    the argument of an exception defers the cost of formatting to when the error is
+    displayed, so that errors that are caught and discarded stay cheap.
+    """
+
+    __slots__ = ("_message", "template", "values")
+
+    def __init__(self, template: str, *values: object) -> None:
+        self.template = template
+        self.values = values
+        self._message: str | None = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = self.template.format(*map(truncated_repr, self.values))
+        return self._message
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __reduce__(self) -> tuple[type[str], tuple[str]]:
+        # Pickles as the formatted message, so that unpicklable values don't make
+        # the error unpicklable.
+        return str, (str(self),)
@@ -12,13 +12,13 @@ from __future__ import annotations
 
 from typing import Final
 from typing import TypeGuard
+from typing import TypeVar
 from typing import cast
 
 import phonenumbers
 
 from phantom import Phantom
 from phantom.bounds import parse_str
-from phantom.fn import excepts
 from phantom.schema import Schema
 
 __all__ = (
@@ -30,6 +30,8 @@ __all__ = (
     "FormattedPhoneNumber",
 )
 
+U = TypeVar("U")
+
 
 class InvalidPhoneNumber(phonenumbers.NumberParseException, TypeError):
     INVALID: Final = 99
@@ -66,14 +68,37 @@ def normalize_phone_number(
     return cast(FormattedPhoneNumber, normalized)
 
 
-is_phone_number = excepts(InvalidPhoneNumber)(_deconstruct_phone_number)
+def _try_deconstruct_phone_number(
+    phone_number: str, country_code: str | None = None
+) -> phonenumbers.PhoneNumber | None:
+    # Like _deconstruct_phone_number(), but returns None for invalid numbers instead
+    # of constructing an InvalidPhoneNumber error.
+    try:
+        parsed_number = phonenumbers.parse(phone_number, region=country_code)
+    except phonenumbers.NumberParseException:
+        return None
+    if not phonenumbers.is_valid_number(parsed_number):
+        return None
+    return parsed_number
+
+
+def _try_normalize_phone_number(phone_number: str) -> FormattedPhoneNumber | None:
+    parsed_number = _try_deconstruct_phone_number(phone_number)
+    if parsed_number is None:
+        return None
+    normalized = phonenumbers.format_number(
+        parsed_number,
+        phonenumbers.PhoneNumberFormat.E164,
+    )
+    return cast(FormattedPhoneNumber, normalized)
+
+
+def is_phone_number(phone_number: str, country_code: str | None = None) -> bool:
+    return _try_deconstruct_phone_number(phone_number, country_code) is not None
 
 
 def is_formatted_phone_number(number: str) -> TypeGuard[FormattedPhoneNumber]:
-    try:
-        return number == normalize_phone_number(number)
-    except InvalidPhoneNumber:
-        return False
+    return number == _try_normalize_phone_number(number)
 
 
 class PhoneNumber(str, Phantom, predicate=is_phone_number):
@@ -97,6 +122,17 @@ class FormattedPhoneNumber(PhoneNumber, predicate=is_formatted_phone_number):
         """
         return normalize_phone_number(parse_str(instance))
 
+    @classmethod
+    def try_parse(
+        cls,
+        instance: object,
+        default: U | None = None,
+    ) -> FormattedPhoneNumber | U | None:
+        if not isinstance(instance, str):
+            return default
+        normalized = _try_normalize_phone_number(instance)
+        return default if normalized is None else normalized
+
     @classmethod
     def __schema__(cls) -> Schema:
         return {
@@ -22,6 +22,7 @@ minimums and maximums to their schema representations.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from contextlib import suppress
 from typing import Any
 from typing import Final
@@ -40,6 +41,7 @@ from .schema import Schema
 
 N = TypeVar("N", bound=Comparable)
 Derived = TypeVar("Derived", bound="Interval")
+U = TypeVar("U")
 
 
 class IntervalCheck(Protocol):
@@ -163,6 +165,38 @@ class Interval(Phantom[Comparable], bound=Comparable, abstract=True):
             cls.__bound__(instance) if isinstance(instance, str) else instance
         )
 
+    @classmethod
+    def try_parse(
+        cls: type[Derived],
+        instance: object,
+        default: U | None = None,
+    ) -> Derived | U | None:
+        if not _parses_by_coercion(cls):
+            return super().try_parse(instance, default)
+        if isinstance(instance, str):
+            try:
+                instance = cls.__bound__(instance)
+            except (TypeError, ValueError):
+                return default
+        return cls._try_parse_checked(instance, default)
+
+    @classmethod
+    def parse_many(cls: type[Derived], instances: Iterable[object]) -> list[Derived]:
+        # Subtypes that customize parsing must parse one value at a time.
+        if not _parses_by_coercion(cls):
+            return super().parse_many(instances)
+        bound = cls.__bound__
+        return cls._parse_many_checked(
+            [
+                bound(instance) if isinstance(instance, str) else instance
+                for instance in instances
+            ]
+        )
+
+
+def _parses_by_coercion(cls: type[Interval]) -> bool:
+    return cls.parse.__func__ is Interval.parse.__func__  # type: ignore[attr-defined]
+
 
 def _format_limit(value: SupportsEq) -> str:
     if value == inf:
@@ -11,14 +11,17 @@ so:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Final
 from typing import Literal
 from typing import TypeAlias
+from typing import TypeVar
 from typing import cast
 from typing import get_args
 
 from phantom import Phantom
 from phantom import _hypothesis
+from phantom._base import _has_plain_check
 from phantom.bounds import parse_str
 from phantom.predicates.collection import contained
 from phantom.schema import Schema
@@ -287,6 +290,8 @@ LiteralAlpha2: TypeAlias = Literal[
 ]
 """Literal of all ISO3166 alpha-2 codes. """
 
+U = TypeVar("U")
+
 ALPHA2: Final = frozenset(get_args(LiteralAlpha2))
 is_alpha2_country_code = contained(ALPHA2)
 
@@ -306,6 +311,11 @@ def normalize_alpha2_country_code(country_code: str) -> ParsedAlpha2:
     return cast(ParsedAlpha2, normalized)
 
 
+def _checks_alpha2(cls: type[ParsedAlpha2]) -> bool:
+    # Subtypes may narrow the predicate, which the specialized methods don't check.
+    return cls.__predicate__ is is_alpha2_country_code
+
+
 class ParsedAlpha2(str, Phantom, predicate=is_alpha2_country_code):
     @classmethod
     def parse(cls, instance: object) -> ParsedAlpha2:
@@ -314,7 +324,45 @@ class ParsedAlpha2(str, Phantom, predicate=is_alpha2_country_code):
 
         :raises InvalidCountryCode:
         """
-        return normalize_alpha2_country_code(parse_str(instance))
+        normalized = normalize_alpha2_country_code(parse_str(instance))
+        if not _checks_alpha2(cls):
+            return super().parse(normalized)
+        return normalized
+
+    @classmethod
+    def try_parse(
+        cls,
+        instance: object,
+        default: U | None = None,
+    ) -> ParsedAlpha2 | U | None:
+        if not _checks_alpha2(cls):
+            return super().try_parse(instance, default)
+        if not isinstance(instance, str):
+            return default
+        normalized = instance.upper()
+        return cast(ParsedAlpha2, normalized) if normalized in ALPHA2 else default
+
+    @classmethod
+    def parse_many(cls, instances: Iterable[object]) -> list[ParsedAlpha2]:
+        """
+        Normalize mixed case country codes.
+
+        :raises InvalidCountryCode:
+        """
+        if not _checks_alpha2(cls):
+            return super().parse_many(instances)
+        normalized = [parse_str(instance).upper() for instance in instances]
+        if not ALPHA2.issuperset(normalized):
+            raise InvalidCountryCode
+        return cast(list[ParsedAlpha2], normalized)
+
+    @classmethod
+    def is_valid_many(cls, instances: Iterable[object]) -> bytearray:
+        if not _checks_alpha2(cls) or not _has_plain_check(cls):
+            return super().is_valid_many(instances)
+        return bytearray(
+            isinstance(instance, str) and instance in ALPHA2 for instance in instances
+        )
 
     @classmethod
     def __schema__(cls) -> Schema:
@@ -0,0 +1,227 @@
+"""
+Per-type metrics of checks of predicate-based phantom types: the number of checks
+that passed and failed, and a histogram of the time they took.
+
+Checks are recorded wherever a phantom type checks values, i.e. for instance checks
+and for parsing, as types parse values by checking them, including in batch methods
+such as ``is_valid_many()``. Types that parse values by other means than checking
+them, such as :py:class:`phantom.iso3166.ParsedAlpha2`, which normalizes the case of
+country codes, only record their instance checks. Metrics are disabled by
+default, in which case checks aren't instrumented at all, and cost nothing extra.
+Enabling them adds the cost of reading a clock twice, and updating a few counters,
+to every check.
+
+.. code-block:: python
+
+    from phantom import metrics
+
+    metrics.enable()
+    ...
+    print(metrics.prometheus_text())
+
+Durations are counted in buckets with bounds that are powers of two nanoseconds, from
+1 ns up to about 2 seconds. Counters are updated without locking, so threads that
+check the same type at the same time may lose updates, which only makes the metrics
+undercount.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from typing import Any
+from typing import Final
+
+from ._utils import registry
+from ._utils.misc import fully_qualified_name
+from .predicates import Predicate
+
+__all__ = (
+    "disable",
+    "enable",
+    "is_enabled",
+    "prometheus_text",
+    "reset",
+    "snapshot",
+)
+
+# Durations with a bit length of n nanoseconds are counted in bucket n, i.e. bucket n
+# holds durations below 2**n ns, and the last bucket holds all longer durations.
+_buckets: Final = 32
+_bucket_bounds: Final = tuple(2**index / 1e9 for index in range(_buckets))
+
+_enabled = False
+_lock: Final = threading.Lock()
+
+
+class _TypeMetrics:
+    __slots__ = ("buckets", "failed", "nanoseconds", "passed")
+
+    def __init__(self) -> None:
+        self.failed = 0
+        self.passed = 0
+        self.nanoseconds = 0
+        self.buckets = [0] * (_buckets + 1)
+
+
+_metrics: Final[weakref.WeakKeyDictionary[type, _TypeMetrics]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _instrument(cls: type, check: Predicate[object]) -> Predicate[object]:
+    """
+    Return ``check`` as is while metrics are disabled, and otherwise a predicate that
+    records metrics of ``check`` for ``cls``.
+    """
+    if not _enabled:
+        return check
+    with _lock:
+        metrics = _metrics.get(cls)
+        if metrics is None:
+            metrics = _metrics[cls] = _TypeMetrics()
+    buckets = metrics.buckets
+    clock = time.perf_counter_ns
+
+    def instrumented(instance: object) -> bool:
+        start = clock()
+        result = check(instance)
+        elapsed = clock() - start
+        buckets[min(elapsed.bit_length(), _buckets)] += 1
+        metrics.nanoseconds += elapsed
+        if result:
+            metrics.passed += 1
+        else:
+            metrics.failed += 1
+        return result
+
+    return instrumented
+
+
+def is_enabled() -> bool:
+    """Return whether metrics are recorded."""
+    return _enabled
+
+
+def enable() -> None:
+    """Start recording metrics of checks of all phantom types."""
+    global _enabled
+    _enabled = True
+    registry.rebuild_checks()
+
+
+def disable() -> None:
+    """Stop recording metrics. Metrics recorded so far are kept."""
+    global _enabled
+    _enabled = False
+    registry.rebuild_checks()
+
+
+def reset() -> None:
+    """Reset the metrics of all phantom types to zero."""
+    with _lock:
+        metrics = list(_metrics.values())
+    for type_metrics in metrics:
+        type_metrics.failed = type_metrics.passed = type_metrics.nanoseconds = 0
+        type_metrics.buckets[:] = [0] * (_buckets + 1)
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """
+    Return the metrics of each phantom type that has been checked, by the fully
+    qualified name of the type. Metrics of types with the same name, e.g. types that
+    are created by a function, are merged. The metrics of a type are:
+
+    * ``checks`` - the number of checks.
+    * ``passed`` and ``failed`` - the number of checks that passed and failed.
+    * ``failure_rate`` - the fraction of checks that failed.
+    * ``seconds`` - the total time spent checking values.
+    * ``buckets`` - the number of checks that took at most the number of seconds of
+      each key, cumulatively, ending with :py:data:`math.inf`.
+
+    >>> from phantom.interval import Natural
+    >>> enable()
+    >>> reset()
+    >>> isinstance(1, Natural), isinstance(-1, Natural)
+    (True, False)
+    >>> metrics = snapshot()["phantom.interval.Natural"]
+    >>> metrics["checks"], metrics["passed"], metrics["failure_rate"]
+    (2, 1, 0.5)
+    >>> disable()
+    """
+    with _lock:
+        items = list(_metrics.items())
+    merged: dict[str, _TypeMetrics] = {}
+    for cls, metrics in items:
+        total = merged.setdefault(fully_qualified_name(cls), _TypeMetrics())
+        # The counters of a type are read together, but may be updated meanwhile.
+        for index, bucket in enumerate(list(metrics.buckets)):
+            total.buckets[index] += bucket
+        total.passed += metrics.passed
+        total.failed += metrics.failed
+        total.nanoseconds += metrics.nanoseconds
+    result: dict[str, dict[str, Any]] = {}
+    for name, metrics in merged.items():
+        checks = metrics.passed + metrics.failed
+        if not checks:
+            continue
+        cumulative: dict[float, int] = {}
+        count = 0
+        for bound, bucket in zip(
+            (*_bucket_bounds, float("inf")), metrics.buckets, strict=True
+        ):
+            count += bucket
+            cumulative[bound] = count
+        result[name] = {
+            "checks": checks,
+            "passed": metrics.passed,
+            "failed": metrics.failed,
+            "failure_rate": metrics.failed / checks,
+            "seconds": metrics.nanoseconds / 1e9,
+            "buckets": cumulative,
+        }
+    return result
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text() -> str:
+    """
+    Return the metrics of all phantom types that have been checked in the Prometheus
+    text exposition format, as the counter ``phantom_checks_total``, labeled by type
+    and outcome, and the histogram ``phantom_check_duration_seconds``, labeled by
+    type.
+    """
+    snapshots = snapshot()
+    lines = [
+        "# HELP phantom_checks_total Checks of phantom types, by outcome.",
+        "# TYPE phantom_checks_total counter",
+    ]
+    for name, metrics in snapshots.items():
+        label = f'type="{_escape(name)}"'
+        for outcome in ("passed", "failed"):
+            lines.append(
+                f'phantom_checks_total{{{label},outcome="{outcome}"}} '
+                f"{metrics[outcome]}"
+            )
+    lines += [
+        "# HELP phantom_check_duration_seconds Duration of checks of phantom types.",
+        "# TYPE phantom_check_duration_seconds histogram",
+    ]
+    for name, metrics in snapshots.items():
+        label = f'type="{_escape(name)}"'
+        for bound, count in metrics["buckets"].items():
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(
+                f'phantom_check_duration_seconds_bucket{{{label},le="{le}"}} {count}'
+            )
+        lines.append(
+            f"phantom_check_duration_seconds_sum{{{label}}} {metrics['seconds']!r}"
+        )
+        # The count of a histogram equals its last bucket, which may differ from
+        # the number of checks by outcome, as they're updated separately.
+        lines.append(f"phantom_check_duration_seconds_count{{{label}}} {count}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,217 @@
+"""
+Validation of large iterables of values in a pool of worker processes, for types with
+checks that are expensive enough to be bound by the CPU.
+
+.. code-block:: python
+
+    from phantom.ext.phonenumbers import PhoneNumber
+    from phantom.parallel import validate
+
+    for number in validate(PhoneNumber, numbers, workers=8):
+        ...
+
+Values and phantom types are pickled to be sent to the workers, so types must be
+importable by name, i.e. defined at the top level of a module.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from collections.abc import Generator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import MutableSequence
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from itertools import islice
+from typing import Final
+from typing import TypeAlias
+from typing import TypeVar
+from typing import cast
+
+from ._base import OnError
+from ._base import PhantomBase
+from ._base import _iter_parse
+from ._base import _parses_by_instance_check
+from .errors import ParseFailure
+
+__all__ = ("validate",)
+
+Derived = TypeVar("Derived", bound=PhantomBase)
+
+# Adaptive chunk sizes start small, and are then sized so that validating a chunk
+# takes about the target duration, which keeps the per chunk overhead of sending
+# values between processes low for cheap checks, and spreads expensive checks
+# evenly across workers.
+_initial_chunksize: Final = 64
+_max_chunksize: Final = 1 << 16
+_target_duration: Final = 0.05
+
+# The values of a chunk, or for types that parse values by checking that they are
+# instances, whether each value is valid, so that the values don't have to be sent
+# back. Followed by the failures within the chunk, the error to raise if any, and the
+# time it took to validate the chunk.
+_Result: TypeAlias = tuple[
+    list[object] | bytearray,
+    list[ParseFailure],
+    TypeError | ValueError | None,
+    float,
+]
+
+
+def _validate_chunk(
+    cls: type[PhantomBase],
+    chunk: list[object],
+    on_error: OnError,
+) -> _Result:
+    start = time.perf_counter()
+    failures: list[ParseFailure] = []
+    error: TypeError | ValueError | None = None
+    values: list[object] | bytearray
+    if _parses_by_instance_check(cls):
+        values = cls.is_valid_many(chunk)
+        if on_error != "skip" and 0 in values:
+            # Only the values that fail are parsed, to find the reason they fail.
+            for index in (index for index, valid in enumerate(values) if not valid):
+                try:
+                    cls.parse(chunk[index])
+                except (TypeError, ValueError) as exception:
+                    failures.append(
+                        ParseFailure(index, str(exception) or repr(exception))
+                    )
+                    if on_error == "raise":
+                        error = exception
+                        break
+    else:
+        values = []
+        try:
+            # Values parsed before an error is raised are kept, to be yielded before
+            # the error.
+            values.extend(_iter_parse(cls, iter(chunk), on_error, failures, len(chunk)))
+        except (TypeError, ValueError) as exception:
+            error = exception
+    return values, failures, error, time.perf_counter() - start
+
+
+def _next_chunksize(cost: float) -> int:
+    if cost <= 0:
+        return _max_chunksize
+    return max(1, min(_max_chunksize, round(_target_duration / cost)))
+
+
+def _validate(
+    cls: type[Derived],
+    iterator: Iterator[object],
+    on_error: OnError,
+    errors: MutableSequence[ParseFailure] | None,
+    chunksize: int | None,
+    executor: Executor,
+    in_flight: int,
+) -> Generator[Derived, None, None]:
+    size = _initial_chunksize if chunksize is None else chunksize
+    # The mean time to validate a value, weighted towards recent chunks.
+    cost: float | None = None
+    pending: deque[tuple[int, list[object], Future[_Result]]] = deque()
+    offset = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < in_flight:
+                chunk = list(islice(iterator, size))
+                if not chunk:
+                    exhausted = True
+                    break
+                future = executor.submit(_validate_chunk, cls, chunk, on_error)
+                pending.append((offset, chunk, future))
+                offset += len(chunk)
+            if not pending:
+                return
+            chunk_offset, chunk, future = pending.popleft()
+            values, failures, error, elapsed = future.result()
+            if chunksize is None:
+                sample = elapsed / len(chunk)
+                cost = sample if cost is None else (cost + sample) / 2
+                size = _next_chunksize(cost)
+            if isinstance(values, bytearray):
+                stop = failures[-1].index if error is not None else len(chunk)
+                yield from cast("Iterator[Derived]", compress(chunk[:stop], values))
+            else:
+                yield from cast("list[Derived]", values)
+            if error is not None:
+                raise error
+            if errors is not None:
+                errors.extend(
+                    ParseFailure(chunk_offset + failure.index, failure.reason)
+                    for failure in failures
+                )
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+
+
+def _validate_in_pool(
+    cls: type[Derived],
+    iterator: Iterator[object],
+    on_error: OnError,
+    errors: MutableSequence[ParseFailure] | None,
+    chunksize: int | None,
+    workers: int | None,
+) -> Generator[Derived, None, None]:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = 2 * (workers or os.cpu_count() or 1)
+        yield from _validate(
+            cls, iterator, on_error, errors, chunksize, executor, in_flight
+        )
+
+
+def validate(
+    cls: type[Derived],
+    instances: Iterable[object],
+    *,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    on_error: OnError = "raise",
+    errors: MutableSequence[ParseFailure] | None = None,
+    executor: Executor | None = None,
+) -> Generator[Derived, None, None]:
+    """
+    Lazily parse the values of an iterable into a phantom type, like
+    :py:meth:`phantom.PhantomBase.iter_parse`, but in ``workers`` processes, which
+    defaults to the number of CPUs. Values are consumed in chunks that are validated
+    by the workers, and the results are yielded in the order of the iterable. At most
+    two chunks per worker are held in memory at a time. ``on_error`` and ``errors``
+    determine what happens to values that can't be parsed, as for
+    :py:meth:`~phantom.PhantomBase.iter_parse`.
+
+    By default the size of chunks is adapted to the cost of parsing values, such that
+    each chunk takes a fraction of a second to validate. This makes chunks of values
+    that are cheap to check large, to keep the cost of sending them between processes
+    low, and chunks of values that are expensive to check small, to spread them
+    evenly across workers. Pass ``chunksize`` to use chunks of a fixed size instead.
+
+    A process pool is started for each call, and shut down when the returned iterator
+    is exhausted or closed. Pass an ``executor``, e.g. a
+    :py:class:`concurrent.futures.ProcessPoolExecutor`, to submit chunks to instead,
+    which is left running. ``workers`` then only determines how many chunks are
+    submitted ahead.
+
+    :raises TypeError:
+    :raises ValueError: for an invalid combination of arguments.
+    """
+    if on_error not in ("raise", "skip", "collect"):
+        raise ValueError(f"Invalid error policy: {on_error!r}")
+    if on_error == "collect" and errors is None:
+        raise ValueError("An errors sink is required to collect errors")
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("Chunk size must be at least 1")
+    if workers is not None and workers < 1:
+        raise ValueError("Number of workers must be at least 1")
+    iterator = iter(instances)
+    if executor is None:
+        return _validate_in_pool(cls, iterator, on_error, errors, chunksize, workers)
+    in_flight = 2 * (workers or os.cpu_count() or 1)
+    return _validate(cls, iterator, on_error, errors, chunksize, executor, in_flight)
@@ -1,3 +1,15 @@
+from ._base import Node
 from ._base import Predicate
+from ._base import get_node
+from ._compiler import compile_predicate
+from ._intern import intern_predicate
+from ._simplifier import simplify_predicate
 
-__all__ = ("Predicate",)
+__all__ = (
+    "Node",
+    "Predicate",
+    "compile_predicate",
+    "get_node",
+    "intern_predicate",
+    "simplify_predicate",
+)
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from collections.abc import Callable
 from typing import TypeAlias
 from typing import TypeVar
@@ -5,3 +7,99 @@ from typing import TypeVar
 T_contra = TypeVar("T_contra", bound=object, contravariant=True)
 
 Predicate: TypeAlias = Callable[[T_contra], bool]
+
+
+# Factories that create predicates which compare their arguments by identity, and so
+# whose nodes are only equal when their arguments are identical.
+identity_factories: set[Callable[..., Predicate]] = set()
+
+
+class Node:
+    """
+    Describes a predicate created by one of the predicate factories of
+    :py:mod:`phantom.predicates`. ``factory`` is the function that created the
+    predicate, and ``args`` the arguments it was called with, such that
+    ``factory(*args)`` creates an equivalent predicate. ``children`` holds the
+    predicates among the arguments, e.g. ``(p, q)`` for ``both(p, q)``.
+
+    Nodes compare equal when they're created by the same factory with structurally
+    equal arguments. Predicate arguments are compared by their nodes, and other
+    callables by identity. Other arguments are equal when they are of the same type
+    and compare equal, unless the factory compares its arguments by identity, e.g.
+    :py:func:`~phantom.predicates.generic.identical`. Nodes with unhashable arguments
+    are unhashable.
+    """
+
+    __slots__ = ("_hash", "_key", "args", "children", "factory")
+
+    def __init__(
+        self,
+        factory: Callable[..., Predicate],
+        args: tuple[object, ...],
+        children: tuple[Predicate, ...] = (),
+    ) -> None:
+        self.factory = factory
+        self.args = args
+        self.children = children
+        self._key: tuple[object, ...] | None = None
+        self._hash: int | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.factory.__qualname__}, args={self.args!r}, "
+            f"children={self.children!r})"
+        )
+
+    def __reduce__(
+        self,
+    ) -> tuple[type[Node], tuple[Callable[..., Predicate], tuple, tuple]]:
+        # The cached hash isn't pickled, as hashes of strings differ between
+        # interpreters.
+        return Node, (self.factory, self.args, self.children)
+
+    def _structure(self) -> tuple[object, ...]:
+        if self._key is None:
+            if self.factory in identity_factories:
+                # The node holds the arguments, so their ids stay unique.
+                args: object = tuple(map(id, self.args))
+            else:
+                args = _structural_key(self.args)
+            self._key = (self.factory, args)
+        return self._key
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Node):
+            return NotImplemented
+        if self.factory is not other.factory:
+            return False
+        try:
+            return bool(self._structure() == other._structure())
+        except Exception:  # noqa: BLE001
+            return False
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._structure())
+        return self._hash
+
+
+def _structural_key(value: object) -> object:
+    if isinstance(value, tuple):
+        return tuple(map(_structural_key, value))
+    node = get_node(value)  # type: ignore[arg-type]
+    if node is not None:
+        return node
+    if callable(value):
+        return value
+    return type(value), value
+
+
+def get_node(predicate: Predicate) -> Node | None:
+    """
+    Return the node describing ``predicate``, or :py:const:`None` if it wasn't created
+    by a predicate factory, as is the case for e.g.
+    :py:func:`phantom.predicates.numeric.positive`.
+    """
+    return getattr(predicate, "__node__", None)
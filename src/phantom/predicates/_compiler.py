@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import itertools
+import math
+import weakref
+from collections.abc import Callable
+from types import FunctionType
+from typing import Any
+from typing import Final
+from typing import TypeVar
+
+from . import boolean
+from . import collection
+from . import generic
+from . import interval
+from . import numeric
+from . import re as re_predicates
+from ._base import Node
+from ._base import Predicate
+from ._base import get_node
+
+T = TypeVar("T")
+
+_literal_types: Final = (int, str, bytes, bool, type(None))
+
+
+def _is_literal(value: object) -> bool:
+    if type(value) in _literal_types:
+        return True
+    return type(value) is float and math.isfinite(value)
+
+
+class _Compiler:
+    def __init__(self) -> None:
+        self.namespace: dict[str, Any] = {}
+        self._ids = itertools.count()
+
+    def constant(self, value: object, inline: bool = True) -> str:
+        if inline and _is_literal(value):
+            return repr(value)
+        name = f"_c{next(self._ids)}"
+        self.namespace[name] = value
+        return name
+
+    def variable(self) -> str:
+        return f"_v{next(self._ids)}"
+
+    def expression(self, predicate: Predicate, var: str) -> str:
+        if isinstance(predicate, FunctionType) and predicate in _leaves:
+            return _leaves[predicate].format(var)
+        node = get_node(predicate)
+        if node is not None and node.factory in _emitters:
+            return _emitters[node.factory](self, var, *node.args)
+        return f"{self.constant(predicate, inline=False)}({var})"
+
+    def bind(self, value: str, predicate: Predicate) -> str:
+        # Evaluates predicate with the result of the value expression, which is
+        # assigned to a variable so that it's evaluated only once. The identity
+        # check always succeeds.
+        var = self.variable()
+        return f"(({var} := {value}) is {var} and {self.expression(predicate, var)})"
+
+    def join(self, predicates: tuple[Predicate, ...], var: str, operator: str) -> str:
+        return f" {operator} ".join(self.expression(p, var) for p in predicates)
+
+
+_Emitter = Callable[..., str]
+
+
+def _negate(c: _Compiler, var: str, p: Predicate) -> str:
+    return f"(not {c.expression(p, var)})"
+
+
+def _both(c: _Compiler, var: str, p: Predicate, q: Predicate) -> str:
+    return f"({c.expression(p, var)} and {c.expression(q, var)})"
+
+
+def _either(c: _Compiler, var: str, p: Predicate, q: Predicate) -> str:
+    return f"({c.expression(p, var)} or {c.expression(q, var)})"
+
+
+def _xor(c: _Compiler, var: str, p: Predicate, q: Predicate) -> str:
+    return f"({c.expression(p, var)} ^ {c.expression(q, var)})"
+
+
+def _all_of(c: _Compiler, var: str, predicates: tuple[Predicate, ...]) -> str:
+    if not predicates:
+        return "True"
+    return f"(not not ({c.join(predicates, var, 'and')}))"
+
+
+def _any_of(c: _Compiler, var: str, predicates: tuple[Predicate, ...]) -> str:
+    if not predicates:
+        return "False"
+    return f"(not not ({c.join(predicates, var, 'or')}))"
+
+
+def _one_of(c: _Compiler, var: str, predicates: tuple[Predicate, ...]) -> str:
+    # Each branch stops at the second predicate that succeeds, and evaluates every
+    # predicate at most once.
+    if not predicates:
+        return "False"
+    first, *rest = predicates
+    if not rest:
+        return f"(not not {c.expression(first, var)})"
+    return (
+        f"((not ({c.join(tuple(rest), var, 'or')})) "
+        f"if {c.expression(first, var)} "
+        f"else {_one_of(c, var, tuple(rest))})"
+    )
+
+
+def _contains(c: _Compiler, var: str, value: object) -> str:
+    return f"({c.constant(value)} in {var})"
+
+
+def _contained(c: _Compiler, var: str, container: object) -> str:
+    return f"({var} in {c.constant(container)})"
+
+
+def _count(c: _Compiler, var: str, p: Predicate) -> str:
+    return c.bind(f"len({var})", p)
+
+
+def _equal(c: _Compiler, var: str, a: object) -> str:
+    return f"({c.constant(a)} == {var})"
+
+
+def _identical(c: _Compiler, var: str, a: object) -> str:
+    # Identity comparisons with literals are a syntax warning.
+    return f"({c.constant(a, inline=False)} is {var})"
+
+
+def _of_type(c: _Compiler, var: str, t: object) -> str:
+    return f"isinstance({var}, {c.constant(t)})"
+
+
+def _comparison(template: str) -> _Emitter:
+    def emit(c: _Compiler, var: str, *bounds: object) -> str:
+        return template.format(var, *(c.constant(bound) for bound in bounds))
+
+    return emit
+
+
+def _modulo(c: _Compiler, var: str, n: object, p: Predicate) -> str:
+    return c.bind(f"({var} % {c.constant(n)})", p)
+
+
+def _is_match(c: _Compiler, var: str, pattern: Any) -> str:
+    return f"({c.constant(pattern.match)}({var}) is not None)"
+
+
+def _is_full_match(c: _Compiler, var: str, pattern: Any) -> str:
+    return f"({c.constant(pattern.fullmatch)}({var}) is not None)"
+
+
+_emitters: Final[dict[Callable[..., Predicate], _Emitter]] = {
+    boolean.negate: _negate,
+    boolean.both: _both,
+    boolean.either: _either,
+    boolean.xor: _xor,
+    boolean.all_of: _all_of,
+    boolean.any_of: _any_of,
+    boolean.one_of: _one_of,
+    collection.contains: _contains,
+    collection.contained: _contained,
+    collection.count: _count,
+    generic.equal: _equal,
+    generic.identical: _identical,
+    generic.of_type: _of_type,
+    interval.exclusive: _comparison("({1} < {0} < {2})"),
+    interval.exclusive_inclusive: _comparison("({1} < {0} <= {2})"),
+    interval.inclusive_exclusive: _comparison("({1} <= {0} < {2})"),
+    interval.inclusive: _comparison("({1} <= {0} <= {2})"),
+    numeric.less: _comparison("({0} < {1})"),
+    numeric.le: _comparison("({0} <= {1})"),
+    numeric.greater: _comparison("({0} > {1})"),
+    numeric.ge: _comparison("({0} >= {1})"),
+    numeric.modulo: _modulo,
+    re_predicates.is_match: _is_match,
+    re_predicates.is_full_match: _is_full_match,
+}
+
+# Templates of the expressions that predicates without arguments are inlined as.
+_leaves: Final[dict[Callable[..., bool], str]] = {
+    boolean.true: "True",
+    boolean.false: "False",
+    boolean.truthy: "(not not {0})",
+    boolean.falsy: "(not {0})",
+    numeric.positive: "({0} > 0)",
+    numeric.non_positive: "({0} <= 0)",
+    numeric.negative: "({0} < 0)",
+    numeric.non_negative: "({0} >= 0)",
+    numeric.even: "({0} % 2 == 0)",
+    numeric.odd: "({0} % 2 != 0)",
+}
+
+
+# Compiled predicates by the node of the predicate they were compiled from, so that
+# structurally equal predicates share compiled code.
+_compiled: Final[weakref.WeakValueDictionary[Node, Predicate]] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _cached(node: Node | None) -> Predicate | None:
+    if node is None:
+        return None
+    try:
+        return _compiled.get(node)
+    except (TypeError, RecursionError):
+        return None
+
+
+def compile_predicate(predicate: Predicate[T]) -> Predicate[T]:
+    """
+    Compile a predicate into a single function, that evaluates the tree of predicates
+    it's composed of as one expression. Predicates created by the factories of
+    :py:mod:`phantom.predicates` are inlined, with their arguments as constants, while
+    other predicates are called by the compiled function. The compiled function keeps
+    the name and node of ``predicate``. Trees that are too deep to be compiled are
+    returned as is. Structurally equal predicates, as determined by comparing their
+    :py:class:`Node`, share the same compiled function. Unlike ``predicate``, the
+    compiled function can't be pickled, so pickle ``predicate`` and compile it after
+    unpickling instead.
+    """
+    node = get_node(predicate)
+    # There is nothing to gain from wrapping a predicate that can't be inlined.
+    if node is None and not (
+        isinstance(predicate, FunctionType) and predicate in _leaves
+    ):
+        return predicate
+    cached = _cached(node)
+    if cached is not None:
+        return cached
+    compiler = _Compiler()
+    try:
+        expression = compiler.expression(predicate, "value")
+        source = f"def compiled(value):\n    return {expression}\n"
+        code = compile(source, "<compiled predicate>", "exec")
+    except (SyntaxError, RecursionError, MemoryError):
+        return predicate
+    exec(code, compiler.namespace)  # noqa: S102
+    compiled = functools.update_wrapper(compiler.namespace["compiled"], predicate)
+    if node is not None:
+        # Predicates created by factories keep their node in a slot, which isn't
+        # copied along with the attributes in their __dict__.
+        compiled.__node__ = node  # type: ignore[attr-defined]
+        with contextlib.suppress(TypeError, RecursionError):
+            _compiled[node] = compiled
+    return compiled
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import weakref
+from typing import Final
+from typing import TypeVar
+
+from ._base import Node
+from ._base import Predicate
+from ._base import get_node
+from ._utils import rebuild
+
+T = TypeVar("T")
+
+# Interned predicates are held weakly, so that they're dropped along with the last
+# type or predicate that uses them.
+_interned: Final[weakref.WeakValueDictionary[Node, Predicate]] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _intern(predicate: Predicate) -> Predicate:
+    node = get_node(predicate)
+    if node is None:
+        return predicate
+    try:
+        interned = _interned.get(node)
+    except TypeError:
+        # The predicate has unhashable arguments.
+        return predicate
+    if interned is not None:
+        return interned
+    predicate = rebuild(predicate, node, _intern)
+    return _interned.setdefault(get_node(predicate), predicate)  # type: ignore[arg-type]
+
+
+def intern_predicate(predicate: Predicate[T]) -> Predicate[T]:
+    """
+    Return the interned predicate that is structurally equal to ``predicate``, as
+    determined by comparing their :py:class:`Node`, or intern ``predicate`` if there
+    is no such predicate yet. The predicates among its arguments are interned too, so
+    that structurally equal subtrees are shared. Predicates that weren't created by
+    a factory, that have unhashable arguments, or trees too deep to be interned, are
+    returned as is.
+
+    >>> from phantom.predicates import numeric
+    >>> intern_predicate(numeric.ge(0)) is intern_predicate(numeric.ge(0))
+    True
+    """
+    try:
+        return _intern(predicate)
+    except RecursionError:
+        return predicate
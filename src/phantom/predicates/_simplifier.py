@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from typing import Final
+from typing import TypeVar
+
+from . import boolean
+from . import collection
+from . import interval
+from . import numeric
+from ._base import Predicate
+from ._base import get_node
+from ._utils import rebuild
+from ._utils import unchanged
+
+T = TypeVar("T")
+
+# Factories whose arguments are a tuple of predicates.
+_variadic: Final = frozenset({boolean.all_of, boolean.any_of, boolean.one_of})
+# Factories that take predicates among their arguments, which are simplified in place.
+_composite: Final = frozenset(
+    {
+        boolean.negate,
+        boolean.both,
+        boolean.either,
+        boolean.xor,
+        collection.count,
+        collection.exists,
+        collection.every,
+        numeric.modulo,
+        *_variadic,
+    }
+)
+_conjunctions: Final = frozenset({boolean.both, boolean.all_of})
+_disjunctions: Final = frozenset({boolean.either, boolean.any_of})
+# Maps pairs of lower and upper bound factories to the interval factory they merge
+# into.
+_intervals: Final[dict[tuple[Callable, Callable], Callable]] = {
+    (numeric.ge, numeric.le): interval.inclusive,
+    (numeric.ge, numeric.less): interval.inclusive_exclusive,
+    (numeric.greater, numeric.le): interval.exclusive_inclusive,
+    (numeric.greater, numeric.less): interval.exclusive,
+}
+_lower_bounds: Final = frozenset({numeric.ge, numeric.greater})
+_upper_bounds: Final = frozenset({numeric.le, numeric.less})
+
+
+def _factory(predicate: Predicate) -> Callable | None:
+    node = get_node(predicate)
+    return None if node is None else node.factory
+
+
+def _equivalent(a: Predicate, b: Predicate) -> bool:
+    if a is b:
+        return True
+    node = get_node(a)
+    return node is not None and node == get_node(b)
+
+
+def _deduplicate(predicates: Iterable[Predicate]) -> list[Predicate]:
+    unique: list[Predicate] = []
+    for predicate in predicates:
+        if not any(_equivalent(predicate, seen) for seen in unique):
+            unique.append(predicate)
+    return unique
+
+
+def _flatten(predicates: Iterable[Predicate], factories: frozenset) -> list[Predicate]:
+    # Operands are flattened before they are simplified, so that merging and
+    # deduplicating operates on all operands of the flattened tree at once.
+    flat: list[Predicate] = []
+    for predicate in predicates:
+        node = get_node(predicate)
+        if node is not None and node.factory in factories:
+            flat.extend(_flatten(node.children, factories))
+            continue
+        simplified = _simplify(predicate)
+        node = get_node(simplified)
+        if node is not None and node.factory in factories:
+            flat.extend(node.children)
+        else:
+            flat.append(simplified)
+    return flat
+
+
+def _merge_bounds(predicates: list[Predicate]) -> list[Predicate]:
+    merged: list[Predicate] = []
+    for predicate in predicates:
+        previous = merged[-1] if merged else None
+        if previous is not None:
+            pair = (_factory(previous), _factory(predicate))
+            if pair[0] in _upper_bounds and pair[1] in _lower_bounds:
+                pair = pair[1], pair[0]
+                lower, upper = predicate, previous
+            else:
+                lower, upper = previous, predicate
+            factory = _intervals.get(pair)  # type: ignore[arg-type]
+            if factory is not None:
+                low = get_node(lower).args[0]  # type: ignore[union-attr]
+                high = get_node(upper).args[0]  # type: ignore[union-attr]
+                merged[-1] = factory(low, high)
+                continue
+        merged.append(predicate)
+    return merged
+
+
+def _conjunction(predicate: Predicate, children: tuple[Predicate, ...]) -> Predicate:
+    flat = _flatten(children, _conjunctions)
+    if boolean.false in flat:
+        return boolean.false
+    terms = _merge_bounds(_deduplicate(p for p in flat if p is not boolean.true))
+    if not terms:
+        return boolean.true
+    if unchanged(tuple(terms), get_node(predicate).children):  # type: ignore[union-attr]
+        return predicate
+    if len(terms) == 1:
+        return terms[0]
+    if len(terms) == 2:
+        return boolean.both(*terms)
+    return boolean.all_of(terms)
+
+
+def _disjunction(predicate: Predicate, children: tuple[Predicate, ...]) -> Predicate:
+    flat = _flatten(children, _disjunctions)
+    if boolean.true in flat:
+        return boolean.true
+    terms = _deduplicate(p for p in flat if p is not boolean.false)
+    if not terms:
+        return boolean.false
+    if unchanged(tuple(terms), get_node(predicate).children):  # type: ignore[union-attr]
+        return predicate
+    if len(terms) == 1:
+        return terms[0]
+    if len(terms) == 2:
+        return boolean.either(*terms)
+    return boolean.any_of(terms)
+
+
+def _negation(predicate: Predicate) -> Predicate:
+    if predicate is boolean.true:
+        return boolean.false
+    if predicate is boolean.false:
+        return boolean.true
+    node = get_node(predicate)
+    if node is not None and node.factory is boolean.negate:
+        return node.children[0]
+    return boolean.negate(predicate)
+
+
+def _simplify(predicate: Predicate) -> Predicate:
+    node = get_node(predicate)
+    if node is None or node.factory not in _composite:
+        return predicate
+    if node.factory in _conjunctions:
+        return _conjunction(predicate, node.children)
+    if node.factory in _disjunctions:
+        return _disjunction(predicate, node.children)
+    if node.factory is boolean.negate:
+        return _negation(_simplify(node.children[0]))
+    return rebuild(predicate, node, _simplify)
+
+
+def simplify_predicate(predicate: Predicate[T]) -> Predicate[T]:
+    """
+    Return a predicate that is equivalent to ``predicate``, with its tree of
+    predicates simplified. Nested conjunctions and disjunctions are flattened,
+    constant :py:func:`boolean.true <phantom.predicates.boolean.true>` and
+    :py:func:`boolean.false <phantom.predicates.boolean.false>` operands are folded,
+    double negations are removed and duplicate operands are dropped. Adjacent lower
+    and upper bounds in conjunctions, e.g. ``ge(a)`` and ``le(b)``, are merged into
+    an interval, e.g. ``inclusive(a, b)``. Operands are otherwise kept in order, so
+    that short-circuiting still guards later operands. Predicates that can't be
+    simplified, or trees too deep to be simplified, are returned as is.
+    """
+    try:
+        return _simplify(predicate)
+    except RecursionError:
+        return predicate
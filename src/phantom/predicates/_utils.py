@@ -1,12 +1,21 @@
+from __future__ import annotations
+
 from collections.abc import Callable
 from functools import partial
+from typing import Generic
+from typing import Protocol
 from typing import TypeVar
 
+from phantom.errors import truncated_repr
+
+from ._base import Node
+from ._base import Predicate
+
 
 def _explode_partial(obj: partial) -> str:
-    positional_args = ", ".join(map(repr, obj.args))
+    positional_args = ", ".join(map(truncated_repr, obj.args))
     keyword_args = ", ".join(
-        f"{name}={value!r}" for name, value in obj.keywords.items()
+        f"{name}={truncated_repr(value)}" for name, value in obj.keywords.items()
     )
     args = ", ".join((positional_args, keyword_args))
     return f"{obj.func.__qualname__}({args})"
@@ -18,10 +27,11 @@ def _name_or_repr(obj: object) -> str:
     try:
         return str(obj.__qualname__)  # type: ignore[attr-defined]
     except AttributeError:
-        return repr(obj)
+        return truncated_repr(obj)
 
 
 B = TypeVar("B", bound=Callable)
+T = TypeVar("T")
 
 
 def bind_name(wrapped: Callable, *values: object) -> Callable[[B], B]:
@@ -34,3 +44,98 @@ def bind_name(wrapped: Callable, *values: object) -> Callable[[B], B]:
         return inner
 
     return decorator
+
+
+class _FactoryPredicate(Generic[T]):
+    # A predicate created by a factory. Calls are forwarded to the function that
+    # implements it. Functions always pickle by reference, which fails for closures,
+    # so this pickles by value instead, as the factory and arguments of its node.
+
+    __slots__ = ("__name__", "__node__", "__qualname__", "__weakref__", "__wrapped__")
+
+    def __init__(self, function: Callable[[T], bool], node: Node) -> None:
+        self.__wrapped__ = function
+        self.__node__ = node
+        self.__name__ = function.__name__
+        self.__qualname__ = function.__qualname__
+
+    def __call__(self, value: T) -> bool:
+        return self.__wrapped__(value)
+
+    def __repr__(self) -> str:
+        return f"<function {self.__qualname__} at {id(self):#x}>"
+
+    def __reduce__(self) -> tuple[Callable[..., Predicate], tuple[object, ...]]:
+        return self.__node__.factory, self.__node__.args
+
+
+def unwrap(predicate: Predicate[T]) -> Predicate[T]:
+    """
+    Return the function that implements ``predicate`` if it was created by a factory,
+    and otherwise ``predicate`` itself. Predicates composed of others call their
+    operands through this, to skip a call to the wrapper for every level of nesting.
+    """
+    if type(predicate) is _FactoryPredicate:
+        return predicate.__wrapped__
+    return predicate
+
+
+class _Binder(Protocol):
+    def __call__(self, inner: Callable[[T], bool], /) -> Predicate[T]: ...
+
+
+def bind_node(
+    factory: Callable[..., Predicate],
+    *args: object,
+    children: tuple[Predicate, ...] = (),
+    name_values: tuple[object, ...] | None = None,
+) -> _Binder:
+    """
+    Attach a :py:class:`Node` describing the predicate created by calling ``factory``
+    with ``args``, and bind its name as :py:func:`bind_name` does, from
+    ``name_values`` if given and otherwise from ``args``.
+
+    The decorated function is wrapped in a callable that exposes its name and node,
+    and that pickles by value, by calling ``factory`` with ``args`` again.
+    """
+    node = Node(factory, args, children)
+    bind = bind_name(factory, *(args if name_values is None else name_values))
+
+    def decorator(inner: Callable[[T], bool]) -> Predicate[T]:
+        return _FactoryPredicate(bind(inner), node)
+
+    return decorator
+
+
+def unchanged(new: tuple[object, ...], old: tuple[object, ...]) -> bool:
+    """
+    Return whether the items of ``new`` are identical to those of ``old``, comparing
+    nested tuples item by item.
+    """
+    return len(new) == len(old) and all(
+        unchanged(a, b) if isinstance(a, tuple) and isinstance(b, tuple) else a is b
+        for a, b in zip(new, old, strict=True)
+    )
+
+
+def rebuild(
+    predicate: Predicate,
+    node: Node,
+    function: Callable[[Predicate], Predicate],
+) -> Predicate:
+    """
+    Apply ``function`` to the predicates among the arguments that ``predicate`` was
+    created with, as described by ``node``, and create a new predicate from the
+    results with the same factory. ``predicate`` is returned as is when ``function``
+    returns every predicate unchanged.
+    """
+
+    def apply(arg: object) -> object:
+        if isinstance(arg, tuple):
+            return tuple(map(apply, arg))
+        return function(arg) if callable(arg) else arg
+
+    args = tuple(map(apply, node.args))
+    if unchanged(args, node.args):
+        return predicate
+    return node.factory(*args)
@@ -0,0 +1,201 @@
+"""
+Opt-in adaptive evaluation order for conjunctions and disjunctions of predicates.
+
+Predicates created by :py:func:`~phantom.predicates.boolean.all_of`,
+:py:func:`~phantom.predicates.boolean.both`,
+:py:func:`~phantom.predicates.boolean.any_of` and
+:py:func:`~phantom.predicates.boolean.either` evaluate their operands in declaration
+order. Wrapping them with :py:func:`adaptive` instead samples the cost and outcome of
+each operand at runtime, and evaluates cheap operands that are likely to decide the
+result first.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Sequence
+from typing import Final
+from typing import Generic
+from typing import TypeVar
+
+from . import boolean
+from ._base import Predicate
+from ._base import get_node
+
+T_contra = TypeVar("T_contra", bound=object, contravariant=True)
+
+_conjunctions: Final = frozenset({boolean.both, boolean.all_of})
+_disjunctions: Final = frozenset({boolean.either, boolean.any_of})
+
+
+class AdaptivePredicate(Generic[T_contra]):
+    """
+    A conjunction or disjunction of predicates that reorders its operands based on
+    their sampled cost and selectivity. Created by :py:func:`adaptive`.
+
+    The first ``warmup`` calls, and then every ``sample_every``-th call, evaluate all
+    operands, recording the time each takes and whether it decided the result, i.e.
+    failed for a conjunction or succeeded for a disjunction. Operands are then ordered
+    by their mean cost divided by the rate at which they decide the result, so that
+    cheap operands with high rejection rates run first. Other calls short-circuit in
+    the learned order.
+
+    Threads calling the same adaptive predicate share its statistics, which are
+    updated without locking. Concurrent updates may lose samples, which affects the
+    learned order but never the result.
+    """
+
+    __slots__ = (
+        "__name__",
+        "__qualname__",
+        "_calls",
+        "_costs",
+        "_decisions",
+        "_disjunction",
+        "_frozen",
+        "_order",
+        "_sample_every",
+        "_warmup",
+        "operands",
+    )
+
+    def __init__(
+        self,
+        operands: Sequence[Predicate[T_contra]],
+        *,
+        disjunction: bool,
+        name: str,
+        warmup: int,
+        sample_every: int,
+    ) -> None:
+        self.__name__ = self.__qualname__ = name
+        self.operands: Final = tuple(operands)
+        self._disjunction = disjunction
+        self._warmup = warmup
+        self._sample_every = sample_every
+        self._calls = 0
+        self._order = self.operands
+        self._costs = [0] * len(self.operands)
+        self._decisions = [0] * len(self.operands)
+        self._frozen = False
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.__name__}>"
+
+    def __call__(self, value: T_contra) -> bool:
+        if not self._frozen:
+            self._calls += 1
+            if self._calls <= self._warmup or self._calls % self._sample_every == 0:
+                return self._sample(value)
+        # Indexing avoids allocating an iterator on every call.
+        order = self._order
+        count = len(order)
+        index = 0
+        if self._disjunction:
+            while index < count:
+                if order[index](value):
+                    return True
+                index += 1
+            return False
+        while index < count:
+            if not order[index](value):
+                return False
+            index += 1
+        return True
+
+    def _sample(self, value: T_contra) -> bool:
+        decided = False
+        for index, predicate in enumerate(self.operands):
+            start = time.perf_counter_ns()
+            outcome = bool(predicate(value))
+            self._costs[index] += time.perf_counter_ns() - start
+            if outcome is self._disjunction:
+                self._decisions[index] += 1
+                decided = True
+        self._reorder()
+        return decided if self._disjunction else not decided
+
+    def _rank(self, index: int) -> float:
+        decisions = self._decisions[index]
+        if not decisions:
+            return math.inf
+        return self._costs[index] / decisions
+
+    def _reorder(self) -> None:
+        # Sorting is stable, so operands that are never sampled to decide the result
+        # keep their declaration order, last.
+        indices = sorted(range(len(self.operands)), key=self._rank)
+        self._order = tuple(self.operands[index] for index in indices)
+
+    @property
+    def order(self) -> tuple[Predicate[T_contra], ...]:
+        """The order that operands are currently evaluated in."""
+        return self._order
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the evaluation order is frozen."""
+        return self._frozen
+
+    def freeze(self, order: Sequence[Predicate[T_contra]] | None = None) -> None:
+        """
+        Stop sampling and keep evaluating operands in the current order, or in
+        ``order`` if given, which must be a permutation of the operands.
+        """
+        if order is not None:
+            order = tuple(order)
+            if sorted(map(id, order)) != sorted(map(id, self.operands)):
+                raise ValueError("Order must be a permutation of the operands")
+            self._order = order
+        self._frozen = True
+
+    def thaw(self) -> None:
+        """Resume sampling and reordering operands."""
+        self._frozen = False
+
+
+def adaptive(
+    predicate: Predicate[T_contra],
+    *,
+    warmup: int = 100,
+    sample_every: int = 100,
+) -> AdaptivePredicate[T_contra]:
+    """
+    Create an :py:class:`AdaptivePredicate` that evaluates the operands of
+    ``predicate`` in an order learned at runtime. ``predicate`` must be created by
+    :py:func:`~phantom.predicates.boolean.all_of`,
+    :py:func:`~phantom.predicates.boolean.both`,
+    :py:func:`~phantom.predicates.boolean.any_of` or
+    :py:func:`~phantom.predicates.boolean.either`.
+
+    The result is identical to that of ``predicate`` as long as its operands are pure,
+    and don't rely on being guarded by earlier operands, e.g. an operand that's only
+    valid for values that an earlier type check accepts. As the adaptive predicate
+    evaluates all operands of sampled calls, it always returns a :py:class:`bool`.
+
+    >>> from phantom.predicates import boolean, generic, numeric
+    >>> check = adaptive(boolean.both(numeric.positive, generic.equal(0)))
+    >>> [check(value) for value in range(-2, 3)]
+    [False, False, False, False, False]
+    >>> check.freeze([check.operands[1], check.operands[0]])
+    >>> [predicate.__name__ for predicate in check.order]
+    ['equal(0)', 'positive']
+    """
+    if warmup < 0:
+        raise ValueError("Warmup must not be negative")
+    if sample_every < 1:
+        raise ValueError("Sample interval must be at least 1")
+    node = get_node(predicate)
+    if node is None or node.factory not in _conjunctions | _disjunctions:
+        raise TypeError(
+            f"Expected a predicate created by all_of, both, any_of or either, got "
+            f"{predicate!r}"
+        )
+    return AdaptivePredicate(
+        node.children,
+        disjunction=node.factory in _disjunctions,
+        name=f"adaptive({predicate.__name__})",
+        warmup=warmup,
+        sample_every=sample_every,
+    )
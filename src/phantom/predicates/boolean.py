@@ -3,7 +3,8 @@ from typing import Literal
 from typing import TypeVar
 
 from . import Predicate
-from ._utils import bind_name
+from ._utils import bind_node
+from ._utils import unwrap
 
 T_contra = TypeVar("T_contra", bound=object, contravariant=True)
 
@@ -20,10 +21,11 @@ def false(_value: object) -> Literal[False]:
 
 def negate(predicate: Predicate[T_contra]) -> Predicate[T_contra]:
     """Negate a given predicate."""
+    call = unwrap(predicate)
 
-    @bind_name(negate, predicate)
+    @bind_node(negate, predicate, children=(predicate,))
     def check(value: T_contra) -> bool:
-        return not predicate(value)
+        return not call(value)
 
     return check
 
@@ -35,7 +37,7 @@ def truthy(value: object) -> bool:
 
 def falsy(value: object) -> bool:
     """Return :py:const:`True` for falsy objects."""
-    return negate(truthy)(value)
+    return not value
 
 
 def both(p: Predicate[T_contra], q: Predicate[T_contra]) -> Predicate[T_contra]:
@@ -43,9 +45,11 @@ def both(p: Predicate[T_contra], q: Predicate[T_contra]) -> Predicate[T_contra]:
     Create a new predicate that succeeds when both of the given predicates succeed.
     """
 
-    @bind_name(both, p, q)
+    call_p, call_q = unwrap(p), unwrap(q)
+
+    @bind_node(both, p, q, children=(p, q))
     def check(value: T_contra) -> bool:
-        return p(value) and q(value)
+        return call_p(value) and call_q(value)
 
     return check
 
@@ -56,9 +60,11 @@ def either(p: Predicate[T_contra], q: Predicate[T_contra]) -> Predicate[T_contra
     succeed.
     """
 
-    @bind_name(either, p, q)
+    call_p, call_q = unwrap(p), unwrap(q)
+
+    @bind_node(either, p, q, children=(p, q))
     def check(value: T_contra) -> bool:
-        return p(value) or q(value)
+        return call_p(value) or call_q(value)
 
     return check
 
@@ -69,9 +75,11 @@ def xor(p: Predicate[T_contra], q: Predicate[T_contra]) -> Predicate[T_contra]:
     not both.
     """
 
-    @bind_name(xor, p, q)
+    call_p, call_q = unwrap(p), unwrap(q)
+
+    @bind_node(xor, p, q, children=(p, q))
     def check(value: T_contra) -> bool:
-        return p(value) ^ q(value)
+        return call_p(value) ^ call_q(value)
 
     return check
 
@@ -79,10 +87,18 @@ def xor(p: Predicate[T_contra], q: Predicate[T_contra]) -> Predicate[T_contra]:
 def all_of(predicates: Iterable[Predicate[T_contra]]) -> Predicate[T_contra]:
     """Create a new predicate that succeeds when all of the given predicates succeed."""
     predicates = tuple(predicates)
+    calls = tuple(map(unwrap, predicates))
+    count = len(calls)
 
-    @bind_name(all_of, *predicates)
+    @bind_node(all_of, predicates, children=predicates, name_values=predicates)
     def check(value: T_contra) -> bool:
-        return all(p(value) for p in predicates)
+        # Indexing avoids allocating an iterator on every call.
+        index = 0
+        while index < count:
+            if not calls[index](value):
+                return False
+            index += 1
+        return True
 
     return check
 
@@ -93,10 +109,17 @@ def any_of(predicates: Iterable[Predicate[T_contra]]) -> Predicate[T_contra]:
     succeed.
     """
     predicates = tuple(predicates)
+    calls = tuple(map(unwrap, predicates))
+    count = len(calls)
 
-    @bind_name(any_of, *predicates)
+    @bind_node(any_of, predicates, children=predicates, name_values=predicates)
     def check(value: T_contra) -> bool:
-        return any(p(value) for p in predicates)
+        index = 0
+        while index < count:
+            if calls[index](value):
+                return True
+            index += 1
+        return False
 
     return check
 
@@ -107,9 +130,20 @@ def one_of(predicates: Iterable[Predicate[T_contra]]) -> Predicate[T_contra]:
     succeed.
     """
     predicates = tuple(predicates)
+    calls = tuple(map(unwrap, predicates))
+    count = len(calls)
 
-    @bind_name(one_of, *predicates)
+    @bind_node(one_of, predicates, children=predicates, name_values=predicates)
     def check(value: T_contra) -> bool:
-        return sum(p(value) for p in predicates) == 1
+        # Stop as soon as a second predicate succeeds.
+        succeeded = False
+        index = 0
+        while index < count:
+            if calls[index](value):
+                if succeeded:
+                    return False
+                succeeded = True
+            index += 1
+        return succeeded
 
     return check
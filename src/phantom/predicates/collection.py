@@ -4,13 +4,14 @@ from collections.abc import Sized
 from typing import TypeVar
 
 from . import Predicate
-from ._utils import bind_name
+from ._utils import bind_node
+from ._utils import unwrap
 
 
 def contains(value: object) -> Predicate[Container]:
     """Create a new predicate that succeeds when its argument contains ``value``."""
 
-    @bind_name(contains, value)
+    @bind_node(contains, value)
     def compare(container: Container) -> bool:
         return value in container
 
@@ -23,7 +24,7 @@ def contained(container: Container) -> Predicate[object]:
     ``container``.
     """
 
-    @bind_name(contained, container)
+    @bind_node(contained, container)
     def compare(value: object) -> bool:
         return value in container
 
@@ -36,9 +37,11 @@ def count(predicate: Predicate[int]) -> Predicate[Sized]:
     ``predicate``.
     """
 
-    @bind_name(count, predicate)
+    call = unwrap(predicate)
+
+    @bind_node(count, predicate, children=(predicate,))
     def compare(sized: Sized) -> bool:
-        return predicate(len(sized))
+        return call(len(sized))
 
     return compare
 
@@ -52,9 +55,15 @@ def exists(predicate: Predicate[_O]) -> Predicate[Iterable]:
     ``predicate``.
     """
 
-    @bind_name(exists, predicate)
+    call = unwrap(predicate)
+
+    @bind_node(exists, predicate, children=(predicate,))
     def compare(iterable: Iterable) -> bool:
-        return any(predicate(item) for item in iterable)
+        # A loop avoids allocating a generator on every call.
+        for item in iterable:  # noqa: SIM110
+            if call(item):
+                return True
+        return False
 
     return compare
 
@@ -65,8 +74,13 @@ def every(predicate: Predicate[_O]) -> Predicate[Iterable]:
     ``predicate``.
     """
 
-    @bind_name(every, predicate)
+    call = unwrap(predicate)
+
+    @bind_node(every, predicate, children=(predicate,))
     def compare(iterable: Iterable) -> bool:
-        return all(predicate(item) for item in iterable)
+        for item in iterable:  # noqa: SIM110
+            if not call(item):
+                return False
+        return True
 
     return compare
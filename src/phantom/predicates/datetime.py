@@ -1,7 +1,5 @@
 import datetime
 
-from .boolean import negate
-
 
 def is_tz_aware(dt: datetime.datetime) -> bool:
     """Return :py:const:`True` if ``dt`` is timezone aware."""
@@ -11,4 +9,4 @@ def is_tz_aware(dt: datetime.datetime) -> bool:
 
 def is_tz_naive(dt: datetime.datetime) -> bool:
     """Return :py:const:`True` if ``dt`` is timezone naive."""
-    return negate(is_tz_aware)(dt)
+    return not is_tz_aware(dt)
@@ -1,15 +1,55 @@
+import random
+from collections.abc import Iterable
+from collections.abc import Sequence
+from collections.abc import Sized
+from dataclasses import dataclass
+from itertools import islice
+from typing import TypeAlias
+from typing import TypeVar
+from typing import cast
+
 import typeguard
 from typeguard import CollectionCheckStrategy
 from typeguard import ForwardRefPolicy
 
 from . import Predicate
-from ._utils import bind_name
+from ._base import identity_factories
+from ._utils import bind_node
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SampleItems:
+    """
+    Collection check strategy that checks ``k`` randomly sampled items of collections,
+    and can be used where a :py:class:`typeguard.CollectionCheckStrategy` is accepted.
+    Collections that don't support indexing, such as sets, have their first ``k``
+    items in iteration order checked.
+    """
+
+    k: int
+
+    def __post_init__(self) -> None:
+        if self.k < 1:
+            raise ValueError("Sample size must be at least 1")
+
+    def iterate_samples(self, collection: Iterable[T]) -> Iterable[T]:
+        if isinstance(collection, Sized) and len(collection) <= self.k:
+            return collection
+        if isinstance(collection, Sequence):
+            indices = random.sample(range(len(collection)), self.k)
+            return [collection[index] for index in indices]
+        return islice(collection, self.k)
+
+
+CollectionCheck: TypeAlias = CollectionCheckStrategy | SampleItems
 
 
 def equal(a: object) -> Predicate[object]:
     """Create a new predicate that succeeds when its argument is equal to ``a``."""
 
-    @bind_name(equal, a)
+    @bind_node(equal, a)
     def check(b: object) -> bool:
         return a == b
 
@@ -19,27 +59,46 @@ def equal(a: object) -> Predicate[object]:
 def identical(a: object) -> Predicate[object]:
     """Create a new predicate that succeeds when its argument is identical to ``a``."""
 
-    @bind_name(identical, a)
+    @bind_node(identical, a)
     def check(b: object) -> bool:
         return a is b
 
     return check
 
 
+identity_factories.add(identical)
+
+
 def of_type(t: type | tuple[type, ...]) -> Predicate[object]:
     """
     Create a new predicate that succeeds when its argument is an instance of ``t``.
     """
 
-    @bind_name(of_type, t)
+    @bind_node(of_type, t)
     def check(a: object) -> bool:
         return isinstance(a, t)
 
     return check
 
 
-def of_complex_type(t: type) -> Predicate[object]:
-    @bind_name(of_complex_type, t)
+def of_complex_type(
+    t: type,
+    collection_check: CollectionCheck = CollectionCheckStrategy.ALL_ITEMS,
+) -> Predicate[object]:
+    """
+    Create a new predicate that succeeds when its argument is compatible with the type
+    annotation ``t``, as checked by typeguard. ``collection_check`` determines which
+    items of collections are checked.
+    """
+    # SampleItems implements the same interface as CollectionCheckStrategy.
+    strategy = cast(CollectionCheckStrategy, collection_check)
+    name_args = (
+        (t,)
+        if collection_check is CollectionCheckStrategy.ALL_ITEMS
+        else (t, collection_check)
+    )
+
+    @bind_node(of_complex_type, t, collection_check, name_values=name_args)
     def check(a: object) -> bool:
         try:
             typeguard.check_type(
@@ -47,7 +106,7 @@ def of_complex_type(t: type) -> Predicate[object]:
                 expected_type=t,
                 typecheck_fail_callback=None,
                 forward_ref_policy=ForwardRefPolicy.ERROR,
-                collection_check_strategy=CollectionCheckStrategy.ALL_ITEMS,
+                collection_check_strategy=strategy,
             )
         except typeguard.TypeCheckError:
             return False
@@ -12,7 +12,7 @@ from phantom._utils.types import SupportsLtGe
 from phantom._utils.types import SupportsLtGt
 
 from ._base import Predicate
-from ._utils import bind_name
+from ._utils import bind_node
 
 T = TypeVar("T")
 
@@ -22,7 +22,7 @@ def exclusive(low: T, high: T) -> Predicate[SupportsLtGt[T]]:
     Create a predicate that succeeds when its argument is in the range ``(low, high)``.
     """
 
-    @bind_name(exclusive, low, high)
+    @bind_node(exclusive, low, high)
     def check(value: SupportsLtGt[T]) -> bool:
         return low < value < high
 
@@ -34,7 +34,7 @@ def exclusive_inclusive(low: T, high: T) -> Predicate[SupportsLeGt[T]]:
     Create a predicate that succeeds when its argument is in the range ``(low, high]``.
     """
 
-    @bind_name(exclusive_inclusive, low, high)
+    @bind_node(exclusive_inclusive, low, high)
     def check(value: SupportsLeGt[T]) -> bool:
         return low < value <= high
 
@@ -46,7 +46,7 @@ def inclusive_exclusive(low: T, high: T) -> Predicate[SupportsLtGe[T]]:
     Create a predicate that succeeds when its argument is in the range ``[low, high)``.
     """
 
-    @bind_name(inclusive_exclusive, low, high)
+    @bind_node(inclusive_exclusive, low, high)
     def check(value: SupportsLtGe[T]) -> bool:
         return low <= value < high
 
@@ -58,7 +58,7 @@ def inclusive(low: T, high: T) -> Predicate[SupportsLeGe[T]]:
     Create a predicate that succeeds when its argument is in the range ``[low, high]``.
     """
 
-    @bind_name(inclusive, low, high)
+    @bind_node(inclusive, low, high)
     def check(value: SupportsLeGe[T]) -> bool:
         return low <= value <= high
 
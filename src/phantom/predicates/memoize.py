@@ -0,0 +1,310 @@
+"""
+Opt-in memoization of expensive predicates.
+
+Predicates are pure, so for hashable values their verdicts can be remembered instead
+of recomputed. :py:func:`memoize` wraps a predicate with a bounded cache of its most
+recently used verdicts, which pays off for costly predicates, such as
+:py:func:`phantom.ext.phonenumbers.is_phone_number` or
+:py:func:`~phantom.predicates.generic.of_complex_type`, that are repeatedly called
+with the same values.
+
+:py:func:`memoize_by_identity` instead remembers verdicts for the objects that were
+checked, which makes checking the same large immutable value again cheap, even when
+the value is unhashable or expensive to hash and compare.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+import threading
+import weakref
+from typing import Final
+from typing import Generic
+from typing import NamedTuple
+from typing import TypeVar
+
+from phantom._utils.misc import is_not_known_mutable_instance
+
+from ._base import Predicate
+from ._utils import _name_or_repr
+
+T_contra = TypeVar("T_contra", bound=object, contravariant=True)
+
+default_maxsize: Final = 4096
+default_max_bytes: Final = 64 * 1024 * 1024
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the cache of a :py:class:`MemoizedPredicate`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class MemoizedPredicate(Generic[T_contra]):
+    """
+    A predicate that remembers the verdicts of at most ``maxsize`` values, evicting
+    the least recently used verdict when full. Created by :py:func:`memoize`.
+
+    Values are cached by their type and value, such that e.g. ``1`` and ``1.0`` have
+    separate verdicts. Unhashable values are passed on to the wrapped predicate
+    without being cached.
+
+    Verdicts are held by a :py:func:`functools.lru_cache`, which is safe to share
+    between threads, and doesn't hold its lock while calling the wrapped predicate.
+    Threads that miss the same value at the same time may then both compute its
+    verdict.
+    """
+
+    __slots__ = ("__name__", "__qualname__", "_cached", "maxsize", "predicate")
+
+    def __init__(self, predicate: Predicate[T_contra], maxsize: int) -> None:
+        self.__name__ = self.__qualname__ = f"memoize({_name_or_repr(predicate)})"
+        self.predicate: Final = predicate
+        self.maxsize: Final = maxsize
+        self._cached = functools.lru_cache(maxsize=maxsize, typed=True)(predicate)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.__name__}>"
+
+    def __reduce__(
+        self,
+    ) -> tuple[type[MemoizedPredicate], tuple[Predicate[T_contra], int]]:
+        # Pickles without the cached verdicts.
+        return type(self), (self.predicate, self.maxsize)
+
+    def __call__(self, value: T_contra) -> bool:
+        try:
+            return self._cached(value)
+        except TypeError:
+            # Unhashable values are only told apart from predicates raising
+            # TypeError when it's raised, to keep the common path free of it.
+            try:
+                hash(value)
+            except TypeError:
+                return self.predicate(value)
+            raise
+
+    def cache_info(self) -> CacheInfo:
+        """Return the number of hits, misses and evictions, and the cache size."""
+        hits, misses, _, currsize = self._cached.cache_info()
+        # Every miss stores a verdict, so those that aren't held were evicted.
+        return CacheInfo(hits, misses, misses - currsize, self.maxsize, currsize)
+
+    def cache_clear(self) -> None:
+        """Forget all verdicts and reset the statistics."""
+        self._cached.cache_clear()
+
+
+def memoize(
+    predicate: Predicate[T_contra],
+    *,
+    maxsize: int = default_maxsize,
+) -> MemoizedPredicate[T_contra]:
+    """
+    Create a :py:class:`MemoizedPredicate` that remembers the verdicts of
+    ``predicate`` for the ``maxsize`` most recently checked values.
+
+    The result is identical to that of ``predicate`` as long as it's pure, and its
+    verdict only depends on what values compare equal to, which holds for values of
+    immutable types.
+
+    >>> import re
+    >>> from phantom.predicates.re import is_full_match
+    >>> check = memoize(is_full_match(re.compile(r"[a-z]+")), maxsize=2)
+    >>> [check(value) for value in ("a", "b", "a", "1", "b")]
+    [True, True, True, False, True]
+    >>> check.cache_info()
+    CacheInfo(hits=1, misses=4, evictions=2, maxsize=2, currsize=2)
+    """
+    if maxsize < 1:
+        raise ValueError("Cache size must be at least 1")
+    return MemoizedPredicate(predicate, maxsize)
+
+
+def _held_size(value: object, limit: int) -> int:
+    """
+    Return the size of ``value``, including the items of tuples and frozensets,
+    recursively. Stops counting once the size exceeds ``limit``.
+    """
+    size = 0
+    pending = [value]
+    while pending and size <= limit:
+        item = pending.pop()
+        size += sys.getsizeof(item)
+        if isinstance(item, (tuple, frozenset)):
+            pending.extend(item)
+    return size
+
+
+class IdentityMemoizedPredicate(Generic[T_contra]):
+    """
+    A predicate that remembers the verdicts of at most ``maxsize`` objects, evicting
+    the verdict of the oldest object when full. Created by
+    :py:func:`memoize_by_identity`.
+
+    Verdicts are keyed by the :py:func:`id` of the checked object, which is only
+    unique while the object is alive. Objects that support weak references are held
+    weakly, and their verdicts are dropped when they're collected. Other objects are
+    held by the cache, up to a total of ``max_bytes`` as measured by
+    :py:func:`sys.getsizeof`, adding the sizes of the items of tuples and frozensets,
+    recursively, as holding a collection holds its items alive too. Items that occur
+    more than once are counted each time. Objects of types that are known to be
+    mutable, such as lists and dataclasses that aren't frozen, are passed on to the
+    wrapped predicate without being cached.
+
+    The cache is guarded by a lock, which isn't held while calling the wrapped
+    predicate. The lock is reentrant, as evicting an object may collect weakly held
+    objects that it references.
+    """
+
+    __slots__ = (
+        "__name__",
+        "__qualname__",
+        "_bytes",
+        "_entries",
+        "_evictions",
+        "_hits",
+        "_lock",
+        "_misses",
+        "max_bytes",
+        "maxsize",
+        "predicate",
+    )
+
+    def __init__(
+        self,
+        predicate: Predicate[T_contra],
+        maxsize: int,
+        max_bytes: int,
+    ) -> None:
+        self.__name__ = self.__qualname__ = (
+            f"memoize_by_identity({_name_or_repr(predicate)})"
+        )
+        self.predicate: Final = predicate
+        self.maxsize: Final = maxsize
+        self.max_bytes: Final = max_bytes
+        # Maps ids of objects to the object, or a weak reference to it, the verdict,
+        # and the number of bytes held by the cache.
+        self._entries: dict[int, tuple[object, bool, int]] = {}
+        self._lock = threading.RLock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.__name__}>"
+
+    def __reduce__(
+        self,
+    ) -> tuple[type[IdentityMemoizedPredicate], tuple[Predicate[T_contra], int, int]]:
+        # Pickles without the cached verdicts.
+        return type(self), (self.predicate, self.maxsize, self.max_bytes)
+
+    def __call__(self, value: T_contra) -> bool:
+        if not is_not_known_mutable_instance(value):
+            return self.predicate(value)
+        key = id(value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                held, verdict, size = entry
+                # Entries of weakly held objects have no size. They're removed while
+                # the object is collected, before its id can be reused.
+                if held is value or (not size and held() is value):  # type: ignore[operator]
+                    self._hits += 1
+                    return verdict
+        verdict = self.predicate(value)
+        self._store(key, value, verdict)
+        return verdict
+
+    def _store(self, key: int, value: object, verdict: bool) -> None:
+        held: object
+        if type(value).__weakrefoffset__:
+            held = weakref.ref(value, functools.partial(self._forget, key))
+            size = 0
+        else:
+            held = value
+            size = _held_size(value, self.max_bytes)
+            if size > self.max_bytes:
+                with self._lock:
+                    self._misses += 1
+                return
+        with self._lock:
+            self._misses += 1
+            entries = self._entries
+            previous = entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            while entries and (
+                len(entries) >= self.maxsize or self._bytes + size > self.max_bytes
+            ):
+                self._bytes -= entries.pop(next(iter(entries)))[2]
+                self._evictions += 1
+            entries[key] = held, verdict, size
+            self._bytes += size
+
+    def _forget(self, key: int, ref: weakref.ref) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+    def cache_info(self) -> CacheInfo:
+        """Return the number of hits, misses and evictions, and the cache size."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    @property
+    def held_bytes(self) -> int:
+        """The total size of the objects held by the cache."""
+        return self._bytes
+
+    def cache_clear(self) -> None:
+        """Forget all verdicts and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = self._hits = self._misses = self._evictions = 0
+
+
+def memoize_by_identity(
+    predicate: Predicate[T_contra],
+    *,
+    maxsize: int = default_maxsize,
+    max_bytes: int = default_max_bytes,
+) -> IdentityMemoizedPredicate[T_contra]:
+    """
+    Create an :py:class:`IdentityMemoizedPredicate` that remembers the verdicts of
+    ``predicate`` for the ``maxsize`` most recently checked objects, holding at most
+    ``max_bytes`` of objects alive.
+
+    Checking an object again costs a dictionary lookup, regardless of its size, so
+    this pays off for predicates that walk large immutable values, such as checks
+    against ``tuple[Decimal, ...]``, when the same objects are checked repeatedly.
+    The result is identical to that of ``predicate`` as long as it's pure, and
+    checked objects aren't mutated, which for collections includes their items.
+
+    >>> from phantom.predicates import collection, numeric
+    >>> check = memoize_by_identity(collection.every(numeric.positive))
+    >>> values = tuple(range(1, 1000))
+    >>> check(values), check(values), check((0, *values))
+    (True, True, False)
+    >>> check.cache_info()
+    CacheInfo(hits=1, misses=2, evictions=0, maxsize=4096, currsize=2)
+    """
+    if maxsize < 1:
+        raise ValueError("Cache size must be at least 1")
+    if max_bytes < 0:
+        raise ValueError("Byte limit must not be negative")
+    return IdentityMemoizedPredicate(predicate, maxsize, max_bytes)
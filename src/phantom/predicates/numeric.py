@@ -7,9 +7,8 @@ from phantom._utils.types import SupportsLt
 from phantom._utils.types import SupportsMod
 
 from ._base import Predicate
-from ._utils import bind_name
-from .boolean import negate
-from .generic import equal
+from ._utils import bind_node
+from ._utils import unwrap
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -20,7 +19,7 @@ def less(n: T) -> Predicate[SupportsLt[T]]:
     Create a new predicate that succeeds when its argument is strictly less than ``n``.
     """
 
-    @bind_name(less, n)
+    @bind_node(less, n)
     def check(value: SupportsLt[T]) -> bool:
         return value < n
 
@@ -33,7 +32,7 @@ def le(n: T) -> Predicate[SupportsLe[T]]:
     ``n``.
     """
 
-    @bind_name(le, n)
+    @bind_node(le, n)
     def check(value: SupportsLe[T]) -> bool:
         return value <= n
 
@@ -46,7 +45,7 @@ def greater(n: T) -> Predicate[SupportsGt[T]]:
     ``n``.
     """
 
-    @bind_name(greater, n)
+    @bind_node(greater, n)
     def check(value: SupportsGt[T]) -> bool:
         return value > n
 
@@ -59,7 +58,7 @@ def ge(n: T) -> Predicate[SupportsGe[T]]:
     ``n``.
     """
 
-    @bind_name(ge, n)
+    @bind_node(ge, n)
     def check(value: SupportsGe[T]) -> bool:
         return value >= n
 
@@ -68,22 +67,22 @@ def ge(n: T) -> Predicate[SupportsGe[T]]:
 
 def positive(n: SupportsGt[int]) -> bool:
     """Return :py:const:`True` when ``n`` is strictly greater than zero."""
-    return greater(0)(n)
+    return n > 0
 
 
 def non_positive(n: SupportsLe[int]) -> bool:
     """Return :py:const:`True` when ``n``  is less than or equal to zero."""
-    return le(0)(n)
+    return n <= 0
 
 
 def negative(n: SupportsLt[int]) -> bool:
     """Return :py:const:`True` when ``n`` is strictly less than zero."""
-    return less(0)(n)
+    return n < 0
 
 
 def non_negative(n: SupportsGe[int]) -> bool:
     """Return :py:const:`True` when ``n`` is greater than or equal to zero."""
-    return ge(0)(n)
+    return n >= 0
 
 
 def modulo(n: T, p: Predicate[U]) -> Predicate[SupportsMod[T, U]]:
@@ -92,18 +91,20 @@ def modulo(n: T, p: Predicate[U]) -> Predicate[SupportsMod[T, U]]:
     given predicate ``p``.
     """
 
-    @bind_name(modulo, n, p)
+    call = unwrap(p)
+
+    @bind_node(modulo, n, p, children=(p,))
     def check(value: SupportsMod[T, U]) -> bool:
-        return p(value % n)
+        return call(value % n)
 
     return check
 
 
 def even(n: int) -> bool:
     """Return :py:const:`True`  when ``n`` is even."""
-    return modulo(2, equal(0))(n)
+    return n % 2 == 0
 
 
 def odd(n: int) -> bool:
     """Return :py:const:`True`  when ``n`` is odd."""
-    return negate(even)(n)
+    return n % 2 != 0
@@ -1,7 +1,7 @@
 from re import Pattern
 
 from . import Predicate
-from ._utils import bind_name
+from ._utils import bind_node
 
 
 def is_match(pattern: Pattern[str]) -> Predicate[str]:
@@ -10,7 +10,7 @@ def is_match(pattern: Pattern[str]) -> Predicate[str]:
     given ``pattern``.
     """
 
-    @bind_name(is_match, pattern.pattern)
+    @bind_node(is_match, pattern, name_values=(pattern.pattern,))
     def match(instance: str) -> bool:
         return pattern.match(instance) is not None
 
@@ -23,7 +23,7 @@ def is_full_match(pattern: Pattern[str]) -> Predicate[str]:
     ``pattern``.
     """
 
-    @bind_name(is_full_match, pattern.pattern)
+    @bind_node(is_full_match, pattern, name_values=(pattern.pattern,))
     def full_match(instance: str) -> bool:
         return pattern.fullmatch(instance) is not None
 
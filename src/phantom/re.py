@@ -12,11 +12,14 @@ Types for representing strings that match a pattern.
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from re import Pattern
 from typing import Any
 
 from . import Phantom
 from . import _hypothesis
+from ._base import _check_concrete
+from ._base import _has_plain_check
 from ._utils.misc import resolve_class_attr
 from .predicates.re import is_full_match
 from .predicates.re import is_match
@@ -68,6 +71,17 @@ class FullMatch(str, Phantom, abstract=True):
         resolve_class_attr(cls, "__pattern__", _compile(pattern))
         super().__init_subclass__(predicate=is_full_match(cls.__pattern__), **kwargs)
 
+    @classmethod
+    def is_valid_many(cls, instances: Iterable[object]) -> bytearray:
+        _check_concrete(cls)
+        if cls.__bound__ is not str or not _has_plain_check(cls):
+            return super().is_valid_many(instances)
+        fullmatch = cls.__pattern__.fullmatch
+        return bytearray(
+            isinstance(instance, str) and fullmatch(instance) is not None
+            for instance in instances
+        )
+
     @classmethod
     def __schema__(cls) -> Schema:
         return {
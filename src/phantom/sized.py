@@ -77,6 +77,9 @@ class PhantomSized(
     metaclass=SizedIterablePhantomMeta,
     bound=SizedIterable,
     abstract=True,
+    # Sizes and mutability are cheap to check, and only depend on the runtime type of
+    # values, so bounds with parametrized item types are checked last.
+    predicate_first=True,
 ):
     """
     Takes class argument ``len: Predicate[int]``.
@@ -119,6 +122,9 @@ class PhantomBound(
     metaclass=SizedIterablePhantomMeta,
     bound=SizedIterable,
     abstract=True,
+    # Sizes and mutability are cheap to check, and only depend on the runtime type of
+    # values, so bounds with parametrized item types are checked last.
+    predicate_first=True,
 ):
     """Takes class arguments ``min: int``, ``max: int``."""
 
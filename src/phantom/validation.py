@@ -0,0 +1,373 @@
+"""
+Validation modes, that trade fully checking values for speed when values are known
+to have been validated before, e.g. by an upstream service.
+
+* ``"strict"`` - fully check values. This is the default.
+* ``"sampled"`` - fully check a random fraction of the checks of each type, given by
+  the sample rate, and only check the runtime type of the bound otherwise, e.g.
+  ``tuple`` for ``tuple[int, ...]``.
+* ``"trusted"`` - only check the runtime type of the bound.
+
+Modes apply to instance checks and parsing of predicate-based phantom types, including
+their batch methods, such as ``is_valid_many()``. Types that parse values by other
+means than checking them, such as :py:class:`phantom.iso3166.ParsedAlpha2`, which
+normalizes the case of country codes, only apply modes to instance checks. The
+initial mode and sample rate are read from the ``PHANTOM_VALIDATION`` and
+``PHANTOM_VALIDATION_SAMPLE_RATE`` environment variables. The mode of the whole
+process is changed with :py:func:`set_validation_mode`, and the mode of the current
+context, i.e. thread or :py:mod:`asyncio` task, with :py:func:`validation`. Phantom
+types can fix their mode with the ``validation`` class argument, which takes
+precedence.
+
+.. code-block:: python
+
+    from phantom.validation import validation
+
+    with validation("trusted"):
+        handle(Order.parse(payload))
+
+Until a mode other than strict is first configured, checks don't look up the mode,
+and so cost nothing extra. Worker processes, e.g. of :py:mod:`phantom.parallel`, read
+their mode from the environment, and don't inherit a mode set by their parent.
+
+Values that code guarantees to be valid can be typed as a phantom type without
+checking them at all, with :py:meth:`phantom.PhantomBase.assume`. Whether such
+assumptions are verified is set by :py:func:`set_assumption_verification`, or the
+``PHANTOM_VERIFY_ASSUMPTIONS`` environment variable, e.g. to verify them eagerly in
+test suites.
+
+* ``"skip"`` - don't verify assumptions. This is the default.
+* ``"eager"`` - fully check assumed values, raising
+  :py:class:`~phantom.errors.AssumptionError` for invalid values.
+* ``"deferred"`` - queue assumed values to be fully checked by a background thread,
+  at a limited rate, and report invalid values to a handler.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import queue
+import random
+import threading
+import time
+import warnings
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextvars import ContextVar
+from typing import Final
+from typing import Literal
+from typing import NamedTuple
+from typing import TypeAlias
+from typing import cast
+from typing import get_args
+
+from ._utils import registry
+from ._utils.misc import fully_qualified_name
+from .errors import AssumptionError
+from .errors import LazyMessage
+from .predicates import Predicate
+
+__all__ = (
+    "Mode",
+    "ValidationSetting",
+    "Verification",
+    "default_sample_rate",
+    "get_validation_setting",
+    "set_assumption_verification",
+    "set_validation_mode",
+    "validation",
+    "wait_for_verification",
+)
+
+Mode: TypeAlias = Literal["strict", "sampled", "trusted"]
+_modes: Final = frozenset(get_args(Mode))
+
+default_sample_rate: Final = 0.01
+
+
+class ValidationSetting(NamedTuple):
+    """The validation mode in effect, and the sample rate of the sampled mode."""
+
+    mode: Mode
+    sample_rate: float
+
+
+def _check_mode(mode: str) -> Mode:
+    if mode not in _modes:
+        raise ValueError(f"Invalid validation mode: {mode!r}")
+    return cast(Mode, mode)
+
+
+def _setting(mode: str, sample_rate: float) -> ValidationSetting:
+    checked = _check_mode(mode)
+    if not 0 <= sample_rate <= 1:
+        raise ValueError("Sample rate must be between 0 and 1")
+    return ValidationSetting(checked, sample_rate)
+
+
+def _read_environment() -> ValidationSetting:
+    mode = os.environ.get("PHANTOM_VALIDATION") or "strict"
+    rate = os.environ.get("PHANTOM_VALIDATION_SAMPLE_RATE")
+    try:
+        sample_rate = default_sample_rate if not rate else float(rate)
+    except ValueError:
+        raise ValueError(f"Invalid validation sample rate: {rate!r}") from None
+    return _setting(mode.strip().lower(), sample_rate)
+
+
+_default = _read_environment()
+_context: Final[ContextVar[ValidationSetting | None]] = ContextVar(
+    "phantom_validation", default=None
+)
+
+# Checks only look up the mode once a mode other than strict has been configured,
+# which makes phantom types rebuild their checks to apply it.
+_engaged = _default.mode != "strict"
+_engage_lock: Final = threading.Lock()
+
+
+def _engage() -> None:
+    global _engaged
+    with _engage_lock:
+        if _engaged:
+            return
+        _engaged = True
+    registry.rebuild_checks()
+
+
+def _moderate(
+    full: Predicate[object],
+    trusted: Predicate[object],
+    mode: Mode | None,
+) -> Predicate[object]:
+    """
+    Return the predicate that checks of a phantom type evaluate, given its full
+    check, the check done for trusted values, and the mode that the type fixes, if
+    any.
+    """
+    if mode == "strict" or (mode is None and not _engaged):
+        return full
+    if mode == "trusted":
+        return trusted
+
+    def sampled(instance: object) -> bool:
+        if random.random() < get_validation_setting().sample_rate:  # noqa: S311
+            return full(instance)
+        return trusted(instance)
+
+    if mode == "sampled":
+        return sampled
+
+    def moderated(instance: object) -> bool:
+        setting = _context.get() or _default
+        if setting.mode == "strict":
+            return full(instance)
+        if setting.mode == "trusted" or random.random() >= setting.sample_rate:  # noqa: S311
+            return trusted(instance)
+        return full(instance)
+
+    return moderated
+
+
+def get_validation_setting() -> ValidationSetting:
+    """Return the validation mode and sample rate in effect in the current context."""
+    return _context.get() or _default
+
+
+def set_validation_mode(
+    mode: Mode,
+    *,
+    sample_rate: float = default_sample_rate,
+) -> None:
+    """
+    Set the validation mode of the whole process, which applies to contexts that
+    don't set their own mode with :py:func:`validation`.
+
+    :raises ValueError: for an invalid mode or sample rate.
+    """
+    global _default
+    _default = _setting(mode, sample_rate)
+    if mode != "strict":
+        _engage()
+
+
+@contextlib.contextmanager
+def validation(
+    mode: Mode,
+    *,
+    sample_rate: float = default_sample_rate,
+) -> Iterator[ValidationSetting]:
+    """
+    Use the validation mode ``mode`` within the block, in the current context.
+
+    >>> from phantom.interval import Natural
+    >>> with validation("trusted"):
+    ...     isinstance(-1, Natural)
+    True
+    >>> isinstance(-1, Natural)
+    False
+
+    :raises ValueError: for an invalid mode or sample rate.
+    """
+    setting = _setting(mode, sample_rate)
+    if mode != "strict":
+        _engage()
+    token = _context.set(setting)
+    try:
+        yield setting
+    finally:
+        _context.reset(token)
+
+
+Verification: TypeAlias = Literal["skip", "eager", "deferred"]
+_verifications: Final = frozenset(get_args(Verification))
+
+
+def _holds(cls: type, instance: object) -> bool:
+    # Predicate-based types are fully checked regardless of the validation mode.
+    check = getattr(cls, "__instance_predicate__", None)
+    return bool(check(instance)) if check is not None else isinstance(instance, cls)
+
+
+def _violation(cls: type, instance: object) -> AssumptionError:
+    return AssumptionError(
+        LazyMessage(
+            f"Assumed value is not an instance of {fully_qualified_name(cls)}: {{}}",
+            instance,
+        )
+    )
+
+
+def _verify_eagerly(cls: type, instance: object) -> None:
+    if not _holds(cls, instance):
+        raise _violation(cls, instance)
+
+
+def _warn(error: AssumptionError) -> None:
+    warnings.warn(str(error), RuntimeWarning, stacklevel=1)
+
+
+class _DeferredVerifier:
+    """
+    Checks queued values in a daemon thread, at most ``max_rate`` values per second.
+    Values are dropped when ``max_pending`` values are already queued.
+    """
+
+    def __init__(
+        self,
+        max_rate: float,
+        max_pending: int,
+        on_violation: Callable[[AssumptionError], object],
+    ) -> None:
+        self.interval = 1 / max_rate
+        self.on_violation = on_violation
+        self.queue: queue.Queue[tuple[type, object] | None] = queue.Queue(max_pending)
+        self.closed = threading.Event()
+        self.thread = threading.Thread(
+            target=self._run, name="phantom-assumption-verifier", daemon=True
+        )
+        self.thread.start()
+
+    def __call__(self, cls: type, instance: object) -> None:
+        with contextlib.suppress(queue.Full):
+            self.queue.put_nowait((cls, instance))
+
+    def _run(self) -> None:
+        due = time.monotonic()
+        while (item := self.queue.get()) is not None and not self.closed.is_set():
+            try:
+                cls, instance = item
+                if not _holds(cls, instance):
+                    self.on_violation(_violation(cls, instance))
+            except Exception as error:  # noqa: BLE001
+                # Errors of checks and handlers must not stop verification.
+                warnings.warn(
+                    f"Failed to verify assumption: {error!r}",
+                    RuntimeWarning,
+                    stacklevel=1,
+                )
+            finally:
+                self.queue.task_done()
+            # Time spent idle isn't saved up, so checks don't burst after it.
+            due += self.interval
+            now = time.monotonic()
+            if due > now:
+                self.closed.wait(due - now)
+            else:
+                due = now
+        self.queue.task_done()
+        # Values that are still pending are dropped, and marked as done so that
+        # waiting for them doesn't block.
+        with contextlib.suppress(queue.Empty):
+            while True:
+                self.queue.get_nowait()
+                self.queue.task_done()
+
+    def close(self) -> None:
+        # Never blocks. The sentinel wakes the thread if it's waiting for values, in
+        # which case the queue is empty, and otherwise the thread stops after the
+        # value it's checking.
+        self.closed.set()
+        with contextlib.suppress(queue.Full):
+            self.queue.put_nowait(None)
+
+
+def _verifier(
+    verification: str,
+    max_rate: float,
+    max_pending: int,
+    on_violation: Callable[[AssumptionError], object],
+) -> Callable[[type, object], None] | None:
+    if verification not in _verifications:
+        raise ValueError(f"Invalid assumption verification: {verification!r}")
+    if max_rate <= 0:
+        raise ValueError("Rate must be positive")
+    if max_pending < 1:
+        raise ValueError("Number of pending values must be at least 1")
+    if verification == "eager":
+        return _verify_eagerly
+    if verification == "deferred":
+        return _DeferredVerifier(max_rate, max_pending, on_violation)
+    return None
+
+
+# Called by PhantomBase.assume() with the type and the assumed value, or None if
+# assumptions aren't verified.
+_verify_assumption: Callable[[type, object], None] | None = _verifier(
+    os.environ.get("PHANTOM_VERIFY_ASSUMPTIONS", "").strip().lower() or "skip",
+    1000.0,
+    10_000,
+    _warn,
+)
+
+
+def set_assumption_verification(
+    verification: Verification,
+    *,
+    max_rate: float = 1000.0,
+    max_pending: int = 10_000,
+    on_violation: Callable[[AssumptionError], object] = _warn,
+) -> None:
+    """
+    Set whether values typed with :py:meth:`phantom.PhantomBase.assume` are verified.
+    Deferred verification checks at most ``max_rate`` values per second, and drops
+    values when ``max_pending`` values are already waiting to be checked. Errors for
+    invalid values are passed to ``on_violation``, which by default issues them as a
+    :py:class:`RuntimeWarning`. Values that are still waiting to be checked by a
+    previous deferred verification are dropped.
+
+    :raises ValueError: for an invalid verification or limit.
+    """
+    global _verify_assumption
+    previous = _verify_assumption
+    _verify_assumption = _verifier(verification, max_rate, max_pending, on_violation)
+    if isinstance(previous, _DeferredVerifier):
+        previous.close()
+
+
+def wait_for_verification() -> None:
+    """Block until all values queued for deferred verification have been checked."""
+    verifier = _verify_assumption
+    if isinstance(verifier, _DeferredVerifier):
+        verifier.queue.join()
@@ -54,6 +54,14 @@ class TestFormattedPhoneNumber:
         ):
             FormattedPhoneNumber.parse(123)
 
+    def test_try_parse_normalizes_unformatted_number(self):
+        assert FormattedPhoneNumber.try_parse("+46 (701) 234567") == "+46701234567"
+
+    @pytest.mark.parametrize("value", ("+46", "+467012345678", 123))
+    def test_try_parse_returns_default_for_invalid_value(self, value: object):
+        assert FormattedPhoneNumber.try_parse(value) is None
+        assert FormattedPhoneNumber.try_parse(value, default="") == ""
+
 
 class TestDeconstructPhoneNumber:
     def test_can_parse_international_phone_number_without_country_code(self):
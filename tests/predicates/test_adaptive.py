@@ -0,0 +1,117 @@
+import pytest
+
+from phantom import Phantom
+from phantom.predicates import boolean
+from phantom.predicates import collection
+from phantom.predicates import generic
+from phantom.predicates import numeric
+from phantom.predicates.adaptive import AdaptivePredicate
+from phantom.predicates.adaptive import adaptive
+
+
+def expensive(value: str) -> bool:
+    # Stands in for e.g. a costly regular expression, that rarely rejects values.
+    return sum(range(5_000)) > 0 and value != "x" * 4
+
+
+short = collection.count(numeric.le(3))
+values = ("", "a", "abc", "abcd", "xxxx", "a" * 10, "b" * 20) * 20
+
+
+class TestAdaptive:
+    @pytest.mark.parametrize(
+        "predicate",
+        (
+            boolean.both(expensive, short),
+            boolean.all_of([expensive, short, generic.equal("a")]),
+            boolean.either(expensive, short),
+            boolean.any_of([expensive, short, generic.equal("xxxx")]),
+            boolean.all_of([]),
+            boolean.any_of([]),
+        ),
+    )
+    def test_result_is_identical(self, predicate) -> None:
+        check = adaptive(predicate, warmup=10, sample_every=7)
+        for value in values:
+            assert check(value) is bool(predicate(value))
+
+    def test_evaluates_cheap_rejecting_predicate_first(self) -> None:
+        check = adaptive(boolean.both(expensive, short), warmup=50)
+        assert check.order == (expensive, short)
+        for value in values:
+            check(value)
+        assert check.order == (short, expensive)
+
+    def test_evaluates_cheap_accepting_predicate_first_in_disjunction(self) -> None:
+        long = boolean.negate(short)
+        check = adaptive(boolean.either(expensive, long), warmup=50)
+        for value in values:
+            check(value)
+        assert check.order == (long, expensive)
+
+    def test_keeps_order_of_predicates_that_never_decide(self) -> None:
+        check = adaptive(boolean.all_of([boolean.true, numeric.positive, opaque]))
+        for value in range(1, 10):
+            check(value)
+        assert check.order == check.operands
+
+    def test_freeze_keeps_order(self) -> None:
+        check = adaptive(boolean.both(expensive, short), warmup=50)
+        check.freeze()
+        assert check.frozen
+        for value in values:
+            check(value)
+        assert check.order == (expensive, short)
+
+    def test_thaw_resumes_adapting(self) -> None:
+        check = adaptive(boolean.both(expensive, short), warmup=50)
+        check.freeze()
+        for value in values:
+            check(value)
+        check.thaw()
+        assert not check.frozen
+        for value in values:
+            check(value)
+        assert check.order == (short, expensive)
+
+    def test_freeze_with_given_order(self) -> None:
+        check = adaptive(boolean.both(expensive, short))
+        check.freeze([short, expensive])
+        assert check.order == (short, expensive)
+        assert check("abcd") is False
+
+    def test_freeze_raises_for_order_that_is_not_a_permutation(self) -> None:
+        check = adaptive(boolean.both(expensive, short))
+        with pytest.raises(ValueError, match=r"permutation"):
+            check.freeze([short, short])
+
+    def test_has_name(self) -> None:
+        check = adaptive(boolean.both(numeric.positive, numeric.even))
+        assert check.__name__ == "adaptive(both(positive, even))"
+        assert repr(check) == "<AdaptivePredicate adaptive(both(positive, even))>"
+
+    @pytest.mark.parametrize("predicate", (numeric.positive, boolean.negate(short)))
+    def test_raises_type_error_for_other_predicates(self, predicate) -> None:
+        with pytest.raises(TypeError, match=r"all_of, both, any_of or either"):
+            adaptive(predicate)
+
+    @pytest.mark.parametrize(
+        "kwargs", ({"warmup": -1}, {"sample_every": 0}, {"sample_every": -1})
+    )
+    def test_raises_value_error_for_invalid_sampling(self, kwargs) -> None:
+        with pytest.raises(ValueError):
+            adaptive(boolean.both(numeric.positive, numeric.even), **kwargs)
+
+    def test_can_be_used_as_phantom_predicate(self) -> None:
+        check = adaptive(boolean.both(expensive, short), warmup=5)
+
+        class Short(str, Phantom, predicate=check): ...
+
+        assert isinstance(check, AdaptivePredicate)
+        assert isinstance("abc", Short)
+        assert not isinstance("abcd", Short)
+        assert not isinstance(1, Short)
+
+
+def opaque(value: int) -> bool:
+    return value < 100
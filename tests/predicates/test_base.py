@@ -0,0 +1,150 @@
+import re
+
+import pytest
+from typeguard import CollectionCheckStrategy
+
+from phantom import Predicate
+from phantom.predicates import Node
+from phantom.predicates import boolean
+from phantom.predicates import collection
+from phantom.predicates import generic
+from phantom.predicates import get_node
+from phantom.predicates import interval
+from phantom.predicates import numeric
+from phantom.predicates import re as re_predicates
+
+t = boolean.true
+f = boolean.false
+pattern = re.compile(r"\d+")
+
+parametrize_nodes = pytest.mark.parametrize(
+    "predicate, factory, args, children",
+    (
+        (boolean.negate(t), boolean.negate, (t,), (t,)),
+        (boolean.both(t, f), boolean.both, (t, f), (t, f)),
+        (boolean.either(t, f), boolean.either, (t, f), (t, f)),
+        (boolean.xor(t, f), boolean.xor, (t, f), (t, f)),
+        (boolean.all_of([t, f]), boolean.all_of, ((t, f),), (t, f)),
+        (boolean.any_of([t, f]), boolean.any_of, ((t, f),), (t, f)),
+        (boolean.one_of([t, f]), boolean.one_of, ((t, f),), (t, f)),
+        (collection.contains(1), collection.contains, (1,), ()),
+        (collection.contained((1,)), collection.contained, ((1,),), ()),
+        (collection.count(t), collection.count, (t,), (t,)),
+        (collection.exists(t), collection.exists, (t,), (t,)),
+        (collection.every(t), collection.every, (t,), (t,)),
+        (generic.equal(1), generic.equal, (1,), ()),
+        (generic.identical(1), generic.identical, (1,), ()),
+        (generic.of_type(int), generic.of_type, (int,), ()),
+        (
+            generic.of_complex_type(tuple[int, ...]),
+            generic.of_complex_type,
+            (tuple[int, ...], CollectionCheckStrategy.ALL_ITEMS),
+            (),
+        ),
+        (interval.exclusive(0, 1), interval.exclusive, (0, 1), ()),
+        (interval.inclusive(0, 1), interval.inclusive, (0, 1), ()),
+        (numeric.less(1), numeric.less, (1,), ()),
+        (numeric.greater(1), numeric.greater, (1,), ()),
+        (numeric.modulo(2, t), numeric.modulo, (2, t), (t,)),
+        (re_predicates.is_match(pattern), re_predicates.is_match, (pattern,), ()),
+        (
+            re_predicates.is_full_match(pattern),
+            re_predicates.is_full_match,
+            (pattern,),
+            (),
+        ),
+    ),
+)
+
+
+class TestGetNode:
+    @parametrize_nodes
+    def test_returns_node_describing_predicate(
+        self,
+        predicate: Predicate,
+        factory: object,
+        args: tuple,
+        children: tuple,
+    ) -> None:
+        node = get_node(predicate)
+        assert isinstance(node, Node)
+        assert node.factory is factory
+        assert node.args == args
+        assert node.children == children
+
+    @parametrize_nodes
+    def test_factory_recreates_equivalent_predicate(
+        self,
+        predicate: Predicate,
+        factory: object,
+        args: tuple,
+        children: tuple,
+    ) -> None:
+        node = get_node(predicate)
+        assert node is not None
+        recreated = node.factory(*node.args)
+        assert recreated.__name__ == predicate.__name__
+
+    @pytest.mark.parametrize("predicate", (boolean.true, numeric.positive, len))
+    def test_returns_none_for_plain_function(self, predicate: Predicate) -> None:
+        assert get_node(predicate) is None
+
+    def test_node_has_no_instance_dict(self) -> None:
+        node = get_node(boolean.negate(t))
+        assert not hasattr(node, "__dict__")
+        assert repr(node) == (f"Node(negate, args=({t!r},), children=({t!r},))")
+
+    @parametrize_nodes
+    def test_recreated_node_is_equal_and_has_same_hash(
+        self,
+        predicate: Predicate,
+        factory: object,
+        args: tuple,
+        children: tuple,
+    ) -> None:
+        node = get_node(predicate)
+        assert node is not None
+        recreated = get_node(node.factory(*node.args))
+        assert recreated == node
+        assert hash(recreated) == hash(node)
+
+
+class TestNodeEquality:
+    def test_nodes_of_structurally_equal_predicates_are_equal(self) -> None:
+        a = boolean.both(numeric.ge(0), interval.inclusive(0, 100))
+        b = boolean.both(numeric.ge(0), interval.inclusive(0, 100))
+        assert get_node(a) == get_node(b)
+        assert hash(get_node(a)) == hash(get_node(b))
+
+    @pytest.mark.parametrize(
+        "a, b",
+        (
+            (numeric.ge(0), numeric.le(0)),
+            (numeric.ge(0), numeric.ge(1)),
+            (generic.equal(1), generic.equal(1.0)),
+            (generic.equal(1), generic.equal(True)),
+            (boolean.negate(numeric.even), boolean.negate(numeric.odd)),
+            (boolean.all_of([t, f]), boolean.all_of([f, t])),
+            (generic.identical(10**10), generic.identical(int("1" + "0" * 10))),
+        ),
+    )
+    def test_nodes_of_different_predicates_are_not_equal(
+        self, a: Predicate, b: Predicate
+    ) -> None:
+        assert get_node(a) != get_node(b)
+
+    def test_compares_opaque_predicate_arguments_by_identity(self) -> None:
+        def first(value: object) -> bool:
+            return True
+
+        def second(value: object) -> bool:
+            return True
+
+        assert get_node(boolean.negate(first)) == get_node(boolean.negate(first))
+        assert get_node(boolean.negate(first)) != get_node(boolean.negate(second))
+
+    def test_node_with_unhashable_argument_is_unhashable(self) -> None:
+        node = get_node(collection.contained([1, 2]))
+        assert node == get_node(collection.contained([1, 2]))
+        with pytest.raises(TypeError):
+            hash(node)
@@ -289,6 +289,16 @@ class TestOneOf:
         assert predicate(0) is True
         assert predicate(0) is True
 
+    def test_stops_at_second_succeeding_predicate(self) -> None:
+        calls = []
+
+        def record(value: int) -> bool:
+            calls.append(value)
+            return True
+
+        assert boolean.one_of([record, record, record])(0) is False
+        assert calls == [0, 0]
+
     def test_repr_contains_bound_parameter(self):
         assert_predicate_name_equals(
             boolean.one_of([boolean.true, boolean.false]), "one_of(true, false)"
@@ -0,0 +1,153 @@
+import re
+
+import pytest
+
+from phantom import Phantom
+from phantom import Predicate
+from phantom.predicates import boolean
+from phantom.predicates import collection
+from phantom.predicates import compile_predicate
+from phantom.predicates import generic
+from phantom.predicates import get_node
+from phantom.predicates import interval
+from phantom.predicates import numeric
+from phantom.predicates import re as re_predicates
+
+
+def opaque(value: object) -> bool:
+    return value == 3
+
+
+predicates: tuple[Predicate, ...] = (
+    boolean.true,
+    boolean.false,
+    boolean.truthy,
+    boolean.falsy,
+    numeric.positive,
+    numeric.non_positive,
+    numeric.negative,
+    numeric.non_negative,
+    numeric.even,
+    numeric.odd,
+    opaque,
+    boolean.negate(numeric.positive),
+    boolean.both(numeric.positive, numeric.even),
+    boolean.either(numeric.negative, numeric.even),
+    boolean.xor(numeric.positive, numeric.even),
+    boolean.all_of([numeric.positive, numeric.even, opaque]),
+    boolean.all_of([]),
+    boolean.any_of([numeric.negative, numeric.even, opaque]),
+    boolean.any_of([]),
+    boolean.one_of([numeric.positive, numeric.even, opaque]),
+    boolean.one_of([]),
+    boolean.one_of([numeric.odd]),
+    boolean.one_of([numeric.positive, numeric.even, opaque, numeric.negative]),
+    generic.equal(2),
+    generic.equal(2.5),
+    generic.identical(2),
+    generic.of_type(int),
+    generic.of_type((int, float)),
+    interval.exclusive(0, 4),
+    interval.exclusive_inclusive(0, 4),
+    interval.inclusive_exclusive(0, 4),
+    interval.inclusive(0, float("inf")),
+    numeric.less(2),
+    numeric.le(2),
+    numeric.greater(2),
+    numeric.ge(2),
+    numeric.modulo(3, generic.equal(1)),
+    numeric.modulo(3, boolean.both(numeric.positive, numeric.odd)),
+    collection.contained(frozenset({1, 2})),
+    boolean.both(generic.of_type(int), collection.contained((1, 2, 3))),
+)
+values = (-3, -1, 0, 1, 2, 2.5, 3, 4, 5.0, True, False)
+
+
+class TestCompilePredicate:
+    @pytest.mark.parametrize("predicate", predicates)
+    @pytest.mark.parametrize("value", values)
+    def test_compiled_predicate_is_equivalent(
+        self, predicate: Predicate, value: object
+    ) -> None:
+        assert compile_predicate(predicate)(value) == predicate(value)
+
+    @pytest.mark.parametrize(
+        "predicate, value",
+        (
+            (collection.contains(1), (0, 1)),
+            (collection.contains(2), [0, 1]),
+            (collection.count(interval.inclusive(1, 2)), (1, 2)),
+            (collection.count(interval.inclusive(1, 2)), ()),
+            (collection.exists(numeric.negative), (1, -1)),
+            (collection.exists(numeric.negative), (1, 2)),
+            (collection.every(numeric.positive), (1, 2)),
+            (collection.every(numeric.positive), (1, -2)),
+            (re_predicates.is_match(re.compile(r"\d")), "1a"),
+            (re_predicates.is_match(re.compile(r"\d")), "a1"),
+            (re_predicates.is_full_match(re.compile(r"\d")), "1"),
+            (re_predicates.is_full_match(re.compile(r"\d")), "1a"),
+            (generic.identical("a"), "a"),
+        ),
+    )
+    def test_compiled_collection_predicate_is_equivalent(
+        self, predicate: Predicate, value: object
+    ) -> None:
+        assert compile_predicate(predicate)(value) == predicate(value)
+
+    def test_inlines_predicates_created_by_factories(self) -> None:
+        within_range: Predicate[int] = boolean.all_of(
+            [numeric.positive, interval.inclusive(0, 10)]
+        )
+        predicate = boolean.both(generic.of_type(int), within_range)
+        compiled = compile_predicate(predicate)
+        assert compiled is not predicate
+        assert set(compiled.__globals__) - {"__builtins__", "compiled"} == {"_c0"}
+        assert compiled.__globals__["_c0"] is int
+
+    def test_calls_opaque_predicates(self) -> None:
+        calls = []
+
+        def record(value: int) -> bool:
+            calls.append(value)
+            return True
+
+        compiled = compile_predicate(boolean.both(numeric.positive, record))
+        assert compiled(-1) is False
+        assert compiled(1) is True
+        assert calls == [1]
+
+    def test_one_of_stops_at_second_succeeding_predicate(self) -> None:
+        calls = []
+
+        def record(value: int) -> bool:
+            calls.append(value)
+            return True
+
+        compiled = compile_predicate(boolean.one_of([record, record, record]))
+        assert compiled(0) is False
+        assert calls == [0, 0]
+
+    def test_keeps_name_and_node(self) -> None:
+        predicate = boolean.both(numeric.positive, numeric.even)
+        compiled = compile_predicate(predicate)
+        assert compiled.__name__ == compiled.__qualname__ == "both(positive, even)"
+        assert repr(compiled).startswith("<function both(positive, even) at ")
+        assert get_node(compiled) is get_node(predicate)
+
+    def test_returns_predicate_that_cannot_be_inlined(self) -> None:
+        assert compile_predicate(opaque) is opaque
+
+    def test_returns_predicate_too_deep_to_compile(self) -> None:
+        predicate: Predicate[int] = numeric.positive
+        for _ in range(1000):
+            predicate = boolean.negate(predicate)
+        assert compile_predicate(predicate) is predicate
+
+    def test_phantom_type_uses_compiled_check(self) -> None:
+        class Small(int, Phantom, predicate=interval.inclusive(0, 10)): ...
+
+        assert get_node(Small.__instance_predicate__) is not None
+        assert Small.__instance_predicate__.__globals__["_c0"] is int
+        assert isinstance(5, Small)
+        assert not isinstance(11, Small)
+        assert not isinstance("5", Small)
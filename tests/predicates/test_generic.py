@@ -1,4 +1,5 @@
 import pytest
+from typeguard import CollectionCheckStrategy
 
 from phantom.predicates import generic
 
@@ -56,3 +57,49 @@ class TestOfType:
 
     def test_repr_contains_bound_parameter(self):
         assert_predicate_name_equals(generic.of_type(int), "of_type(int)")
+
+
+class TestSampleItems:
+    def test_raises_value_error_for_empty_sample(self):
+        with pytest.raises(ValueError, match=r"^Sample size must be at least 1$"):
+            generic.SampleItems(0)
+
+    def test_returns_collection_smaller_than_sample(self):
+        value = (1, 2)
+        assert generic.SampleItems(2).iterate_samples(value) is value
+
+    def test_samples_items_of_sequence(self):
+        value = tuple(range(100))
+        samples = list(generic.SampleItems(3).iterate_samples(value))
+        assert len(samples) == 3
+        assert len(set(samples)) == 3
+        assert set(samples) <= set(value)
+
+    def test_takes_leading_items_of_unordered_collection(self):
+        value = frozenset(range(100))
+        assert list(generic.SampleItems(3).iterate_samples(value)) == list(value)[:3]
+
+
+class TestOfComplexType:
+    def test_checks_all_items_by_default(self):
+        predicate = generic.of_complex_type(tuple[int, ...])
+        assert predicate((1, 2)) is True
+        assert predicate((1, "2")) is False
+
+    def test_can_check_first_item(self):
+        predicate = generic.of_complex_type(
+            tuple[int, ...], CollectionCheckStrategy.FIRST_ITEM
+        )
+        assert predicate((1, "2")) is True
+        assert predicate(("1", 2)) is False
+
+    def test_can_check_sampled_items(self):
+        predicate = generic.of_complex_type(tuple[int, ...], generic.SampleItems(100))
+        assert predicate(tuple(range(200))) is True
+        assert predicate(100 * ("a",) + 100 * (1,)) is False
+
+    def test_repr_contains_non_default_collection_check(self):
+        assert_predicate_name_equals(
+            generic.of_complex_type(int, generic.SampleItems(3)),
+            "of_complex_type(int, SampleItems(k=3))",
+        )
@@ -0,0 +1,71 @@
+import re
+
+from phantom import Phantom
+from phantom.predicates import boolean
+from phantom.predicates import collection
+from phantom.predicates import compile_predicate
+from phantom.predicates import get_node
+from phantom.predicates import intern_predicate
+from phantom.predicates import interval
+from phantom.predicates import numeric
+from phantom.predicates import re as re_predicates
+
+
+class TestInternPredicate:
+    def test_returns_shared_instance_for_structurally_equal_predicates(self) -> None:
+        a = interval.inclusive(-123, 456)
+        b = interval.inclusive(-123, 456)
+        assert intern_predicate(a) is a
+        assert intern_predicate(b) is a
+
+    def test_shares_equal_patterns(self) -> None:
+        a = re_predicates.is_full_match(re.compile(r"[a-z]{3}\d+"))
+        b = re_predicates.is_full_match(re.compile(r"[a-z]{3}\d+"))
+        assert intern_predicate(a) is intern_predicate(b)
+
+    def test_interns_predicates_among_arguments(self) -> None:
+        shared = numeric.ge(1_000)
+        assert intern_predicate(shared) is shared
+        predicate = intern_predicate(boolean.both(numeric.ge(1_000), numeric.even))
+        node = get_node(predicate)
+        assert node is not None
+        assert node.children[0] is shared
+
+    def test_returns_distinct_predicates_as_is(self) -> None:
+        a = intern_predicate(numeric.ge(2_000))
+        b = intern_predicate(numeric.ge(2_001))
+        assert a is not b
+
+    def test_returns_predicate_with_unhashable_argument_as_is(self) -> None:
+        predicate = collection.contained([1, 2])
+        assert intern_predicate(predicate) is predicate
+
+    def test_returns_plain_function_as_is(self) -> None:
+        assert intern_predicate(numeric.positive) is numeric.positive
+
+    def test_returns_predicate_too_deep_to_intern(self) -> None:
+        predicate = numeric.ge(3_000)
+        for _ in range(1000):
+            predicate = boolean.negate(predicate)
+        assert intern_predicate(predicate) is predicate
+
+
+class TestSharedCompiledPredicates:
+    def test_structurally_equal_predicates_share_compiled_function(self) -> None:
+        a = boolean.both(numeric.ge(4_000), numeric.le(5_000))
+        b = boolean.both(numeric.ge(4_000), numeric.le(5_000))
+        assert compile_predicate(a) is compile_predicate(b)
+
+    def test_types_with_equal_checks_share_instance_predicate(self) -> None:
+        class A(int, Phantom, predicate=interval.inclusive(6_000, 7_000)): ...
+
+        class B(int, Phantom, predicate=interval.inclusive(6_000, 7_000)): ...
+
+        class C(int, Phantom, predicate=interval.inclusive(6_000, 7_001)): ...
+
+        assert A.__instance_predicate__ is B.__instance_predicate__
+        assert A.__instance_predicate__ is not C.__instance_predicate__
+        assert isinstance(6_500, A)
+        assert isinstance(6_500, B)
+        assert not isinstance(7_001, B)
+        assert isinstance(7_001, C)
@@ -0,0 +1,252 @@
+import gc
+import pickle
+import sys
+import threading
+from dataclasses import dataclass
+
+import pytest
+
+from phantom.predicates import collection
+from phantom.predicates import numeric
+from phantom.predicates.memoize import CacheInfo
+from phantom.predicates.memoize import IdentityMemoizedPredicate
+from phantom.predicates.memoize import MemoizedPredicate
+from phantom.predicates.memoize import memoize
+from phantom.predicates.memoize import memoize_by_identity
+
+
+class Counting:
+    def __init__(self) -> None:
+        self.__name__ = "counting"
+        self.calls: list[object] = []
+
+    def __call__(self, value: object) -> bool:
+        self.calls.append(value)
+        return value == 1
+
+
+@dataclass(frozen=True)
+class Frozen:
+    value: int
+
+
+every_positive = collection.every(numeric.positive)
+
+
+class TestMemoize:
+    def test_returns_memoized_predicate(self) -> None:
+        check = memoize(numeric.positive)
+        assert isinstance(check, MemoizedPredicate)
+        assert check.__name__ == "memoize(positive)"
+        assert check.cache_info() == CacheInfo(0, 0, 0, 4096, 0)
+
+    def test_result_is_identical(self) -> None:
+        check = memoize(numeric.positive, maxsize=3)
+        for value in (-1, 0, 1, 2, -1, 3, 0, 1) * 3:
+            assert check(value) is numeric.positive(value)
+
+    def test_remembers_verdicts(self) -> None:
+        predicate = Counting()
+        check = memoize(predicate)
+        assert [check(value) for value in (1, 2, 1, 2, 1)] == [
+            True,
+            False,
+            True,
+            False,
+            True,
+        ]
+        assert predicate.calls == [1, 2]
+        assert check.cache_info() == CacheInfo(3, 2, 0, 4096, 2)
+
+    def test_evicts_least_recently_used_verdict(self) -> None:
+        predicate = Counting()
+        check = memoize(predicate, maxsize=2)
+        for value in (1, 2, 1, 3, 1, 2):
+            check(value)
+        assert predicate.calls == [1, 2, 3, 2]
+        assert check.cache_info() == CacheInfo(2, 4, 2, 2, 2)
+
+    def test_caches_equal_values_of_different_types_separately(self) -> None:
+        predicate = Counting()
+        check = memoize(predicate)
+        check(1)
+        check(1.0)
+        check(True)
+        assert predicate.calls == [1, 1.0, True]
+
+    def test_passes_unhashable_values_through(self) -> None:
+        predicate = Counting()
+        check = memoize(predicate)
+        assert not check([1])
+        assert not check([1])
+        assert predicate.calls == [[1], [1]]
+        assert check.cache_info() == CacheInfo(0, 0, 0, 4096, 0)
+
+    def test_raises_type_error_of_predicate_for_hashable_values(self) -> None:
+        check = memoize(numeric.positive)
+        with pytest.raises(TypeError):
+            check("a")  # type: ignore[arg-type]
+
+    def test_can_clear_cache(self) -> None:
+        predicate = Counting()
+        check = memoize(predicate)
+        check(1)
+        check(1)
+        check.cache_clear()
+        assert check.cache_info() == CacheInfo(0, 0, 0, 4096, 0)
+        check(1)
+        assert predicate.calls == [1, 1]
+
+    def test_can_pickle_without_verdicts(self) -> None:
+        check = memoize(numeric.positive, maxsize=8)
+        check(1)
+        unpickled = pickle.loads(pickle.dumps(check))  # noqa: S301
+        assert unpickled.maxsize == 8
+        assert unpickled.cache_info().currsize == 0
+        assert unpickled(1)
+        assert not unpickled(-1)
+
+    def test_is_safe_to_call_from_multiple_threads(self) -> None:
+        check = memoize(numeric.positive, maxsize=16)
+        errors: list[BaseException] = []
+
+        def run() -> None:
+            try:
+                for value in range(-100, 100):
+                    assert check(value) is (value > 0)
+            except BaseException as error:  # noqa: BLE001
+                errors.append(error)
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        info = check.cache_info()
+        assert info.hits + info.misses == 8 * 200
+        assert info.currsize == 16
+
+    @pytest.mark.parametrize("maxsize", (0, -1))
+    def test_raises_value_error_for_invalid_size(self, maxsize: int) -> None:
+        with pytest.raises(ValueError):
+            memoize(numeric.positive, maxsize=maxsize)
+
+
+class TestMemoizeByIdentity:
+    def test_returns_identity_memoized_predicate(self) -> None:
+        check = memoize_by_identity(numeric.positive)
+        assert isinstance(check, IdentityMemoizedPredicate)
+        assert check.__name__ == "memoize_by_identity(positive)"
+        assert check.cache_info() == CacheInfo(0, 0, 0, 4096, 0)
+
+    def test_remembers_verdicts_of_same_object(self) -> None:
+        predicate = Counting()
+        check = memoize_by_identity(predicate)
+        value = (1, 2)
+        # Built at runtime, as equal tuple literals are the same constant.
+        equal = tuple(range(1, 3))
+        assert not check(value)
+        assert not check(value)
+        assert not check(equal)
+        assert predicate.calls == [value, equal]
+        assert predicate.calls[1] is equal
+        assert check.cache_info() == CacheInfo(1, 2, 0, 4096, 2)
+
+    def test_remembers_verdicts_of_unhashable_objects(self) -> None:
+        predicate = Counting()
+        check = memoize_by_identity(predicate)
+        value = ([1],)
+        check(value)
+        check(value)
+        assert predicate.calls == [value]
+
+    def test_passes_mutable_objects_through(self) -> None:
+        predicate = Counting()
+        check = memoize_by_identity(predicate)
+        value = [1]
+        check(value)
+        check(value)
+        assert predicate.calls == [value, value]
+        assert check.cache_info().currsize == 0
+
+    def test_holds_objects_alive_within_byte_limit(self) -> None:
+        check = memoize_by_identity(every_positive, max_bytes=10_000)
+        values = [tuple(range(index + 1, index + 101)) for index in range(20)]
+        size = sys.getsizeof(values[0]) + sum(map(sys.getsizeof, values[0]))
+        for value in values:
+            check(value)
+        info = check.cache_info()
+        assert info.evictions > 0
+        assert info.currsize == 20 - info.evictions
+        assert size * info.currsize == check.held_bytes <= 10_000
+
+    def test_does_not_hold_objects_larger_than_byte_limit(self) -> None:
+        predicate = Counting()
+        check = memoize_by_identity(predicate, max_bytes=100)
+        value = tuple(range(100))
+        check(value)
+        check(value)
+        assert predicate.calls == [value, value]
+        assert check.held_bytes == 0
+
+    def test_counts_size_of_items_of_held_collections(self) -> None:
+        predicate = Counting()
+        check = memoize_by_identity(predicate, max_bytes=1_000)
+        value = (("a" * 1_000,), frozenset({2}))
+        check(value)
+        check(value)
+        assert predicate.calls == [value, value]
+        assert check.held_bytes == 0
+
+    def test_evicts_oldest_object(self) -> None:
+        predicate = Counting()
+        check = memoize_by_identity(predicate, maxsize=2)
+        values = (1, 2), (3, 4), (5, 6)
+        for value in (*values, values[0], values[2]):
+            check(value)
+        assert predicate.calls == [values[0], values[1], values[2], values[0]]
+        assert check.cache_info() == CacheInfo(1, 4, 2, 2, 2)
+
+    def test_holds_objects_that_support_weak_references_weakly(self) -> None:
+        predicate = Counting()
+        check = memoize_by_identity(predicate)
+        value = Frozen(1)
+        check(value)
+        check(value)
+        assert predicate.calls == [value]
+        assert check.held_bytes == 0
+        predicate.calls.clear()
+        del value
+        gc.collect()
+        assert check.cache_info().currsize == 0
+
+    def test_can_evict_object_referencing_weakly_held_object(self) -> None:
+        check = memoize_by_identity(Counting(), maxsize=1)
+        check((Frozen(1),))
+        check((2,))
+        assert check.cache_info().currsize == 1
+
+    def test_can_clear_cache(self) -> None:
+        check = memoize_by_identity(every_positive)
+        value = (1,)
+        check(value)
+        check.cache_clear()
+        assert check.cache_info() == CacheInfo(0, 0, 0, 4096, 0)
+        assert check.held_bytes == 0
+
+    def test_can_pickle_without_verdicts(self) -> None:
+        check = memoize_by_identity(numeric.positive, maxsize=8, max_bytes=100)
+        check(1)
+        unpickled = pickle.loads(pickle.dumps(check))  # noqa: S301
+        assert (unpickled.maxsize, unpickled.max_bytes) == (8, 100)
+        assert unpickled.cache_info().currsize == 0
+        assert unpickled(1)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        ({"maxsize": 0}, {"max_bytes": -1}),
+    )
+    def test_raises_value_error_for_invalid_arguments(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            memoize_by_identity(numeric.positive, **kwargs)
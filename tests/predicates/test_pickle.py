@@ -0,0 +1,140 @@
+import datetime
+import multiprocessing
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+from typing import TypeVar
+from typing import cast
+
+import pytest
+from typeguard import CollectionCheckStrategy
+
+from phantom import Predicate
+from phantom.predicates import boolean
+from phantom.predicates import collection
+from phantom.predicates import datetime as datetime_predicates
+from phantom.predicates import generic
+from phantom.predicates import get_node
+from phantom.predicates import interval
+from phantom.predicates import numeric
+from phantom.predicates import re as re_predicates
+from phantom.predicates import simplify_predicate
+from phantom.predicates.adaptive import adaptive
+from phantom.predicates.generic import SampleItems
+
+T = TypeVar("T")
+
+pattern = re.compile(r"\d+")
+
+predicates: tuple[tuple[Predicate[Any], object], ...] = (
+    (boolean.true, 0),
+    (boolean.truthy, 0),
+    (numeric.positive, 1),
+    (numeric.even, 3),
+    (datetime_predicates.is_tz_naive, datetime.datetime(2020, 1, 1)),
+    (boolean.negate(numeric.positive), 1),
+    (boolean.both(numeric.positive, numeric.even), 2),
+    (boolean.either(numeric.negative, numeric.even), 3),
+    (boolean.xor(numeric.positive, numeric.even), 2),
+    (boolean.all_of([numeric.positive, numeric.even, numeric.le(10)]), 2),
+    (boolean.any_of([numeric.negative, numeric.odd, numeric.le(10)]), 12),
+    (boolean.one_of([numeric.negative, numeric.odd, numeric.le(10)]), 2),
+    (collection.contains(1), (0, 1)),
+    (collection.contained(frozenset({1, 2})), 3),
+    (collection.count(numeric.le(2)), (0, 1)),
+    (collection.exists(numeric.positive), (0, 1)),
+    (collection.every(numeric.positive), (0, 1)),
+    (generic.equal(1), 1),
+    (generic.identical(None), None),
+    (generic.of_type(int), 1),
+    (generic.of_type((int, str)), b""),
+    (generic.of_complex_type(tuple[int, ...]), (1, "2")),
+    (generic.of_complex_type(list[int], SampleItems(2)), [1, 2]),
+    (
+        generic.of_complex_type(list[int], CollectionCheckStrategy.FIRST_ITEM),
+        ["1"],
+    ),
+    (interval.exclusive(0, 10), 10),
+    (interval.exclusive_inclusive(0, 10), 10),
+    (interval.inclusive_exclusive(0, 10), 10),
+    (interval.inclusive(0, 10), 10),
+    (numeric.less(1), 0),
+    (numeric.le(1), 2),
+    (numeric.greater(1), 0),
+    (numeric.ge(1), 2),
+    (numeric.modulo(3, generic.equal(1)), 4),
+    (re_predicates.is_match(pattern), "12a"),
+    (re_predicates.is_full_match(pattern), "12a"),
+)
+parametrize_predicates = pytest.mark.parametrize("predicate, value", predicates)
+
+
+def round_trip(obj: T, protocol: int = pickle.DEFAULT_PROTOCOL) -> T:
+    return cast(T, pickle.loads(pickle.dumps(obj, protocol=protocol)))  # noqa: S301
+
+
+class TestPickle:
+    @parametrize_predicates
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_round_trips_predicate(
+        self, predicate: Predicate, value: object, protocol: int
+    ) -> None:
+        unpickled = round_trip(predicate, protocol)
+        assert unpickled.__name__ == predicate.__name__
+        assert get_node(unpickled) == get_node(predicate)
+        assert unpickled(value) == predicate(value)
+
+    def test_shared_operands_are_unpickled_once(self) -> None:
+        shared = numeric.ge(0)
+        predicate = boolean.both(shared, boolean.negate(shared))
+        node = get_node(round_trip(predicate))
+        assert node is not None
+        negated = get_node(node.children[1])
+        assert negated is not None
+        assert node.children[0] is negated.children[0]
+
+    def test_round_trips_simplified_predicate(self) -> None:
+        predicate = simplify_predicate(
+            boolean.both(numeric.ge(0), boolean.both(numeric.le(10), numeric.even))
+        )
+        unpickled = round_trip(predicate)
+        assert get_node(unpickled) == get_node(predicate)
+        assert [unpickled(n) for n in range(-1, 12)] == [
+            predicate(n) for n in range(-1, 12)
+        ]
+
+    def test_round_trips_adaptive_predicate(self) -> None:
+        predicate = adaptive(boolean.both(numeric.positive, numeric.even))
+        predicate.freeze([numeric.even, numeric.positive])
+        unpickled = round_trip(predicate)
+        assert unpickled.__name__ == predicate.__name__
+        assert unpickled.frozen
+        assert unpickled.order == (numeric.even, numeric.positive)
+        assert [unpickled(n) for n in range(-2, 3)] == [
+            predicate(n) for n in range(-2, 3)
+        ]
+
+    def test_predicate_does_not_invent_attributes(self) -> None:
+        predicate = numeric.le(1)
+        assert not hasattr(predicate, "le")
+        assert not hasattr(predicate, "check")
+
+    def test_node_does_not_pickle_cached_hash(self) -> None:
+        node = get_node(generic.equal("a"))
+        assert node is not None
+        hash(node)
+        unpickled = round_trip(node)
+        assert unpickled == node
+        assert unpickled._hash is None
+
+
+def test_predicates_can_be_called_by_spawned_worker() -> None:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        # Each predicate is pickled and sent to the worker, which calls it.
+        verdicts = [
+            executor.submit(predicate, value).result()
+            for predicate, value in predicates
+        ]
+    assert verdicts == [predicate(value) for predicate, value in predicates]
@@ -0,0 +1,179 @@
+import pytest
+
+from phantom import Phantom
+from phantom import Predicate
+from phantom.predicates import boolean
+from phantom.predicates import collection
+from phantom.predicates import generic
+from phantom.predicates import get_node
+from phantom.predicates import interval
+from phantom.predicates import numeric
+from phantom.predicates import simplify_predicate
+
+from .utils import assert_predicate_name_equals
+
+
+def opaque(value: object) -> bool:
+    return value == 3
+
+
+predicates: tuple[Predicate, ...] = (
+    opaque,
+    boolean.both(boolean.both(numeric.positive, numeric.even), opaque),
+    boolean.all_of([numeric.ge(0), numeric.le(4), numeric.even]),
+    boolean.all_of([numeric.less(4), numeric.greater(0)]),
+    boolean.both(numeric.ge(0), numeric.less(4)),
+    boolean.both(numeric.greater(0), numeric.le(4)),
+    boolean.either(boolean.any_of([numeric.negative, opaque]), numeric.even),
+    boolean.negate(boolean.negate(numeric.even)),
+    boolean.negate(boolean.true),
+    boolean.both(boolean.true, numeric.odd),
+    boolean.both(numeric.odd, boolean.false),
+    boolean.either(boolean.false, numeric.odd),
+    boolean.either(numeric.odd, boolean.true),
+    boolean.all_of([numeric.odd, numeric.odd, opaque]),
+    boolean.any_of([generic.equal(2), generic.equal(2), generic.equal(2.0)]),
+    boolean.one_of([numeric.odd, numeric.odd]),
+    boolean.xor(boolean.negate(boolean.negate(numeric.odd)), opaque),
+    numeric.modulo(3, boolean.both(boolean.true, generic.equal(1))),
+)
+values = (-3, -1, 0, 1, 2, 2.5, 3, 4, 5.0, True, False)
+
+
+class TestSimplifyPredicate:
+    @pytest.mark.parametrize("predicate", predicates)
+    @pytest.mark.parametrize("value", values)
+    def test_simplified_predicate_is_equivalent(
+        self, predicate: Predicate, value: object
+    ) -> None:
+        assert simplify_predicate(predicate)(value) == predicate(value)
+
+    def test_flattens_nested_conjunctions(self) -> None:
+        predicate = boolean.both(
+            boolean.both(numeric.positive, numeric.even),
+            boolean.all_of([opaque, boolean.both(numeric.odd, generic.equal(1))]),
+        )
+        assert_predicate_name_equals(
+            simplify_predicate(predicate),
+            "all_of(positive, even, opaque, odd, equal(1))",
+        )
+
+    def test_flattens_nested_disjunctions(self) -> None:
+        predicate = boolean.either(
+            boolean.any_of([numeric.negative, numeric.even]),
+            boolean.either(opaque, numeric.odd),
+        )
+        assert_predicate_name_equals(
+            simplify_predicate(predicate), "any_of(negative, even, opaque, odd)"
+        )
+
+    def test_does_not_flatten_mixed_operators(self) -> None:
+        predicate = boolean.both(numeric.positive, boolean.either(opaque, numeric.odd))
+        assert simplify_predicate(predicate) is predicate
+
+    @pytest.mark.parametrize(
+        "lower, upper, expected",
+        (
+            (numeric.ge(0), numeric.le(10), "inclusive(0, 10)"),
+            (numeric.ge(0), numeric.less(10), "inclusive_exclusive(0, 10)"),
+            (numeric.greater(0), numeric.le(10), "exclusive_inclusive(0, 10)"),
+            (numeric.greater(0), numeric.less(10), "exclusive(0, 10)"),
+        ),
+    )
+    def test_merges_adjacent_bounds_into_interval(
+        self, lower: Predicate, upper: Predicate, expected: str
+    ) -> None:
+        assert_predicate_name_equals(
+            simplify_predicate(boolean.both(lower, upper)), expected
+        )
+        assert_predicate_name_equals(
+            simplify_predicate(boolean.both(upper, lower)), expected
+        )
+
+    def test_does_not_merge_bounds_separated_by_other_predicate(self) -> None:
+        predicate: Predicate[int] = boolean.all_of(
+            [numeric.ge(0), generic.of_type(int), numeric.le(5)]
+        )
+        assert simplify_predicate(predicate) is predicate
+
+    def test_removes_double_negation(self) -> None:
+        predicate = boolean.negate(boolean.negate(boolean.negate(numeric.even)))
+        assert_predicate_name_equals(simplify_predicate(predicate), "negate(even)")
+        assert (
+            simplify_predicate(boolean.negate(boolean.negate(numeric.even)))
+            is numeric.even
+        )
+
+    @pytest.mark.parametrize(
+        "predicate, expected",
+        (
+            (boolean.negate(boolean.true), boolean.false),
+            (boolean.negate(boolean.false), boolean.true),
+            (boolean.both(boolean.true, numeric.even), numeric.even),
+            (boolean.both(numeric.even, boolean.false), boolean.false),
+            (boolean.all_of([boolean.true, boolean.true]), boolean.true),
+            (boolean.all_of([]), boolean.true),
+            (boolean.either(boolean.false, numeric.even), numeric.even),
+            (boolean.either(numeric.even, boolean.true), boolean.true),
+            (boolean.any_of([boolean.false, boolean.false]), boolean.false),
+            (boolean.any_of([]), boolean.false),
+        ),
+    )
+    def test_folds_constants(self, predicate: Predicate, expected: Predicate) -> None:
+        assert simplify_predicate(predicate) is expected
+
+    def test_removes_duplicate_operands(self) -> None:
+        predicate = boolean.all_of(
+            [numeric.greater(2), numeric.even, numeric.greater(2), numeric.even]
+        )
+        assert_predicate_name_equals(
+            simplify_predicate(predicate), "both(greater(2), even)"
+        )
+
+    def test_keeps_operands_that_are_equal_but_of_different_types(self) -> None:
+        predicate = boolean.any_of([generic.equal(1), generic.equal(True)])
+        assert simplify_predicate(predicate) is predicate
+
+    def test_keeps_duplicate_operands_of_one_of(self) -> None:
+        predicate = boolean.one_of([numeric.odd, numeric.odd])
+        assert simplify_predicate(predicate) is predicate
+        assert predicate(1) is False
+
+    def test_simplifies_operands_of_other_factories(self) -> None:
+        predicate = collection.every(
+            boolean.both(numeric.ge(0), boolean.negate(boolean.negate(numeric.le(2))))
+        )
+        simplified = simplify_predicate(predicate)
+        assert_predicate_name_equals(simplified, "every(inclusive(0, 2))")
+        assert simplified((0, 1, 2)) is True
+        assert simplified((0, 3)) is False
+
+    def test_returns_predicate_that_cannot_be_simplified(self) -> None:
+        assert simplify_predicate(opaque) is opaque
+        predicate = boolean.both(numeric.positive, opaque)
+        assert simplify_predicate(predicate) is predicate
+
+    def test_returns_predicate_too_deep_to_simplify(self) -> None:
+        predicate: Predicate[int] = numeric.positive
+        for _ in range(1000):
+            predicate = boolean.both(predicate, opaque)
+        assert simplify_predicate(predicate) is predicate
+
+    def test_phantom_type_uses_simplified_check(self) -> None:
+        class Small(
+            int,
+            Phantom,
+            predicate=boolean.both(
+                boolean.both(numeric.ge(0), numeric.le(10)), boolean.true
+            ),
+        ): ...
+
+        node = get_node(Small.__instance_predicate__)
+        assert node is not None
+        assert node.factory is boolean.both
+        bounds = get_node(node.children[1])
+        assert bounds is not None
+        assert bounds.factory is interval.inclusive
+        assert isinstance(5, Small)
+        assert not isinstance(11, Small)
+        assert not isinstance("5", Small)
@@ -1,6 +1,9 @@
 from functools import partial
 
+from phantom.errors import get_repr_limit
 from phantom.predicates import boolean
+from phantom.predicates import collection
+from phantom.predicates import generic
 
 from .utils import assert_predicate_name_equals
 
@@ -15,3 +18,18 @@ class TestFunctionRepr:
         assert_predicate_name_equals(boolean.negate(predicate), "negate(foo(10, b=5))")
         predicate = partial(foo, 23, c=31)
         assert_predicate_name_equals(boolean.negate(predicate), "negate(foo(23, c=31))")
+
+
+class TestTruncatedNames:
+    def test_truncates_repr_of_large_argument(self):
+        predicate = collection.contained(frozenset(range(100_000)))
+        assert predicate.__name__.startswith("contained(frozenset({0, 1, 2, ")
+        assert len(predicate.__name__) <= len("contained()") + get_repr_limit()
+
+    def test_truncates_repr_of_partial_arguments(self):
+        predicate = partial(foo, 10**1000, c=10**1000)
+        name = boolean.negate(predicate).__name__
+        assert len(name) <= len("negate(foo(, c=))") + 2 * get_repr_limit()
+
+    def test_keeps_repr_of_small_argument(self):
+        assert_predicate_name_equals(generic.equal("abc"), "equal('abc')")
@@ -0,0 +1,141 @@
+"""
+Checks that shipped predicates and phantom types don't allocate memory when called.
+
+Predicates that iterate their argument, e.g. ``collection.every``, allocate an
+iterator, and regular expression predicates allocate a match object, so they're not
+covered. The builtin :py:func:`isinstance` allocates a bound method when it calls the
+``__instancecheck__`` of a metaclass, so phantom types are checked by calling the
+instance check of their metaclass directly.
+"""
+
+import datetime
+import tracemalloc
+from collections.abc import Callable
+
+import pytest
+
+from phantom import Phantom
+from phantom import PhantomMeta
+from phantom.boolean import Falsy
+from phantom.boolean import Truthy
+from phantom.datetime import TZAware
+from phantom.datetime import TZNaive
+from phantom.interval import Natural
+from phantom.interval import NegativeInt
+from phantom.interval import Portion
+from phantom.iso3166 import ParsedAlpha2
+from phantom.negated import SequenceNotStr
+from phantom.predicates import Predicate
+from phantom.predicates import boolean
+from phantom.predicates import collection
+from phantom.predicates import datetime as datetime_predicates
+from phantom.predicates import generic
+from phantom.predicates import interval
+from phantom.predicates import numeric
+from phantom.predicates.adaptive import adaptive
+from phantom.sized import Empty
+from phantom.sized import NonEmpty
+from phantom.sized import NonEmptyStr
+
+naive = datetime.datetime(2020, 1, 1)
+aware = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def allocated(check: Callable[[object], object], value: object) -> int:
+    # Warm up, so that caches and specialized bytecode aren't counted.
+    for _ in range(10):
+        check(value)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        check(value)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - current
+
+
+def frozen_adaptive(predicate: Predicate) -> Predicate:
+    check = adaptive(predicate)
+    check.freeze()
+    return check
+
+
+predicates = (
+    (boolean.true, 1),
+    (boolean.false, 1),
+    (boolean.truthy, 1),
+    (boolean.falsy, 0),
+    (boolean.negate(numeric.positive), 1),
+    (boolean.both(numeric.positive, numeric.even), 2),
+    (boolean.either(numeric.negative, numeric.even), 3),
+    (boolean.xor(numeric.positive, numeric.even), 2),
+    (boolean.all_of([numeric.positive, numeric.even, numeric.le(10)]), 2),
+    (boolean.any_of([numeric.negative, numeric.odd, numeric.le(10)]), 2),
+    (boolean.one_of([numeric.negative, numeric.odd, numeric.le(10)]), 2),
+    (frozen_adaptive(boolean.both(numeric.positive, numeric.even)), 2),
+    (frozen_adaptive(boolean.either(numeric.negative, numeric.even)), 3),
+    (collection.contains(1), (0, 1)),
+    (collection.contained(frozenset({1, 2})), 1),
+    (collection.count(numeric.le(2)), (0, 1)),
+    (datetime_predicates.is_tz_aware, aware),
+    (datetime_predicates.is_tz_aware, naive),
+    (datetime_predicates.is_tz_naive, aware),
+    (datetime_predicates.is_tz_naive, naive),
+    (generic.equal(1), 1),
+    (generic.identical(1), 1),
+    (generic.of_type(int), 1),
+    (interval.exclusive(0, 10), 5),
+    (interval.exclusive_inclusive(0, 10), 5),
+    (interval.inclusive_exclusive(0, 10), 5),
+    (interval.inclusive(0, 10), 5),
+    (numeric.less(1), 0),
+    (numeric.le(1), 0),
+    (numeric.greater(1), 0),
+    (numeric.ge(1), 0),
+    (numeric.positive, 1),
+    (numeric.non_positive, 1),
+    (numeric.negative, 1),
+    (numeric.non_negative, 1),
+    (numeric.modulo(3, generic.equal(1)), 4),
+    (numeric.even, 3),
+    (numeric.odd, 3),
+)
+
+
+@pytest.mark.parametrize("predicate, value", predicates)
+def test_predicate_does_not_allocate(predicate: Predicate, value: object) -> None:
+    assert allocated(predicate, value) == 0
+
+
+class Small(int, Phantom, predicate=interval.inclusive(0, 10)): ...
+
+
+types = (
+    (Truthy, 1),
+    (Falsy, 0),
+    (TZAware, aware),
+    (TZNaive, naive),
+    (Natural, 1),
+    (Natural, -1),
+    (NegativeInt, -1),
+    (Portion, 0.5),
+    (NonEmpty, (1,)),
+    (NonEmptyStr, "a"),
+    (NonEmptyStr, ""),
+    (Empty, ()),
+    (ParsedAlpha2, "SE"),
+    (SequenceNotStr, (1,)),
+    (Small, 5),
+    (Small, "5"),
+)
+
+
+@pytest.mark.parametrize("type_, value", types)
+def test_instance_check_does_not_allocate(type_: PhantomMeta, value: object) -> None:
+    def check(value: object) -> bool:
+        return PhantomMeta.__instancecheck__(type_, value)
+
+    assert allocated(check, value) == 0
@@ -1,20 +1,50 @@
+import datetime
+import multiprocessing
+import operator
+import pickle
 import sys
+from collections import deque
 from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
+from typing import Any
+from typing import Literal
+from typing import NamedTuple
 from typing import Union
 
 import pytest
+from typeguard import CollectionCheckStrategy
 
 from phantom import Phantom
+from phantom import PhantomBase
 from phantom import PhantomMeta
 from phantom._base import AbstractInstanceCheck
 from phantom._base import MutableType
 from phantom._utils.misc import UnresolvedClassAttribute
 from phantom.bounds import Parser
+from phantom.bounds import _plain_classes
+from phantom.bounds import display_bound
 from phantom.bounds import get_bound_parser
+from phantom.bounds import get_bound_predicate
+from phantom.bounds import get_default_collection_check
+from phantom.bounds import runtime_bound
+from phantom.bounds import set_default_collection_check
+from phantom.datetime import TZAware
 from phantom.errors import BoundError
+from phantom.errors import LazyMessage
+from phantom.errors import ParseFailure
+from phantom.interval import Natural
+from phantom.interval import Portion
+from phantom.iso3166 import ParsedAlpha2
+from phantom.negated import SequenceNotStr
 from phantom.predicates import boolean
+from phantom.predicates.memoize import IdentityMemoizedPredicate
 from phantom.predicates.numeric import positive
+from phantom.sized import NonEmptyStr
+from phantom.sized import SizedIterable
 
 
 class TestParseBound:
@@ -46,6 +76,16 @@ class TestParseBound:
         ):
             parser("3")
 
+    def test_truncates_repr_of_large_value(self):
+        parser: Parser[int] = get_bound_parser(int)
+        with pytest.raises(BoundError) as exc_info:
+            parser("a" * 10_000_000)
+        assert len(str(exc_info.value)) < 300
+
+    def test_caches_displayed_bound(self):
+        assert display_bound(tuple[int, ...]) is display_bound(tuple[int, ...])
+        assert display_bound([int, float]) == "Intersection[int, float]"
+
     @pytest.mark.skipif(sys.version_info < (3, 10), reason="requires 3.10+")
     def test_raises_for_invalid_pep_604_union(self):
         parser: Parser[int | float] = get_bound_parser(int | float)
@@ -81,6 +121,85 @@ class TestParseBound:
         assert parser(b) is b
         assert parser(c) is c
 
+    def test_float_bound_accepts_int(self):
+        value = 1
+        assert get_bound_parser(float)(value) is value
+
+    def test_parser_is_cached_by_bound(self):
+        assert get_bound_parser(int) is get_bound_parser(int)
+        assert get_bound_parser((int, float)) is get_bound_parser((int, float))
+        assert get_bound_predicate(int) is get_bound_predicate(int)
+
+    def test_checks_values_against_phantom_type_bound(self):
+        class Positive(int, Phantom, predicate=positive): ...
+
+        class Small(Phantom, bound=Positive, predicate=lambda value: value < 10): ...
+
+        assert not isinstance(-1, Small)
+        assert isinstance(5, Small)
+        within_bound = get_bound_predicate((int, Positive))
+        assert not within_bound(-1)
+        assert within_bound(5)
+
+    def test_rechecks_values_after_registering_virtual_subclass(self):
+        class A: ...
+
+        within_bound = get_bound_predicate(Sequence)
+        within_intersection = get_bound_predicate((A, Sequence))
+        assert not within_bound(A())
+        assert not within_intersection(A())
+        Sequence.register(A)
+        assert within_bound(A())
+        assert within_intersection(A())
+
+
+class TestPlainClasses:
+    @pytest.mark.parametrize(
+        "bound, expected",
+        [
+            (str, (str,)),
+            (object, (object,)),
+            (datetime.datetime, (datetime.datetime,)),
+            (float, (float, int)),
+            (int | str, (int, str)),
+            (Union[int, None], (int, type(None))),  # noqa: UP007
+            (tuple, (tuple,)),
+        ],
+    )
+    def test_returns_classes_for_plain_bound(self, bound: object, expected: tuple):
+        assert _plain_classes(bound) == expected
+
+    @pytest.mark.parametrize(
+        "bound",
+        [
+            tuple[int, ...],
+            Sequence[str],
+            int | tuple[int, ...],
+            SizedIterable,
+            Any,
+            NamedTuple("Point", [("x", int)]),
+        ],
+    )
+    def test_returns_none_for_bound_requiring_full_type_check(self, bound: object):
+        assert _plain_classes(bound) is None
+
+
+class TestRuntimeBound:
+    @pytest.mark.parametrize(
+        "bound, expected",
+        [
+            (int, int),
+            ((int, float), (int, float)),
+            (tuple[int, ...], tuple),
+            (Sequence[str], Sequence),
+            (tuple[int, ...] | frozenset[int], Union[tuple, frozenset]),  # noqa: UP007
+            (Literal[1], None),
+            (Any, None),
+        ],
+    )
+    def test_erases_type_parameters(self, bound: object, expected: object):
+        assert runtime_bound(bound) == expected
+
 
 class TestPhantom:
     def test_subclass_without_predicate_raises(self):
@@ -134,6 +253,151 @@ class TestPhantom:
 
         assert A.__bound__ is float
 
+    def test_predicate_first_is_inherited(self):
+        class A(Phantom, bound=tuple, predicate_first=True, abstract=True): ...
+
+        class B(A, bound=tuple[int, ...], predicate=boolean.true): ...
+
+        assert B.__predicate_first__ is True
+
+    def test_predicate_first_is_noop_for_plain_bound(self):
+        checked = []
+
+        def predicate(value: tuple) -> bool:
+            checked.append(value)
+            return True
+
+        class A(Phantom, bound=tuple, predicate=predicate, predicate_first=True): ...
+
+        assert isinstance((1,), A)
+        assert not isinstance([1], A)
+        assert checked == [(1,)]
+
+    def test_predicate_first_checks_full_bound_after_predicate(self):
+        checked = []
+
+        def predicate(value: tuple) -> bool:
+            checked.append(value)
+            return True
+
+        class A(
+            Phantom,
+            bound=tuple[int, ...],
+            predicate=predicate,
+            predicate_first=True,
+        ): ...
+
+        assert isinstance((1, 2), A)
+        assert not isinstance(("a",), A)
+        assert not isinstance([1], A)
+        assert checked == [(1, 2), ("a",)]
+
+    def test_uses_default_collection_check(self):
+        class A(Phantom, bound=tuple[int, ...], predicate=boolean.true): ...
+
+        assert A.__collection_check__ is get_default_collection_check()
+        assert not isinstance((1, "a"), A)
+
+    def test_can_set_default_collection_check(self):
+        previous = get_default_collection_check()
+        set_default_collection_check(CollectionCheckStrategy.FIRST_ITEM)
+        try:
+
+            class A(Phantom, bound=tuple[int, ...], predicate=boolean.true): ...
+
+        finally:
+            set_default_collection_check(previous)
+
+        assert A.__collection_check__ is CollectionCheckStrategy.FIRST_ITEM
+        assert isinstance((1, "a"), A)
+
+    def test_can_cache_verdicts(self):
+        checked = []
+
+        def predicate(value: int) -> bool:
+            checked.append(value)
+            return value > 0
+
+        class A(int, Phantom, predicate=predicate, cache=2): ...
+
+        class B(A): ...
+
+        class C(A, cache=0): ...
+
+        assert [isinstance(value, A) for value in (1, -1, 1, "a", 1)] == [
+            True,
+            False,
+            True,
+            False,
+            True,
+        ]
+        assert checked == [1, -1]
+        assert A.__memoized_predicate__ is not None
+        assert A.__memoized_predicate__.cache_info().hits == 2
+        assert B.__cache_size__ == 2
+        assert isinstance(1, B)
+        assert C.__memoized_predicate__ is None
+        assert isinstance(1, C)
+        assert isinstance(1, C)
+        assert checked == [1, -1, 1, 1, 1]
+
+    def test_checks_bound_of_values_with_cached_verdicts(self):
+        class A(Phantom, bound=tuple[int, ...], predicate=boolean.true, cache=100): ...
+
+        assert isinstance((1,), A)
+        assert not isinstance((1.0,), A)
+        assert isinstance((1,), A)
+
+    def test_can_cache_verdicts_by_identity(self):
+        checked: list[object] = []
+
+        def predicate(value: tuple[int, ...]) -> bool:
+            checked.append(value)
+            return len(value) > 1
+
+        class A(
+            Phantom, bound=tuple[int, ...], predicate=predicate, identity_cache=2
+        ): ...
+
+        value: object = (1, 2)
+        assert isinstance(value, A)
+        assert isinstance(value, A)
+        assert not isinstance((1, "a"), A)
+        assert checked == [value]
+        assert isinstance(A.__instance_predicate__, IdentityMemoizedPredicate)
+        assert A.__instance_predicate__.cache_info().hits == 1
+
+    def test_can_cache_verdicts_of_partial_predicate(self):
+        class A(int, Phantom, predicate=partial(operator.le, 0), cache=10): ...
+
+        class B(
+            Phantom,
+            bound=tuple[int, ...],
+            predicate=partial(operator.is_not, None),
+            identity_cache=10,
+        ): ...
+
+        assert A.__memoized_predicate__ is not None
+        assert A.__memoized_predicate__.__name__ == "memoize(le(0, ))"
+        assert isinstance(1, A)
+        assert not isinstance(-1, A)
+        assert isinstance((1, 2), B)
+        assert not isinstance(("a",), B)
+
+    def test_can_define_and_inherit_collection_check(self):
+        class A(
+            Phantom,
+            bound=tuple[int, ...],
+            collection_check=CollectionCheckStrategy.FIRST_ITEM,
+            abstract=True,
+        ): ...
+
+        class B(A, predicate=boolean.true): ...
+
+        assert B.__collection_check__ is CollectionCheckStrategy.FIRST_ITEM
+        assert isinstance((1, "a"), B)
+        assert not isinstance(("a", 1), B)
+
     def test_can_inherit_bound(self):
         class A(Phantom, bound=float, abstract=True): ...
 
@@ -182,3 +446,217 @@ class TestPhantom:
                 return True
 
         assert isinstance("a", AlwaysTrue) is True
+
+    def test_resolves_instance_checkable_on_class_creation(self):
+        class Alt(metaclass=PhantomMeta): ...
+
+        class AlwaysTrue(metaclass=PhantomMeta):
+            @classmethod
+            def __instancecheck__(self, instance: object) -> bool:
+                return True
+
+        class Sub(AlwaysTrue): ...
+
+        assert Alt.__instance_checkable__ is False
+        assert AlwaysTrue.__instance_checkable__ is True
+        assert Sub.__instance_checkable__ is True
+        assert isinstance("a", Sub) is True
+
+
+class TestParseMany:
+    def test_returns_list_of_values(self):
+        class A(int, Phantom, predicate=positive): ...
+
+        values = [1, 2, 3]
+        parsed = A.parse_many(iter(values))
+        assert parsed == values
+        assert all(p is v for p, v in zip(parsed, values, strict=True))
+
+    def test_formats_error_lazily(self):
+        class A(int, Phantom, predicate=positive): ...
+
+        for parse in (A.parse, lambda value: A.parse_many([1, value])):
+            with pytest.raises(TypeError) as exc_info:
+                parse("a" * 10_000_000)
+            assert isinstance(exc_info.value.args[0], LazyMessage)
+            assert len(str(exc_info.value)) < 300
+
+    def test_raises_for_first_invalid_value(self):
+        class A(int, Phantom, predicate=positive): ...
+
+        with pytest.raises(TypeError, match=r"A from -1$"):
+            A.parse_many([1, -1, "a"])
+
+    def test_parses_each_value_for_type_with_custom_parse(self):
+        class A(int, Phantom, predicate=positive):
+            @classmethod
+            def parse(cls, instance: object) -> "A":
+                return super().parse(int(instance))  # type: ignore[call-overload]
+
+        assert A.parse_many(["1", 2]) == [1, 2]
+
+    def test_abstract_type_raises(self):
+        class A(Phantom, bound=int, abstract=True): ...
+
+        with pytest.raises(AbstractInstanceCheck):
+            A.parse_many([1])
+
+
+class TestTryParse:
+    def test_returns_instance(self):
+        class A(int, Phantom, predicate=positive): ...
+
+        assert A.try_parse(1) == 1
+
+    def test_returns_default_for_invalid_value(self):
+        class A(int, Phantom, predicate=positive): ...
+
+        assert A.try_parse(-1) is None
+        assert A.try_parse("a", default=0) == 0
+
+    def test_catches_errors_of_custom_parse(self):
+        class A(int, Phantom, predicate=positive):
+            @classmethod
+            def parse(cls, instance: object) -> "A":
+                return super().parse(int(instance))  # type: ignore[call-overload]
+
+        assert A.try_parse("1") == 1
+        assert A.try_parse("-1") is None
+        assert A.try_parse("a") is None
+
+    def test_abstract_type_raises(self):
+        class A(Phantom, bound=int, abstract=True): ...
+
+        with pytest.raises(AbstractInstanceCheck):
+            A.try_parse(1)
+
+    def test_defaults_to_instance_check_for_phantom_base(self):
+        class Odd(int, PhantomBase):
+            @classmethod
+            def __instancecheck__(cls, instance: object) -> bool:
+                return isinstance(instance, int) and instance % 2 == 1
+
+        assert Odd.try_parse(1) == 1
+        assert Odd.try_parse(2) is None
+
+
+class TestIsValidMany:
+    def test_returns_mask_of_instances(self):
+        class A(int, Phantom, predicate=positive): ...
+
+        assert A.is_valid_many(iter([1, -1, "a", 2])) == bytearray([1, 0, 0, 1])
+
+    def test_normalizes_truthy_predicate_results(self):
+        class A(str, Phantom, predicate=len): ...
+
+        assert A.is_valid_many(["a" * 300, ""]) == bytearray([1, 0])
+
+    def test_abstract_type_raises(self):
+        class A(Phantom, bound=int, abstract=True): ...
+
+        with pytest.raises(AbstractInstanceCheck):
+            A.is_valid_many([1])
+
+    def test_defaults_to_instance_check_for_phantom_base(self):
+        class Odd(int, PhantomBase):
+            @classmethod
+            def __instancecheck__(cls, instance: object) -> bool:
+                return isinstance(instance, int) and instance % 2 == 1
+
+        assert Odd.is_valid_many([1, 2, "a"]) == bytearray([1, 0, 0])
+        assert Odd.parse_many([1, 3]) == [1, 3]
+        with pytest.raises(TypeError):
+            Odd.parse_many([1, 2])
+
+
+class TestIterParse:
+    class Positive(int, Phantom, predicate=positive): ...
+
+    class ParsedPositive(Positive):
+        @classmethod
+        def parse(cls, instance: object) -> "TestIterParse.ParsedPositive":
+            return super().parse(int(instance))  # type: ignore[call-overload]
+
+    parametrize_types = pytest.mark.parametrize("type_", (Positive, ParsedPositive))
+
+    @parametrize_types
+    def test_yields_parsed_values_lazily(self, type_: type[Positive]):
+        consumed = []
+
+        def values() -> Iterator[int]:
+            for i in range(1, 6):
+                consumed.append(i)
+                yield i
+
+        parsed = type_.iter_parse(values(), chunksize=2)
+        assert consumed == []
+        assert next(parsed) == 1
+        assert consumed == [1, 2]
+        assert list(parsed) == [2, 3, 4, 5]
+
+    @parametrize_types
+    def test_raises_after_yielding_preceding_values(self, type_: type[Positive]):
+        parsed = type_.iter_parse([1, 2, -1, 3], chunksize=10)
+        assert next(parsed) == 1
+        assert next(parsed) == 2
+        with pytest.raises(TypeError, match=r"from -1$"):
+            next(parsed)
+
+    @parametrize_types
+    def test_skips_invalid_values(self, type_: type[Positive]):
+        parsed = type_.iter_parse([1, -1, 2, -2, 3], on_error="skip", chunksize=2)
+        assert list(parsed) == [1, 2, 3]
+
+    @parametrize_types
+    def test_collects_invalid_values(self, type_: type[Positive]):
+        errors: deque[ParseFailure] = deque(maxlen=2)
+        parsed = type_.iter_parse(
+            [-1, 1, -2, 2, -3], on_error="collect", errors=errors, chunksize=2
+        )
+        assert list(parsed) == [1, 2]
+        assert [error.index for error in errors] == [2, 4]
+        assert errors[-1].reason.endswith("from -3")
+
+    def test_catches_value_error(self):
+        errors: list[ParseFailure] = []
+        parsed = self.ParsedPositive.iter_parse(
+            ["a", "1"], on_error="collect", errors=errors
+        )
+        assert list(parsed) == [1]
+        assert errors == [
+            ParseFailure(0, "invalid literal for int() with base 10: 'a'")
+        ]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        (
+            {"on_error": "ignore"},
+            {"on_error": "collect"},
+            {"chunksize": 0},
+        ),
+    )
+    def test_raises_value_error_for_invalid_arguments(self, kwargs: dict):
+        with pytest.raises(ValueError):
+            self.Positive.iter_parse([], **kwargs)
+
+
+class TestPickle:
+    types = (NonEmptyStr, Natural, Portion, TZAware, SequenceNotStr, ParsedAlpha2)
+
+    @pytest.mark.parametrize("type_", types)
+    def test_pickles_phantom_type_by_reference(self, type_: type[Phantom]):
+        assert pickle.loads(pickle.dumps(type_)) is type_  # noqa: S301
+
+    def test_phantom_types_can_be_checked_by_spawned_worker(self):
+        values = ("", "a", -1, 1, 0.5, 2.0, (1,), "SE", "XX")
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            # Each type is pickled by reference and imported by the worker.
+            verdicts = [
+                executor.submit(isinstance, value, type_).result()
+                for type_ in self.types
+                for value in values
+            ]
+        assert verdicts == [
+            isinstance(value, type_) for type_ in self.types for value in values
+        ]
@@ -6,6 +6,7 @@ from phantom import BoundError
 from phantom.datetime import TZAware
 from phantom.datetime import TZNaive
 from phantom.errors import MissingDependency
+from phantom.errors import ParseFailure
 
 parametrize_aware = pytest.mark.parametrize(
     "dt",
@@ -141,6 +142,46 @@ class TestTZAware:
         with pytest.raises(MissingDependency):
             TZAware.parse(value)
 
+    @parametrize_aware
+    def test_try_parse_returns_instance(self, dt: datetime.datetime):
+        assert dt is TZAware.try_parse(dt)
+
+    @parametrize_naive
+    def test_try_parse_returns_default_for_naive_datetime(self, dt: datetime.datetime):
+        assert TZAware.try_parse(dt) is None
+
+    @parametrize_invalid_type
+    def test_try_parse_returns_default_for_non_str_object(self, value: object):
+        sentinel = object()
+        assert TZAware.try_parse(value, sentinel) is sentinel
+
+    @pytest.mark.external
+    @parametrize_invalid_str
+    def test_try_parse_returns_default_for_invalid_str(self, value: object):
+        assert TZAware.try_parse(value) is None
+
+    @pytest.mark.external
+    def test_try_parse_returns_default_for_out_of_range_str(self):
+        assert TZAware.try_parse("99999999999999999999999") is None
+
+    @pytest.mark.external
+    def test_parse_raises_type_error_for_out_of_range_str(self):
+        with pytest.raises(TypeError, match="^Could not parse datetime"):
+            TZAware.parse("99999999999999999999999")
+        errors: list[ParseFailure] = []
+        parsed = TZAware.iter_parse(
+            ["99999999999999999999999"], on_error="collect", errors=errors
+        )
+        assert list(parsed) == []
+        assert [error.index for error in errors] == [0]
+
+    @pytest.mark.external
+    @parametrize_aware_str
+    def test_try_parse_can_parse_valid_str(
+        self, value: str, expected: datetime.datetime
+    ):
+        assert TZAware.try_parse(value) == expected
+
 
 class TestTZNaive:
     @parametrize_naive
@@ -193,3 +234,43 @@ class TestTZNaive:
     ):
         with pytest.raises(MissingDependency):
             TZNaive.parse(value)
+
+    @parametrize_naive
+    def test_try_parse_returns_instance(self, dt: datetime.datetime):
+        assert dt is TZNaive.try_parse(dt)
+
+    @parametrize_aware
+    def test_try_parse_returns_default_for_aware_datetime(self, dt: datetime.datetime):
+        assert TZNaive.try_parse(dt) is None
+
+    @parametrize_invalid_type
+    def test_try_parse_returns_default_for_non_str_object(self, value: object):
+        sentinel = object()
+        assert TZNaive.try_parse(value, sentinel) is sentinel
+
+    @pytest.mark.external
+    @parametrize_invalid_str
+    def test_try_parse_returns_default_for_invalid_str(self, value: object):
+        assert TZNaive.try_parse(value) is None
+
+    @pytest.mark.external
+    def test_try_parse_returns_default_for_out_of_range_str(self):
+        assert TZNaive.try_parse("99999999999999999999999") is None
+
+    @pytest.mark.external
+    def test_parse_raises_type_error_for_out_of_range_str(self):
+        with pytest.raises(TypeError, match="^Could not parse datetime"):
+            TZNaive.parse("99999999999999999999999")
+        errors: list[ParseFailure] = []
+        parsed = TZNaive.iter_parse(
+            ["99999999999999999999999"], on_error="collect", errors=errors
+        )
+        assert list(parsed) == []
+        assert [error.index for error in errors] == [0]
+
+    @pytest.mark.external
+    @parametrize_naive_str
+    def test_try_parse_can_parse_valid_str(
+        self, value: str, expected: datetime.datetime
+    ):
+        assert TZNaive.try_parse(value) == expected
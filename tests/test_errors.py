@@ -0,0 +1,82 @@
+import pickle
+
+import pytest
+
+from phantom.errors import LazyMessage
+from phantom.errors import get_repr_limit
+from phantom.errors import set_repr_limit
+from phantom.errors import truncated_repr
+
+
+class CountingRepr:
+    calls = 0
+
+    def __repr__(self) -> str:
+        type(self).calls += 1
+        return "CountingRepr()"
+
+
+class TestTruncatedRepr:
+    def test_returns_repr_of_small_value(self):
+        assert truncated_repr((1, "a")) == "(1, 'a')"
+
+    @pytest.mark.parametrize(
+        "value",
+        (
+            "a" * 10_000_000,
+            tuple(range(1_000_000)),
+            [["a" * 1000] * 1000] * 1000,
+            {i: str(i) for i in range(100_000)},
+            frozenset(range(100_000)),
+        ),
+    )
+    def test_truncates_large_value(self, value: object):
+        assert len(truncated_repr(value)) <= get_repr_limit()
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        (
+            (set(), "set()"),
+            (frozenset(), "frozenset()"),
+            ({3, 1, 2}, "{1, 2, 3}"),
+            (frozenset({3, 1, 2}), "frozenset({1, 2, 3})"),
+            (frozenset(range(1000, 0, -1)), "frozenset({1, 2, 3, 4, 5, 6, 7, 8,"),
+        ),
+    )
+    def test_displays_smallest_items_of_sets(self, value: object, expected: str):
+        assert truncated_repr(value).startswith(expected)
+
+    def test_displays_sets_of_unorderable_items(self):
+        assert truncated_repr({1}) == "{1}"
+        assert len(truncated_repr({1, "a", *range(1000)})) <= get_repr_limit()
+
+    def test_can_set_limit(self):
+        previous = get_repr_limit()
+        set_repr_limit(10)
+        try:
+            assert truncated_repr("a" * 100) == "'aa...aaa'"
+        finally:
+            set_repr_limit(previous)
+
+    def test_raises_for_invalid_limit(self):
+        with pytest.raises(ValueError):
+            set_repr_limit(0)
+
+
+class TestLazyMessage:
+    def test_formats_message_once_on_first_conversion_to_str(self):
+        CountingRepr.calls = 0
+        message = LazyMessage("Value: {}", CountingRepr())
+        assert CountingRepr.calls == 0
+        assert str(message) == "Value: CountingRepr()"
+        assert str(message) == "Value: CountingRepr()"
+        assert CountingRepr.calls == 1
+
+    def test_exception_displays_formatted_message(self):
+        error = TypeError(LazyMessage("Could not parse {}", "a"))
+        assert str(error) == "Could not parse 'a'"
+        assert repr(error) == "TypeError(\"Could not parse 'a'\")"
+
+    def test_exception_can_be_pickled(self):
+        error = TypeError(LazyMessage("Could not parse {}", lambda: None))
+        assert str(pickle.loads(pickle.dumps(error))) == str(error)  # noqa: S301
@@ -32,6 +32,34 @@ class TestInterval:
 
         assert Great.parse("10") == 10
 
+    def test_try_parse_coerces_str(self):
+        class Great(int, Inclusive, low=10): ...
+
+        assert Great.try_parse("10") == 10
+        assert Great.try_parse("9") is None
+        assert Great.try_parse("a") is None
+        assert Great.try_parse(9, default=10) == 10
+
+    def test_parse_many_coerces_str(self):
+        class Great(int, Inclusive, low=10): ...
+
+        assert Great.parse_many(["10", 11]) == [10, 11]
+        with pytest.raises(TypeError, match=r"Great from 9$"):
+            Great.parse_many(["10", "9"])
+
+    def test_parse_many_uses_overridden_parse(self):
+        class Rounded(int, Inclusive, low=0):
+            @classmethod
+            def parse(cls, instance: object) -> Rounded:
+                if isinstance(instance, float):
+                    instance = round(instance)
+                return super().parse(instance)
+
+        assert Rounded.parse_many([1.6, "2", 3]) == [2, 2, 3]
+        assert Rounded.try_parse(1.6) == 2
+        with pytest.raises(TypeError):
+            Rounded.parse_many([-1.6])
+
     def test_allows_decimal_bound(self):
         class A(
             Decimal,
@@ -3,6 +3,7 @@ import pytest
 from phantom.iso3166 import InvalidCountryCode
 from phantom.iso3166 import ParsedAlpha2
 from phantom.iso3166 import normalize_alpha2_country_code
+from phantom.predicates.collection import contained
 
 
 class TestNormalizeAlpha2CountryCode:
@@ -39,3 +40,43 @@ class TestAlpha2:
     def test_raises_for_invalid_country_code(self, invalid: str) -> None:
         with pytest.raises(InvalidCountryCode):
             ParsedAlpha2.parse(invalid)
+
+    def test_parse_many_normalizes_valid_country_codes(self) -> None:
+        assert ParsedAlpha2.parse_many(iter(["ps", "AD"])) == ["PS", "AD"]
+
+    def test_parse_many_raises_for_invalid_country_code(self) -> None:
+        with pytest.raises(InvalidCountryCode):
+            ParsedAlpha2.parse_many(["PS", "SP"])
+
+    def test_is_valid_many_returns_mask_of_instances(self) -> None:
+        assert ParsedAlpha2.is_valid_many(["PS", "ps", 1, []]) == bytearray(
+            [1, 0, 0, 0]
+        )
+
+    def test_try_parse_normalizes_valid_country_code(self) -> None:
+        assert ParsedAlpha2.try_parse("ps") == "PS"
+
+    @pytest.mark.parametrize("invalid", ("SP", "da", 1))
+    def test_try_parse_returns_default_for_invalid_value(self, invalid: object) -> None:
+        assert ParsedAlpha2.try_parse(invalid) is None
+        assert ParsedAlpha2.try_parse(invalid, "") == ""
+
+
+class Nordic(ParsedAlpha2, predicate=contained({"SE", "NO", "DK", "FI", "IS"})): ...
+
+
+class TestNarrowedAlpha2:
+    def test_batch_methods_check_narrowed_predicate(self) -> None:
+        assert not isinstance("US", Nordic)
+        assert Nordic.is_valid_many(["US", "SE"]) == bytearray([0, 1])
+        assert list(Nordic.iter_parse(["us", "se"], on_error="skip")) == ["SE"]
+
+    def test_parsing_checks_narrowed_predicate(self) -> None:
+        assert Nordic.parse("se") == "SE"
+        assert Nordic.parse_many(["se", "no"]) == ["SE", "NO"]
+        assert Nordic.try_parse("se") == "SE"
+        assert Nordic.try_parse("us") is None
+        with pytest.raises(TypeError):
+            Nordic.parse("us")
+        with pytest.raises(TypeError):
+            Nordic.parse_many(["se", "us"])
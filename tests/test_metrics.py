@@ -0,0 +1,133 @@
+import math
+from collections.abc import Iterator
+from itertools import pairwise
+
+import pytest
+
+from phantom import Phantom
+from phantom import metrics
+from phantom.iso3166 import ParsedAlpha2
+from phantom.predicates.numeric import positive
+from phantom.re import FullMatch
+from phantom.validation import validation
+
+
+class Positive(int, Phantom, predicate=positive): ...
+
+
+class Digits(FullMatch, pattern=r"\d+"): ...
+
+
+name = f"{__name__}.Positive"
+
+
+@pytest.fixture
+def enabled() -> Iterator[None]:
+    metrics.enable()
+    metrics.reset()
+    try:
+        yield
+    finally:
+        metrics.disable()
+        metrics.reset()
+
+
+class TestMetrics:
+    def test_does_not_record_checks_while_disabled(self) -> None:
+        assert not metrics.is_enabled()
+        metrics.reset()
+        isinstance(1, Positive)
+        assert name not in metrics.snapshot()
+
+    def test_records_checks_and_parsing(self, enabled: None) -> None:
+        assert metrics.is_enabled()
+        assert isinstance(1, Positive)
+        assert not isinstance(-1, Positive)
+        assert Positive.parse(2) == 2
+        with pytest.raises(TypeError):
+            Positive.parse(-2)
+        assert Positive.is_valid_many([3, -3, "a"]) == bytearray([1, 0, 0])
+        snapshot = metrics.snapshot()[name]
+        assert snapshot["checks"] == 7
+        assert snapshot["passed"] == 3
+        assert snapshot["failed"] == 4
+        assert snapshot["failure_rate"] == pytest.approx(4 / 7)
+        assert snapshot["seconds"] > 0
+
+    def test_records_checks_of_specialized_batch_methods(self, enabled: None) -> None:
+        assert Digits.is_valid_many(["1", "a", 1]) == bytearray([1, 0, 0])
+        assert ParsedAlpha2.is_valid_many(["SE", "XX"]) == bytearray([1, 0])
+        snapshot = metrics.snapshot()
+        assert snapshot[f"{__name__}.Digits"]["checks"] == 3
+        assert snapshot[f"{__name__}.Digits"]["passed"] == 1
+        assert snapshot["phantom.iso3166.ParsedAlpha2"]["checks"] == 2
+        assert snapshot["phantom.iso3166.ParsedAlpha2"]["passed"] == 1
+
+    def test_merges_metrics_of_types_with_same_name(self, enabled: None) -> None:
+        def create() -> type:
+            class A(int, Phantom, predicate=positive): ...
+
+            return A
+
+        a, b = create(), create()
+        isinstance(1, a)
+        isinstance(-1, b)
+        snapshot = metrics.snapshot()[f"{__name__}.{a.__qualname__}"]
+        assert (snapshot["checks"], snapshot["passed"], snapshot["failed"]) == (2, 1, 1)
+        assert snapshot["buckets"][math.inf] == 2
+
+    def test_records_cumulative_histogram_of_durations(self, enabled: None) -> None:
+        for value in range(10):
+            isinstance(value, Positive)
+        buckets = metrics.snapshot()[name]["buckets"]
+        bounds = list(buckets)
+        assert bounds[0] == 1e-9
+        assert bounds[-1] == math.inf
+        assert all(a * 2 == pytest.approx(b) for a, b in pairwise(bounds[:-1]))
+        counts = list(buckets.values())
+        assert counts == sorted(counts)
+        assert counts[-1] == 10
+
+    def test_records_checks_in_validation_modes(self, enabled: None) -> None:
+        with validation("trusted"):
+            assert isinstance(-1, Positive)
+        assert metrics.snapshot()[name]["passed"] == 1
+
+    def test_keeps_metrics_when_disabled(self, enabled: None) -> None:
+        isinstance(1, Positive)
+        metrics.disable()
+        isinstance(1, Positive)
+        assert metrics.snapshot()[name]["checks"] == 1
+
+    def test_can_reset_metrics(self, enabled: None) -> None:
+        isinstance(1, Positive)
+        metrics.reset()
+        assert name not in metrics.snapshot()
+        isinstance(1, Positive)
+        assert metrics.snapshot()[name]["checks"] == 1
+
+    def test_instruments_types_created_while_enabled(self, enabled: None) -> None:
+        class A(int, Phantom, predicate=positive): ...
+
+        isinstance(1, A)
+        assert metrics.snapshot()[f"{__name__}.{A.__qualname__}"]["checks"] == 1
+
+    def test_formats_metrics_as_prometheus_text(self, enabled: None) -> None:
+        isinstance(1, Positive)
+        isinstance(-1, Positive)
+        lines = metrics.prometheus_text().splitlines()
+        label = f'type="{name}"'
+        assert "# TYPE phantom_checks_total counter" in lines
+        assert f'phantom_checks_total{{{label},outcome="passed"}} 1' in lines
+        assert f'phantom_checks_total{{{label},outcome="failed"}} 1' in lines
+        assert "# TYPE phantom_check_duration_seconds histogram" in lines
+        assert f'phantom_check_duration_seconds_bucket{{{label},le="1e-09"}} 0' in lines
+        assert f'phantom_check_duration_seconds_bucket{{{label},le="+Inf"}} 2' in lines
+        assert f"phantom_check_duration_seconds_count{{{label}}} 2" in lines
+        assert any(
+            line.startswith(f"phantom_check_duration_seconds_sum{{{label}}} ")
+            for line in lines
+        )
+
+    def test_escapes_label_values(self) -> None:
+        assert metrics._escape('a"b\\c\nd') == 'a\\"b\\\\c\\nd'
@@ -0,0 +1,131 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import pytest
+
+from phantom import Phantom
+from phantom._base import AbstractInstanceCheck
+from phantom.errors import ParseFailure
+from phantom.interval import Natural
+from phantom.iso3166 import InvalidCountryCode
+from phantom.iso3166 import ParsedAlpha2
+from phantom.parallel import _max_chunksize
+from phantom.parallel import _next_chunksize
+from phantom.parallel import validate
+from phantom.re import FullMatch
+
+naturals = [1, -1, 2, "3", 4, -5, 6] * 10
+countries = ["se", "SE", "xx", 1, "dk", "Zz"] * 10
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+class TestValidate:
+    @pytest.mark.parametrize(
+        "type_, values",
+        ((Natural, naturals), (ParsedAlpha2, countries)),
+    )
+    @pytest.mark.parametrize("chunksize", (None, 1, 4, 1000))
+    @pytest.mark.parametrize("on_error", ("skip", "collect"))
+    def test_yields_same_values_and_failures_as_iter_parse(
+        self,
+        executor: ProcessPoolExecutor,
+        type_: type[Phantom],
+        values: list[object],
+        chunksize: int | None,
+        on_error: Any,
+    ) -> None:
+        expected_errors: list[ParseFailure] = []
+        expected = list(
+            type_.iter_parse(values, on_error=on_error, errors=expected_errors)
+        )
+        errors: list[ParseFailure] = []
+        parsed = validate(
+            type_,
+            values,
+            chunksize=chunksize,
+            on_error=on_error,
+            errors=errors,
+            executor=executor,
+        )
+        assert list(parsed) == expected
+        assert errors == (expected_errors if on_error == "collect" else [])
+
+    @pytest.mark.parametrize(
+        "type_, values, error, expected",
+        (
+            (Natural, [1, 2, -3, 4], TypeError, [1, 2]),
+            (ParsedAlpha2, ["se", "dk", "xx", "no"], InvalidCountryCode, ["SE", "DK"]),
+        ),
+    )
+    @pytest.mark.parametrize("chunksize", (None, 1, 2, 3))
+    def test_raises_error_of_first_invalid_value_after_yielding_values_before_it(
+        self,
+        executor: ProcessPoolExecutor,
+        type_: type[Phantom],
+        values: list[object],
+        error: type[Exception],
+        expected: list[object],
+        chunksize: int | None,
+    ) -> None:
+        parsed: list[object] = []
+        with pytest.raises(error):
+            parsed.extend(
+                validate(type_, values, chunksize=chunksize, executor=executor)
+            )
+        assert parsed == expected
+
+    def test_validates_in_own_process_pool(self) -> None:
+        errors: deque[ParseFailure] = deque()
+        parsed = validate(
+            Natural, naturals, workers=2, on_error="collect", errors=errors
+        )
+        assert list(parsed) == [1, 2, 3, 4, 6] * 10
+        assert [error.index for error in errors][:3] == [1, 5, 8]
+        assert len(errors) == 20
+
+    def test_leaves_given_executor_running(self, executor: ProcessPoolExecutor) -> None:
+        assert list(validate(Natural, range(10), executor=executor)) == list(range(10))
+        assert executor.submit(abs, -1).result() == 1
+
+    def test_closing_iterator_stops_consuming_values(
+        self, executor: ProcessPoolExecutor
+    ) -> None:
+        values = iter(range(10_000))
+        parsed = validate(Natural, values, chunksize=10, workers=1, executor=executor)
+        assert next(parsed) == 0
+        parsed.close()
+        # Two chunks are submitted ahead for the single worker.
+        assert next(values) == 20
+
+    def test_raises_for_abstract_type(self, executor: ProcessPoolExecutor) -> None:
+        with pytest.raises(AbstractInstanceCheck):
+            list(validate(FullMatch, ["a"], executor=executor))
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        (
+            {"on_error": "ignore"},
+            {"on_error": "collect"},
+            {"chunksize": 0},
+            {"workers": 0},
+        ),
+    )
+    def test_raises_value_error_for_invalid_arguments(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            validate(Natural, [], **kwargs)
+
+
+class TestNextChunksize:
+    def test_sizes_chunks_of_cheap_values_large(self) -> None:
+        assert _next_chunksize(1e-7) == _max_chunksize
+        assert _next_chunksize(0.0) == _max_chunksize
+
+    def test_sizes_chunks_of_expensive_values_small(self) -> None:
+        assert _next_chunksize(1e-4) == 500
+        assert _next_chunksize(1.0) == 1
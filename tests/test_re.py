@@ -4,6 +4,7 @@ import re
 
 import pytest
 
+from phantom._base import AbstractInstanceCheck
 from phantom.re import FullMatch
 from phantom.re import Match
 
@@ -74,3 +75,13 @@ class TestFullMatch:
     def test_instantiation_returns_instance(self, full_match_type: type[FullMatch]):
         s = "abc"
         assert s is full_match_type.parse(s)
+
+    @parametrize_full_match
+    def test_is_valid_many_returns_mask_of_instances(
+        self, full_match_type: type[FullMatch]
+    ):
+        assert full_match_type.is_valid_many(["abc", "abcd", 1]) == bytearray([1, 0, 0])
+
+    def test_is_valid_many_raises_for_abstract_type(self):
+        with pytest.raises(AbstractInstanceCheck):
+            FullMatch.is_valid_many(["abc"])
@@ -165,6 +165,34 @@ class TestPhantomBound:
 
             class A(PhantomBound): ...
 
+    def test_can_use_parametrized_bound(self):
+        class Ints(PhantomBound[int], bound=tuple[int, ...], max=3): ...
+
+        assert isinstance((1, 2), Ints)
+        assert not isinstance((1, "2"), Ints)
+        assert not isinstance((1, 2, 3, 4), Ints)
+        assert not isinstance([1, 2], Ints)
+
+    def test_checks_size_before_items(self):
+        class CountingMeta(type):
+            checked = 0
+
+            def __instancecheck__(cls, instance: object) -> bool:
+                CountingMeta.checked += 1
+                return True
+
+        class Item(metaclass=CountingMeta): ...
+
+        # Exact instances don't trigger __instancecheck__.
+        class SubItem(Item): ...
+
+        class Items(PhantomBound[Item], bound=tuple[Item, ...], max=3): ...
+
+        assert not isinstance(4 * (SubItem(),), Items)
+        assert CountingMeta.checked == 0
+        assert isinstance(3 * (SubItem(),), Items)
+        assert CountingMeta.checked == 3
+
 
 class TestNonEmpty:
     @parametrize_non_empty
@@ -1,8 +1,17 @@
+import gc
+import sys
+import threading
+import weakref
+from collections.abc import Sequence
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
 from typing import Union
 
 import pytest
 
+from phantom._utils.cache import cache_by_type
 from phantom._utils.misc import BoundType
+from phantom._utils.misc import is_not_known_mutable_instance
 from phantom._utils.misc import is_subtype
 
 
@@ -45,6 +54,10 @@ class TestIsSubtype:
             ((AAndB, SubOfA), (A, B)),
             # 9
             (SubOfA, A),
+            # Parametrized generics
+            (tuple[int, ...], Sequence),
+            (tuple[int, ...], tuple[int, ...]),
+            (tuple[int, ...] | frozenset[int], Sequence | AbstractSet),
         ],
     )
     def test_returns_true_for_valid_subtype(self, a: BoundType, b: BoundType) -> None:
@@ -75,7 +88,98 @@ class TestIsSubtype:
             # 9
             (SubOfA, B),
             (A, B),
+            # Parametrized generics
+            (tuple[int, ...], AbstractSet),
+            (tuple, tuple[int, ...]),
+            (tuple[str, ...], tuple[int, ...]),
         ],
     )
     def test_returns_false_for_valid_subtype(self, a: BoundType, b: BoundType) -> None:
         assert is_subtype(a, b) is False
+
+
+class TestCacheByType:
+    def test_evaluates_check_once_per_type(self) -> None:
+        calls = []
+
+        def check(value: object) -> bool:
+            calls.append(value)
+            return isinstance(value, int)
+
+        cached = cache_by_type(check)
+        assert cached(1) is True
+        assert cached(2) is True
+        assert cached("a") is False
+        assert cached("b") is False
+        assert calls == [1, "a"]
+
+    def test_evicts_oldest_verdict_when_full(self) -> None:
+        calls = []
+
+        def check(value: object) -> bool:
+            calls.append(value)
+            return True
+
+        cached = cache_by_type(check, maxsize=2)
+        cached(1)
+        cached("a")
+        cached(1.0)
+        cached(1)
+        assert calls == [1, "a", 1.0, 1]
+
+    def test_does_not_keep_types_alive(self) -> None:
+        cached = cache_by_type(lambda value: True)
+
+        class A: ...
+
+        cached(A())
+        ref = weakref.ref(A)
+        del A
+        gc.collect()
+        assert ref() is None
+
+    def test_is_safe_to_evict_from_multiple_threads(self) -> None:
+        # Switching threads as often as possible makes threads interleave between
+        # reading the oldest entry and evicting it.
+        interval = sys.getswitchinterval()
+        types = [type(f"T{index}", (), {}) for index in range(64)]
+        values = [type_() for type_ in types]
+        cached = cache_by_type(lambda value: type(value).__name__[-1] == "0", 4)
+        errors: list[Exception] = []
+
+        def run() -> None:
+            try:
+                for _ in range(50):
+                    for value in values:
+                        assert cached(value) is (type(value).__name__[-1] == "0")
+            except Exception as error:  # noqa: BLE001
+                errors.append(error)
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        assert errors == []
+
+
+@dataclass
+class MutableDataclass: ...
+
+
+@dataclass(frozen=True)
+class FrozenDataclass: ...
+
+
+class TestIsNotKnownMutableInstance:
+    @pytest.mark.parametrize("value", [(), "", frozenset(), FrozenDataclass(), 1])
+    def test_returns_true_for_not_known_mutable_value(self, value: object) -> None:
+        assert is_not_known_mutable_instance(value) is True
+
+    @pytest.mark.parametrize("value", [[], set(), {}, MutableDataclass()])
+    def test_returns_false_for_mutable_value(self, value: object) -> None:
+        assert is_not_known_mutable_instance(value) is False
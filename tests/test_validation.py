@@ -0,0 +1,347 @@
+import threading
+import time
+import warnings
+from collections.abc import Iterator
+
+import pytest
+
+from phantom import Phantom
+from phantom import validation as validation_module
+from phantom.errors import AssumptionError
+from phantom.interval import Natural
+from phantom.iso3166 import ParsedAlpha2
+from phantom.predicates import boolean
+from phantom.predicates.numeric import positive
+from phantom.re import FullMatch
+from phantom.validation import Mode
+from phantom.validation import ValidationSetting
+from phantom.validation import default_sample_rate
+from phantom.validation import get_validation_setting
+from phantom.validation import set_assumption_verification
+from phantom.validation import set_validation_mode
+from phantom.validation import validation
+from phantom.validation import wait_for_verification
+
+
+class Ints(Phantom, bound=tuple[int, ...], predicate=boolean.true): ...
+
+
+class Strict(int, Phantom, predicate=positive, validation="strict"): ...
+
+
+class Trusted(int, Phantom, predicate=positive, validation="trusted"): ...
+
+
+class InheritsTrusted(Trusted): ...
+
+
+class Digits(FullMatch, pattern=r"\d+"): ...
+
+
+parametrize_modes = pytest.mark.parametrize(
+    "mode, sample_rate",
+    (("strict", 0.01), ("sampled", 0.0), ("sampled", 1.0), ("trusted", 0.01)),
+)
+
+
+@pytest.fixture
+def restore_default() -> Iterator[None]:
+    previous = get_validation_setting()
+    try:
+        yield
+    finally:
+        set_validation_mode(previous.mode, sample_rate=previous.sample_rate)
+
+
+class TestValidation:
+    def test_defaults_to_strict(self) -> None:
+        assert get_validation_setting() == ValidationSetting(
+            "strict", default_sample_rate
+        )
+        assert not isinstance(-1, Natural)
+
+    def test_trusted_mode_only_checks_runtime_type_of_bound(self) -> None:
+        with validation("trusted") as setting:
+            assert setting == get_validation_setting() == ("trusted", 0.01)
+            assert isinstance(-1, Natural)
+            assert not isinstance("a", Natural)
+            assert isinstance(("a",), Ints)
+            assert not isinstance(["a"], Ints)
+            assert Natural.parse(-1) == -1
+        assert not isinstance(-1, Natural)
+        assert not isinstance(("a",), Ints)
+
+    def test_applies_to_parsing(self) -> None:
+        with validation("trusted"):
+            assert Natural.try_parse(-1) == -1
+            assert Natural.is_valid_many([-1, "a"]) == bytearray([1, 0])
+            assert list(Natural.iter_parse([-1, 2])) == [-1, 2]
+        assert Natural.try_parse(-1) is None
+
+    @parametrize_modes
+    @pytest.mark.parametrize(
+        "type_, values",
+        (
+            (Natural, [1, -1, "a"]),
+            (Digits, ["1", "a", 1]),
+            (ParsedAlpha2, ["SE", "XX", 1]),
+        ),
+    )
+    def test_batch_methods_agree_with_instance_checks(
+        self,
+        mode: Mode,
+        sample_rate: float,
+        type_: type[Phantom],
+        values: list[object],
+    ) -> None:
+        with validation(mode, sample_rate=sample_rate):
+            expected = [isinstance(value, type_) for value in values]
+            assert type_.is_valid_many(values) == bytearray(expected)
+
+    @parametrize_modes
+    @pytest.mark.parametrize(
+        "type_, values",
+        ((Natural, [1, -1, "a"]), (Digits, ["1", "a", 1])),
+    )
+    def test_iter_parse_skips_values_rejected_by_instance_checks(
+        self,
+        mode: Mode,
+        sample_rate: float,
+        type_: type[Phantom],
+        values: list[object],
+    ) -> None:
+        with validation(mode, sample_rate=sample_rate):
+            expected = [value for value in values if isinstance(value, type_)]
+            assert list(type_.iter_parse(values, on_error="skip")) == expected
+
+    @pytest.mark.parametrize(
+        "sample_rate, expected",
+        ((0.0, True), (1.0, False)),
+    )
+    def test_sampled_mode_fully_checks_fraction_of_checks(
+        self, sample_rate: float, expected: bool
+    ) -> None:
+        with validation("sampled", sample_rate=sample_rate):
+            assert all(isinstance(-1, Natural) is expected for _ in range(100))
+            assert not isinstance("a", Natural)
+
+    def test_sampled_mode_fully_checks_some_checks(self) -> None:
+        with validation("sampled", sample_rate=0.5):
+            verdicts = {isinstance(-1, Natural) for _ in range(200)}
+        assert verdicts == {True, False}
+
+    def test_nested_context_takes_precedence(self) -> None:
+        with validation("trusted"):
+            with validation("strict"):
+                assert not isinstance(-1, Natural)
+            assert isinstance(-1, Natural)
+
+    def test_type_can_fix_mode(self) -> None:
+        with validation("trusted"):
+            assert not isinstance(-1, Strict)
+        assert isinstance(-1, Trusted)
+        assert isinstance(-1, InheritsTrusted)
+        assert not isinstance("a", Trusted)
+
+    def test_can_set_mode_of_process(self, restore_default: None) -> None:
+        set_validation_mode("trusted")
+        verdicts: list[bool] = []
+        thread = threading.Thread(
+            target=lambda: verdicts.append(isinstance(-1, Natural))
+        )
+        thread.start()
+        thread.join()
+        assert verdicts == [True]
+        with validation("strict"):
+            assert not isinstance(-1, Natural)
+
+    def test_context_does_not_apply_to_other_threads(self) -> None:
+        verdicts: list[bool] = []
+        with validation("trusted"):
+            thread = threading.Thread(
+                target=lambda: verdicts.append(isinstance(-1, Natural))
+            )
+            thread.start()
+            thread.join()
+        assert verdicts == [False]
+
+    def test_types_check_mode_once_engaged(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(validation_module, "_engaged", False)
+
+        class A(int, Phantom, predicate=positive): ...
+
+        assert A.__validation_predicate__ is A.__instance_predicate__
+        with validation("trusted"):
+            assert A.__validation_predicate__ is not A.__instance_predicate__
+            assert isinstance(-1, A)
+
+    @pytest.mark.parametrize(
+        "mode, sample_rate",
+        (("lenient", 0.1), ("sampled", -0.1), ("sampled", 1.1)),
+    )
+    def test_raises_value_error_for_invalid_setting(
+        self, mode: str, sample_rate: float
+    ) -> None:
+        with pytest.raises(ValueError):
+            set_validation_mode(mode, sample_rate=sample_rate)  # type: ignore[arg-type]
+        with pytest.raises(ValueError), validation(mode, sample_rate=sample_rate):  # type: ignore[arg-type]
+            pass
+
+    def test_raises_value_error_for_invalid_mode_of_type(self) -> None:
+        with pytest.raises(ValueError, match=r"^Invalid validation mode: 'trustd'$"):
+
+            class A(int, Phantom, predicate=positive, validation="trustd"): ...
+
+
+@pytest.fixture
+def skip_verification() -> Iterator[None]:
+    try:
+        yield
+    finally:
+        set_assumption_verification("skip")
+
+
+class TestAssume:
+    def test_returns_value_without_checking_it(self) -> None:
+        assert Natural.assume(-1) == -1
+        assert ParsedAlpha2.assume("se") == "se"
+
+    def test_can_verify_eagerly(self, skip_verification: None) -> None:
+        set_assumption_verification("eager")
+        assert Natural.assume(1) == 1
+        with pytest.raises(
+            AssumptionError,
+            match=r"^Assumed value is not an instance of phantom.interval.Natural: -1$",
+        ):
+            Natural.assume(-1)
+
+    def test_verifies_fully_regardless_of_mode(self, skip_verification: None) -> None:
+        set_assumption_verification("eager")
+        with validation("trusted"), pytest.raises(AssumptionError):
+            Trusted.assume(-1)
+
+    def test_can_defer_verification(self, skip_verification: None) -> None:
+        violations: list[AssumptionError] = []
+        set_assumption_verification("deferred", on_violation=violations.append)
+        assert Natural.assume(-1) == -1
+        assert Natural.assume(1) == 1
+        assert ParsedAlpha2.assume("xx") == "xx"
+        wait_for_verification()
+        assert [str(violation) for violation in violations] == [
+            "Assumed value is not an instance of phantom.interval.Natural: -1",
+            "Assumed value is not an instance of phantom.iso3166.ParsedAlpha2: 'xx'",
+        ]
+
+    def test_deferred_verification_warns_by_default(
+        self, skip_verification: None
+    ) -> None:
+        set_assumption_verification("deferred")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            Natural.assume(-1)
+            wait_for_verification()
+        assert [warning.category for warning in caught] == [RuntimeWarning]
+
+    def test_deferred_verification_drops_values_when_queue_is_full(
+        self, skip_verification: None
+    ) -> None:
+        verifying = threading.Event()
+        release = threading.Event()
+        violations: list[AssumptionError] = []
+
+        def on_violation(violation: AssumptionError) -> None:
+            verifying.set()
+            release.wait()
+            violations.append(violation)
+
+        set_assumption_verification(
+            "deferred", max_pending=2, on_violation=on_violation
+        )
+        Natural.assume(-1)
+        verifying.wait()
+        for value in range(-2, -6, -1):
+            Natural.assume(value)
+        release.set()
+        wait_for_verification()
+        assert len(violations) == 3
+
+    def test_replacing_deferred_verification_does_not_block_on_full_queue(
+        self, skip_verification: None
+    ) -> None:
+        verifying = threading.Event()
+        release = threading.Event()
+        violations: list[AssumptionError] = []
+
+        def on_violation(violation: AssumptionError) -> None:
+            verifying.set()
+            release.wait()
+            violations.append(violation)
+
+        set_assumption_verification(
+            "deferred", max_pending=1, on_violation=on_violation
+        )
+        previous = validation_module._verify_assumption
+        assert isinstance(previous, validation_module._DeferredVerifier)
+        Natural.assume(-1)
+        verifying.wait()
+        Natural.assume(-2)
+        assert previous.queue.full()
+        replacing = threading.Thread(
+            target=set_assumption_verification, args=("skip",), daemon=True
+        )
+        replacing.start()
+        replacing.join(timeout=5)
+        assert not replacing.is_alive()
+        release.set()
+        previous.thread.join(timeout=5)
+        assert not previous.thread.is_alive()
+        # The pending value is dropped instead of verified.
+        assert len(violations) == 1
+
+    def test_deferred_verification_is_rate_limited(
+        self, skip_verification: None
+    ) -> None:
+        set_assumption_verification("deferred", max_rate=100)
+        start = time.monotonic()
+        for value in range(5):
+            Natural.assume(value)
+        wait_for_verification()
+        assert time.monotonic() - start >= 0.03
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        (
+            {"verification": "lazy"},
+            {"verification": "deferred", "max_rate": 0},
+            {"verification": "deferred", "max_pending": 0},
+        ),
+    )
+    def test_raises_value_error_for_invalid_arguments(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            set_assumption_verification(**kwargs)
+
+
+class TestReadEnvironment:
+    def test_reads_mode_and_sample_rate(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PHANTOM_VALIDATION", "Sampled")
+        monkeypatch.setenv("PHANTOM_VALIDATION_SAMPLE_RATE", "0.25")
+        assert validation_module._read_environment() == ("sampled", 0.25)
+
+    def test_defaults_to_strict(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("PHANTOM_VALIDATION", raising=False)
+        monkeypatch.delenv("PHANTOM_VALIDATION_SAMPLE_RATE", raising=False)
+        assert validation_module._read_environment() == ("strict", default_sample_rate)
+
+    @pytest.mark.parametrize(
+        "mode, sample_rate",
+        (("lenient", ""), ("sampled", "often")),
+    )
+    def test_raises_value_error_for_invalid_setting(
+        self, monkeypatch: pytest.MonkeyPatch, mode: str, sample_rate: str
+    ) -> None:
+        monkeypatch.setenv("PHANTOM_VALIDATION", mode)
+        monkeypatch.setenv("PHANTOM_VALIDATION_SAMPLE_RATE", sample_rate)
+        with pytest.raises(ValueError):
+            validation_module._read_environment()